@@ -0,0 +1,113 @@
+"""Compares the consumer hot path under the asyncio and uvloop event loops.
+
+The benchmark reproduces how the StreamingPull client hands messages to the
+handlers: a client thread schedules the messages on the event loop through
+the AsyncScheduler, each handler performs a network round trip and the
+acknowledgement future is completed by another thread and awaited on the loop.
+
+Usage:
+    python benchmarks/event_loops.py --messages 20000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from fastpubsub.clients.scheduler import AsyncScheduler
+from fastpubsub.concurrency.loops import run_with_event_loop
+from fastpubsub.types import EventLoopType
+
+
+async def _echo(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    while data := await reader.readline():
+        writer.write(data)
+        await writer.drain()
+
+    writer.close()
+
+
+async def _consume(messages: int, concurrency: int) -> float:
+    server = await asyncio.start_server(_echo, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    connections: asyncio.Queue[tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+    connections = asyncio.Queue()
+    for _ in range(concurrency):
+        connections.put_nowait(await asyncio.open_connection("127.0.0.1", port))
+
+    loop = asyncio.get_running_loop()
+    acknowledger = ThreadPoolExecutor(max_workers=4)
+    scheduler = AsyncScheduler()
+    semaphore = asyncio.Semaphore(concurrency)
+    finished = asyncio.Event()
+    handlers: set[asyncio.Task[None]] = set()
+    processed = 0
+
+    async def _handle(message: bytes) -> None:
+        nonlocal processed
+        async with semaphore:
+            reader, writer = await connections.get()
+            writer.write(message)
+            await writer.drain()
+            await reader.readline()
+            connections.put_nowait((reader, writer))
+
+            acknowledge: Future[Any] = acknowledger.submit(lambda: "SUCCESS")
+            await asyncio.wrap_future(acknowledge)
+
+        processed += 1
+        if processed == messages:
+            finished.set()
+
+    def _on_message(message: bytes) -> None:
+        handler = loop.create_task(_handle(message))
+        handlers.add(handler)
+        handler.add_done_callback(handlers.discard)
+
+    def _stream() -> None:
+        for index in range(messages):
+            scheduler.schedule(_on_message, f"message-{index}\n".encode())
+
+    started_at = time.perf_counter()
+    threading.Thread(target=_stream).start()
+    await finished.wait()
+    elapsed = time.perf_counter() - started_at
+
+    while not connections.empty():
+        _, writer = connections.get_nowait()
+        writer.close()
+        await writer.wait_closed()
+
+    server.close()
+    await server.wait_closed()
+    acknowledger.shutdown()
+    return elapsed
+
+
+def main() -> None:
+    """Runs the benchmark on each event loop and prints the throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    loops: list[EventLoopType] = ["asyncio", "uvloop"]
+    results: dict[str, float] = {}
+    for loop in loops:
+        elapsed = min(
+            run_with_event_loop(_consume(args.messages, args.concurrency), loop=loop)
+            for _ in range(args.rounds)
+        )
+        results[loop] = args.messages / elapsed
+        print(f"{loop:>8}: {results[loop]:>10.0f} messages/s ({elapsed:.3f}s)")
+
+    speedup = results["uvloop"] / results["asyncio"] - 1
+    print(f"uvloop speedup: {speedup:+.1%}")
+
+
+if __name__ == "__main__":
+    main()
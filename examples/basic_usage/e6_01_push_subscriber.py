@@ -0,0 +1,17 @@
+from fastpubsub import FastPubSub, Message, PubSubBroker
+from fastpubsub.logger import logger
+
+broker = PubSubBroker(project_id="fastpubsub-pubsub-local")
+app = FastPubSub(broker)
+
+
+# Configure the push subscription to deliver to https://<your-service>/push/orders
+@broker.subscriber(
+    "push-alias",
+    topic_name="orders-topic",
+    subscription_name="orders-push-subscription",
+    push_path="/push/orders",
+    max_messages=50,
+)
+async def process_message(message: Message) -> None:
+    logger.info(f"Processed pushed message: {message}")
@@ -1,11 +1,15 @@
 """A high performance FastAPI-based message consumer framework for Google PubSub."""
 
-from fastpubsub.applications import FastPubSub
-from fastpubsub.broker import PubSubBroker
-from fastpubsub.datastructures import Message, PushMessage
-from fastpubsub.middlewares import BaseMiddleware
-from fastpubsub.pubsub import Publisher, Subscriber
-from fastpubsub.router import PubSubRouter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fastpubsub.applications import FastPubSub
+    from fastpubsub.broker import PubSubBroker
+    from fastpubsub.datastructures import Message, PushMessage
+    from fastpubsub.middlewares import BaseMiddleware
+    from fastpubsub.pubsub import Publisher, Subscriber
+    from fastpubsub.router import PubSubRouter
 
 __all__ = [
     "FastPubSub",
@@ -17,3 +21,30 @@ __all__ = [
     "Message",
     "PushMessage",
 ]
+
+# The public names are imported on first access (PEP 562), so scripts that
+# only publish never import the FastAPI application layer.
+_LAZY_IMPORTS: dict[str, str] = {
+    "FastPubSub": "fastpubsub.applications",
+    "PubSubBroker": "fastpubsub.broker",
+    "PubSubRouter": "fastpubsub.router",
+    "Publisher": "fastpubsub.pubsub",
+    "Subscriber": "fastpubsub.pubsub",
+    "BaseMiddleware": "fastpubsub.middlewares",
+    "Message": "fastpubsub.datastructures",
+    "PushMessage": "fastpubsub.datastructures",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if not module_path:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -11,10 +11,13 @@ from starlette.applications import Starlette
 from starlette.status import HTTP_200_OK, HTTP_500_INTERNAL_SERVER_ERROR
 
 from fastpubsub.broker import PubSubBroker
+from fastpubsub.concurrency.loops import resolve_event_loop, run_with_event_loop
 from fastpubsub.concurrency.utils import ensure_async_callable_function
+from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.logger import logger
 from fastpubsub.observability import get_apm_provider
-from fastpubsub.types import NoArgAsyncCallable
+from fastpubsub.push import PushEndpoint
+from fastpubsub.types import EventLoopType, NoArgAsyncCallable
 
 
 class Application:
@@ -116,6 +119,22 @@ class Application:
         self._after_shutdown.append(func)
         return func
 
+    @validate_call(config=ConfigDict(strict=True))
+    def run(self, host: str = "0.0.0.0", port: int = 8000, loop: EventLoopType = "auto") -> None:
+        """Runs the application without an HTTP server until SIGINT or SIGTERM.
+
+        The health probes are served by a minimal responder on the host and port.
+
+        Args:
+            host: The host of the health probes.
+            port: The port of the health probes.
+            loop: The event loop implementation. The 'auto' option uses
+                uvloop when it is installed.
+        """
+        from fastpubsub.health import serve_without_http
+
+        run_with_event_loop(serve_without_http(self, host, port), loop=loop)
+
     # V1: Create a contextualizer
     async def _start(self) -> None:
         self.apm.start()
@@ -147,7 +166,7 @@ class Application:
             }
             with logger.contextualize(**context):
                 async with self._shutdown_hooks():
-                    self.broker.shutdown()
+                    await self.broker.shutdown()
 
         self.apm.shutdown()
 
@@ -203,21 +222,58 @@ class FastPubSub(FastAPI, Application):
             after_shutdown=after_shutdown,
         )
 
+        self.liveness_url = liveness_url
+        self.readiness_url = readiness_url
+        self._push_paths: set[str] = set()
         self.add_api_route(path=liveness_url, endpoint=self._get_liveness, methods=["GET"])
         self.add_api_route(path=readiness_url, endpoint=self._get_readiness, methods=["GET"])
 
+    @validate_call(config=ConfigDict(strict=True))
+    def run(self, host: str = "0.0.0.0", port: int = 8000, loop: EventLoopType = "auto") -> None:
+        """Runs the application and its HTTP server on uvicorn until SIGINT or SIGTERM.
+
+        Args:
+            host: The host to bind to.
+            port: The port to bind to.
+            loop: The event loop implementation. The 'auto' option uses
+                uvloop when it is installed.
+        """
+        import uvicorn
+
+        uvicorn.run(self, host=host, port=port, loop=resolve_event_loop(loop), lifespan="on")
+
     @asynccontextmanager
     async def _run(self, app: "FastPubSub") -> AsyncGenerator[None]:
         if not self.lifespan_context:
             await self._start()
+            self._mount_push_endpoints()
             yield
             await self._shutdown()
         else:
             async with self.lifespan_context(app):
                 await self._start()
+                self._mount_push_endpoints()
                 yield
                 await self._shutdown()
 
+    def _mount_push_endpoints(self) -> None:
+        # The routes are mounted once the broker knows the selected subscribers,
+        # as the subscribers are usually registered after the app is created.
+        for subscriber in self.broker._push_subscribers:
+            path = subscriber.push_path
+            if not path or path in self._push_paths:
+                continue
+
+            if any(getattr(route, "path", None) == path for route in self.router.routes):
+                raise FastPubSubException(
+                    f"The push path '{path}' of the {subscriber.name} subscriber is already used."
+                )
+
+            endpoint = PushEndpoint(subscriber)
+            self.add_route(path, endpoint.handle, methods=["POST"], include_in_schema=False)
+            self._push_paths.add(path)
+            logger.info(f"The {subscriber.name} handler is waiting for messages on {path}.")
+
     async def _get_liveness(self, _: Request) -> JSONResponse:
         alive = self.broker.alive()
 
@@ -1,5 +1,6 @@
 """Broker implementation."""
 
+import asyncio
 import os
 from collections.abc import Sequence
 from typing import Any
@@ -7,14 +8,29 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, validate_call
 
 from fastpubsub.builder import PubSubSubscriptionBuilder
-from fastpubsub.concurrency.manager import AsyncTaskManager
+from fastpubsub.concurrency.drain import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PULL_CONCURRENCY,
+    DrainResult,
+    SubscriptionDrainer,
+)
+from fastpubsub.concurrency.manager import DEFAULT_DRAIN_TIMEOUT, AsyncTaskManager
+from fastpubsub.concurrency.ratelimit import TokenBucketRateLimiter
+from fastpubsub.datastructures import PublishRetryPolicy
 from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.logger import logger
 from fastpubsub.middlewares.base import BaseMiddleware
+from fastpubsub.provisioning import DEFAULT_PROVISIONING_CONCURRENCY, ProvisioningCache
 from fastpubsub.pubsub.publisher import Publisher
 from fastpubsub.pubsub.subscriber import Subscriber
 from fastpubsub.router import PubSubRouter
-from fastpubsub.types import SubscribedCallable
+from fastpubsub.types import (
+    BackpressureSignal,
+    HandlerTimeoutBehavior,
+    PauseBehavior,
+    RateLimitBehavior,
+    SubscribedCallable,
+)
 
 
 class PubSubBroker:
@@ -25,6 +41,10 @@ class PubSubBroker:
         project_id: str,
         routers: Sequence[PubSubRouter] | None = None,
         middlewares: Sequence[type[BaseMiddleware]] | None = None,
+        max_publish_rate: float | None = None,
+        max_provisioning_concurrency: int = DEFAULT_PROVISIONING_CONCURRENCY,
+        event_loops: int | None = None,
+        drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
     ):
         """Initializes the PubSubBroker.
 
@@ -33,6 +53,18 @@ class PubSubBroker:
             routers: A sequence of routers to include.
             middlewares: A sequence of middlewares to apply to all messages
                 incoming to subscribers and publishers.
+            max_publish_rate: The maximum number of messages per second
+                published by the broker across all topics. If not set,
+                the broker is not rate limited.
+            max_provisioning_concurrency: The maximum number of subscribers
+                whose topics and subscriptions are provisioned at once on startup.
+            event_loops: The number of event loop threads the subscribers are
+                sharded across. If not set, it is read from the
+                FASTPUBSUB_EVENT_LOOPS environment variable. If 0, the
+                subscribers run on the application event loop.
+            drain_timeout: The seconds to wait on shutdown for the messages
+                in flight. The messages still running after it are nacked,
+                so they are redelivered right away.
         """
         if not (project_id and isinstance(project_id, str) and len(project_id.strip()) > 0):
             raise FastPubSubException(f"The project id value ({project_id}) is invalid.")
@@ -40,9 +72,17 @@ class PubSubBroker:
         self.project_id = project_id
         self.router = PubSubRouter(routers=routers, middlewares=middlewares)
         self.router._set_project_id(self.project_id)
-        self.task_manager = AsyncTaskManager()
+        if max_publish_rate:
+            rate_limiter = TokenBucketRateLimiter(name="broker", max_rate=max_publish_rate)
+            self.router._set_broker_rate_limiter(rate_limiter)
 
-    @validate_call(config=ConfigDict(strict=True))
+        self.max_provisioning_concurrency = max_provisioning_concurrency
+        if event_loops is None:
+            event_loops = int(os.getenv("FASTPUBSUB_EVENT_LOOPS", "0"))
+        self.task_manager = AsyncTaskManager(event_loops=event_loops, drain_timeout=drain_timeout)
+        self._push_subscribers: list[Subscriber] = []
+
+    @validate_call(config=ConfigDict(strict=True, arbitrary_types_allowed=True))
     def subscriber(
         self,
         alias: str,
@@ -61,6 +101,11 @@ class PubSubBroker:
         max_backoff_delay_secs: int = 600,
         max_messages: int = 1000,
         middlewares: Sequence[type[BaseMiddleware]] | None = None,
+        shards: int = 1,
+        handler_timeout: float | None = None,
+        on_handler_timeout: HandlerTimeoutBehavior = "retry",
+        push_path: str | None = None,
+        backpressure: BackpressureSignal | None = None,
     ) -> SubscribedCallable:
         """Decorator to register a function as a subscriber.
 
@@ -84,6 +129,22 @@ class PubSubBroker:
             max_backoff_delay_secs: The maximum backoff delay in seconds.
             max_messages: The maximum number of messages to fetch from the broker.
             middlewares: A sequence of middlewares to apply **only to the subscriber**.
+            shards: The number of topic shards to consume. If set above one, the
+                subscriptions <subscription_name>-0 to <subscription_name>-<shards - 1>
+                are attached to the topics <topic_name>-0 to <topic_name>-<shards - 1>
+                and consumed by the same handler, sharing the max_messages budget.
+            handler_timeout: The maximum seconds a message is handled. The handler
+                is cancelled after it, so a hung call does not hold its flow control
+                slot and lease. If not set, the handler is never timed out.
+            on_handler_timeout: What happens with a message whose handler timed out:
+                'retry' nacks it to be redelivered and 'drop' acknowledges it.
+            push_path: The HTTP path of the FastPubSub app where a push subscription
+                delivers the messages, for example '/push/orders'. If set, the messages
+                are not pulled and at most max_messages are handled at once.
+            backpressure: A signal consulted before dispatching each message, either a
+                callable returning True or an asyncio.Event that is set while the
+                downstream is overloaded. The pulled messages wait, keeping their leases,
+                and the pushed messages are rejected until the signal is lowered.
 
         Returns:
             A decorator that registers the function as a subscriber.
@@ -104,19 +165,51 @@ class PubSubBroker:
             max_backoff_delay_secs=max_backoff_delay_secs,
             max_messages=max_messages,
             middlewares=middlewares,
+            shards=shards,
+            handler_timeout=handler_timeout,
+            on_handler_timeout=on_handler_timeout,
+            push_path=push_path,
+            backpressure=backpressure,
         )
 
     @validate_call(config=ConfigDict(strict=True))
-    def publisher(self, topic_name: str) -> Publisher:
+    def publisher(
+        self,
+        topic_name: str,
+        *,
+        max_rate: float | None = None,
+        burst: int | None = None,
+        on_rate_limit: RateLimitBehavior = "wait",
+        retry_policy: PublishRetryPolicy | None = None,
+        shards: int | None = None,
+    ) -> Publisher:
         """Returns a publisher for the given topic.
 
         Args:
             topic_name: The name of the topic.
+            max_rate: The maximum number of messages per second published
+                on the topic. If not set, the topic is not rate limited.
+            burst: The maximum number of messages published at once
+                when the topic is rate limited.
+            on_rate_limit: Whether to 'wait' or 'raise' a RateLimitExceeded
+                exception when the rate limit is hit.
+            retry_policy: The policy used to retry the publishing on retryable
+                errors. If not set, the publishing is not retried.
+            shards: The number of topics the messages are partitioned into.
+                If set above one, the messages are published on the topics
+                <topic_name>-0 to <topic_name>-<shards - 1> by partition key.
 
         Returns:
             A publisher for the given topic.
         """
-        return self.router.publisher(topic_name=topic_name)
+        return self.router.publisher(
+            topic_name=topic_name,
+            max_rate=max_rate,
+            burst=burst,
+            on_rate_limit=on_rate_limit,
+            retry_policy=retry_policy,
+            shards=shards,
+        )
 
     @validate_call(config=ConfigDict(strict=True))
     async def publish(
@@ -126,7 +219,8 @@ class PubSubBroker:
         ordering_key: str = "",
         attributes: dict[str, str] | None = None,
         autocreate: bool = True,
-    ) -> None:
+        partition_key: str = "",
+    ) -> Any:
         """Publishes a message to the given topic.
 
         Args:
@@ -135,6 +229,10 @@ class PubSubBroker:
             ordering_key: The ordering key for the message.
             attributes: A dictionary of message attributes.
             autocreate: Whether to automatically create the topic if it does not exists.
+            partition_key: The key used to select the shard of a sharded topic.
+
+        Returns:
+            The id of the published message.
         """
         return await self.router.publish(
             topic_name=topic_name,
@@ -142,6 +240,39 @@ class PubSubBroker:
             ordering_key=ordering_key,
             attributes=attributes,
             autocreate=autocreate,
+            partition_key=partition_key,
+        )
+
+    @validate_call(config=ConfigDict(strict=True))
+    async def publish_to(
+        self,
+        topics: list[str],
+        data: dict[str, Any] | str | bytes | BaseModel,
+        ordering_key: str = "",
+        attributes: dict[str, str] | None = None,
+        autocreate: bool = True,
+        partition_key: str = "",
+    ) -> dict[str, Any]:
+        """Publishes the same message to several topics concurrently.
+
+        Args:
+            topics: The names of the topics.
+            data: The message data.
+            ordering_key: The ordering key for the message.
+            attributes: A dictionary of message attributes.
+            autocreate: Whether to automatically create the topics if they do not exists.
+            partition_key: The key used to select the shard of sharded topics.
+
+        Returns:
+            The id of the published message or the raised exception by topic.
+        """
+        return await self.router.publish_to(
+            topics=topics,
+            data=data,
+            ordering_key=ordering_key,
+            attributes=attributes,
+            autocreate=autocreate,
+            partition_key=partition_key,
         )
 
     def include_router(self, router: PubSubRouter) -> None:
@@ -170,10 +301,20 @@ class PubSubBroker:
                 "You must select the subscribers using --subscribers flag or run them all."
             )
 
-        subscription_builder = PubSubSubscriptionBuilder(project_id=self.project_id)
+        subscription_builder = PubSubSubscriptionBuilder(
+            project_id=self.project_id,
+            cache=ProvisioningCache.from_environment(),
+            force=os.getenv("FASTPUBSUB_FORCE_PROVISION", "0") == "1",
+        )
+        await subscription_builder.build_all(
+            subscribers, max_concurrency=self.max_provisioning_concurrency
+        )
+
+        # The pushed messages are delivered to the HTTP endpoints of the app
+        self._push_subscribers = [subscriber for subscriber in subscribers if subscriber.push_path]
         for subscriber in subscribers:
-            await subscription_builder.build(subscriber)
-            self.task_manager.create_task(subscriber)
+            if not subscriber.push_path:
+                self.task_manager.create_task(subscriber)
 
         self.task_manager.start()
 
@@ -184,6 +325,9 @@ class PubSubBroker:
             True if they are alive, False otherwise.
         """
         subscribers = self.task_manager.alive()
+        if not subscribers and self._push_subscribers:
+            return True
+
         if not subscribers:
             logger.info("The subscribers are not active. May be they are deactivated?")
             return False
@@ -202,6 +346,9 @@ class PubSubBroker:
             True if they are ready, False otherwise.
         """
         subscribers = self.task_manager.ready()
+        if not subscribers and self._push_subscribers:
+            return True
+
         if not subscribers:
             logger.info("The subscribers are not active. May be they are deactivated?")
             return False
@@ -214,12 +361,16 @@ class PubSubBroker:
         return True
 
     def _filter_subscribers(self) -> list[Subscriber]:
+        subscribers = self.router._get_subscribers()
+        return [subscribers[alias] for alias in self._filter_subscriber_aliases()]
+
+    def _filter_subscriber_aliases(self) -> list[str]:
         subscribers = self.router._get_subscribers()
         selected_subscribers = self._get_selected_subscribers()
 
         if not selected_subscribers:
             logger.debug(f"Running all the subscribers as {list(subscribers.keys())}")
-            return list(subscribers.values())
+            return list(subscribers.keys())
 
         found_subscribers = []
         for selected_subscriber in selected_subscribers:
@@ -228,7 +379,7 @@ class PubSubBroker:
                 continue
 
             logger.debug(f"We have found the subscriber '{selected_subscriber}'")
-            found_subscribers.append(subscribers[selected_subscriber])
+            found_subscribers.append(selected_subscriber)
 
         return found_subscribers
 
@@ -246,6 +397,78 @@ class PubSubBroker:
 
         return selected_subscribers
 
-    def shutdown(self) -> None:
-        """Shuts down the broker."""
-        self.task_manager.shutdown()
+    async def shutdown(self) -> None:
+        """Shuts down the broker after draining the messages in flight."""
+        await self.task_manager.shutdown()
+
+    async def pause(self, alias: str, behavior: PauseBehavior = "hold") -> None:
+        """Stops consuming the messages of a subscriber without shutting it down.
+
+        The messages already being handled are not affected. Resuming it
+        does not reprovision the subscriptions nor restart the process.
+
+        Args:
+            alias: The alias of the subscriber.
+            behavior: What happens with the messages received while paused:
+                'hold' keeps their leases until the subscriber is resumed, so
+                at most max_messages are held, and 'nack' closes the streams
+                and redelivers them.
+        """
+        await self.task_manager.pause(self._get_subscriber(alias).name, behavior)
+
+    async def resume(self, alias: str) -> None:
+        """Resumes consuming the messages of a paused subscriber.
+
+        Args:
+            alias: The alias of the subscriber.
+        """
+        await self.task_manager.resume(self._get_subscriber(alias).name)
+
+    def _get_subscriber(self, alias: str) -> Subscriber:
+        subscribers = self.router._get_subscribers()
+        subscriber = subscribers.get(alias.lower())
+        if not subscriber:
+            raise FastPubSubException(f"The '{alias}' subscriber alias not found.")
+        return subscriber
+
+    async def drain(
+        self,
+        max_messages: int = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_PULL_CONCURRENCY,
+    ) -> list[DrainResult]:
+        """Consumes the backlog of the subscribers with batched pulls until it is empty.
+
+        It is meant for batch jobs: the subscriptions are not provisioned
+        and no stream is kept open, so it returns once every subscriber is
+        drained instead of waiting for new messages. The push subscribers
+        are not drained.
+
+        Args:
+            max_messages: The maximum number of messages received by each
+                subscriber. If 0, the subscriptions are drained until they are empty.
+            batch_size: The maximum number of messages of each pull.
+            concurrency: The number of concurrent pulls of each subscription.
+
+        Returns:
+            The number of messages received, acknowledged and nacked by each subscriber.
+        """
+        subscribers = [
+            subscriber for subscriber in self._filter_subscribers() if not subscriber.push_path
+        ]
+        if not subscribers:
+            logger.error("No subscriber found for draining.")
+            raise FastPubSubException(
+                "You must select the subscribers using --subscriber flag or drain them all."
+            )
+
+        drainers = [
+            SubscriptionDrainer(
+                subscriber,
+                max_messages=max_messages,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
+            for subscriber in subscribers
+        ]
+        return list(await asyncio.gather(*(drainer.run() for drainer in drainers)))
@@ -1,22 +1,69 @@
 """Builds and configures Pub/Sub subscriptions."""
 
-from anyio import create_task_group
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 
-from fastpubsub.clients.pubsub import PubSubClient
+from anyio import CapacityLimiter, Lock, create_task_group
+
+from fastpubsub.clients.admin import get_admin_client
+from fastpubsub.logger import logger
+from fastpubsub.provisioning import (
+    DEFAULT_PROVISIONING_CONCURRENCY,
+    ProvisioningCache,
+    fingerprint_subscription,
+)
 from fastpubsub.pubsub.subscriber import Subscriber
 
 
 class PubSubSubscriptionBuilder:
     """A builder for creating and updating Pub/Sub subscriptions."""
 
-    def __init__(self, project_id: str) -> None:
+    def __init__(
+        self, project_id: str, cache: ProvisioningCache | None = None, force: bool = False
+    ) -> None:
         """Initializes the PubSubSubscriptionBuilder.
 
         Args:
             project_id: The Google Cloud project ID.
+            cache: The cache of the already provisioned subscriptions.
+                If not set, the current state is always fetched.
+            force: Whether to provision the subscriptions even when
+                they already match the desired state.
         """
-        self.client = PubSubClient(project_id=project_id)
+        self.client = get_admin_client(project_id)
+        self.cache = cache
+        self.force = force
         self.created_topics: set[str] = set()
+        self._topic_locks: dict[str, Lock] = {}
+
+    async def build_all(
+        self,
+        subscribers: Sequence[Subscriber],
+        max_concurrency: int = DEFAULT_PROVISIONING_CONCURRENCY,
+    ) -> None:
+        """Builds the subscriptions of many subscribers concurrently.
+
+        Args:
+            subscribers: The subscribers to build the subscriptions for.
+            max_concurrency: The maximum number of subscribers built at once.
+        """
+        started_at = time.perf_counter()
+        limiter = CapacityLimiter(max(1, max_concurrency))
+
+        async def _build(subscriber: Subscriber) -> None:
+            async with limiter:
+                await self.build(subscriber)
+
+        async with create_task_group() as tg:
+            for subscriber in subscribers:
+                tg.start_soon(_build, subscriber)
+
+        if self.cache:
+            self.cache.save()
+
+        elapsed = time.perf_counter() - started_at
+        logger.info(f"Provisioned {len(subscribers)} subscribers in {elapsed:.3f}s.")
 
     async def build(self, subscriber: Subscriber) -> None:
         """Builds a subscription for the given subscriber.
@@ -24,46 +71,118 @@ class PubSubSubscriptionBuilder:
         Args:
             subscriber: The subscriber to build the subscription for.
         """
-        self.subscriber = subscriber
-        if self.subscriber.lifecycle_policy.autocreate:
-            await self._create_topics()
-            await self._create_subscription()
+        timings: dict[str, float] = {}
+        started_at = time.perf_counter()
+
+        shards = zip(subscriber.topic_names, subscriber.subscription_names, strict=True)
+        for topic_name, subscription_name in shards:
+            lifecycle_policy = subscriber.lifecycle_policy
+            if not (lifecycle_policy.autocreate or lifecycle_policy.autoupdate):
+                continue
+
+            desired_subscription = self.client._create_subscription_request(
+                topic_name=topic_name,
+                subscription_name=subscription_name,
+                retry_policy=subscriber.retry_policy,
+                delivery_policy=subscriber.delivery_policy,
+                dead_letter_policy=subscriber.dead_letter_policy,
+            )
+            fingerprint = fingerprint_subscription(desired_subscription)
+
+            with self._measure(timings, "state"):
+                converged = await self._is_converged(
+                    desired_subscription.name, subscription_name, fingerprint
+                )
 
-        if self.subscriber.lifecycle_policy.autoupdate:
-            await self._update_subscription()
+            if converged:
+                logger.debug(f"The subscription {desired_subscription.name} is up to date.")
+                continue
 
-    async def _create_topics(self) -> None:
+            if subscriber.lifecycle_policy.autocreate:
+                with self._measure(timings, "topics"):
+                    await self._create_topics(subscriber, topic_name)
+
+                with self._measure(timings, "create_subscription"):
+                    await self._create_subscription(subscriber, topic_name, subscription_name)
+
+            if subscriber.lifecycle_policy.autoupdate:
+                with self._measure(timings, "update_subscription"):
+                    await self._update_subscription(subscriber, topic_name, subscription_name)
+
+            if self.cache:
+                self.cache.store(desired_subscription.name, fingerprint)
+
+        elapsed = time.perf_counter() - started_at
+        breakdown = ", ".join(f"{step}={duration:.3f}s" for step, duration in timings.items())
+        logger.info(
+            f"Provisioned the subscriber '{subscriber.name}' in {elapsed:.3f}s ({breakdown})."
+        )
+
+    async def _is_converged(
+        self, subscription_path: str, subscription_name: str, fingerprint: str
+    ) -> bool:
+        if self.force:
+            return False
+
+        if self.cache and self.cache.is_converged(subscription_path, fingerprint):
+            return True
+
+        current_subscription = await self.client.get_subscription(subscription_name)
+        if not current_subscription:
+            return False
+
+        if fingerprint_subscription(current_subscription) != fingerprint:
+            return False
+
+        if self.cache:
+            self.cache.store(subscription_path, fingerprint)
+        return True
+
+    @contextmanager
+    def _measure(self, timings: dict[str, float], step: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings[step] = timings.get(step, 0.0) + time.perf_counter() - started_at
+
+    async def _create_topics(self, subscriber: Subscriber, topic_name: str) -> None:
         async with create_task_group() as tg:
-            target_topic = self.subscriber.topic_name
-            tg.start_soon(self._new_topic, target_topic, False)
+            tg.start_soon(self._new_topic, topic_name, False)
 
-            if self.subscriber.dead_letter_policy:
-                target_topic = self.subscriber.dead_letter_policy.topic_name
+            if subscriber.dead_letter_policy:
+                target_topic = subscriber.dead_letter_policy.topic_name
                 tg.start_soon(self._new_topic, target_topic)
 
     async def _new_topic(self, topic_name: str, create_default_subscription: bool = True) -> None:
-        if topic_name in self.created_topics:
-            return
+        lock = self._topic_locks.setdefault(topic_name, Lock())
+        async with lock:
+            if topic_name in self.created_topics:
+                return
 
-        await self.client.create_topic(
-            topic_name=topic_name, create_default_subscription=create_default_subscription
-        )
-        self.created_topics.add(topic_name)
+            await self.client.create_topic(
+                topic_name=topic_name, create_default_subscription=create_default_subscription
+            )
+            self.created_topics.add(topic_name)
 
-    async def _create_subscription(self) -> None:
+    async def _create_subscription(
+        self, subscriber: Subscriber, topic_name: str, subscription_name: str
+    ) -> None:
         await self.client.create_subscription(
-            topic_name=self.subscriber.topic_name,
-            subscription_name=self.subscriber.subscription_name,
-            retry_policy=self.subscriber.retry_policy,
-            delivery_policy=self.subscriber.delivery_policy,
-            dead_letter_policy=self.subscriber.dead_letter_policy,
+            topic_name=topic_name,
+            subscription_name=subscription_name,
+            retry_policy=subscriber.retry_policy,
+            delivery_policy=subscriber.delivery_policy,
+            dead_letter_policy=subscriber.dead_letter_policy,
         )
 
-    async def _update_subscription(self) -> None:
+    async def _update_subscription(
+        self, subscriber: Subscriber, topic_name: str, subscription_name: str
+    ) -> None:
         await self.client.update_subscription(
-            topic_name=self.subscriber.topic_name,
-            subscription_name=self.subscriber.subscription_name,
-            retry_policy=self.subscriber.retry_policy,
-            delivery_policy=self.subscriber.delivery_policy,
-            dead_letter_policy=self.subscriber.dead_letter_policy,
+            topic_name=topic_name,
+            subscription_name=subscription_name,
+            retry_policy=subscriber.retry_policy,
+            delivery_policy=subscriber.delivery_policy,
+            dead_letter_policy=subscriber.dead_letter_policy,
         )
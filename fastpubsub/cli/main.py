@@ -7,20 +7,38 @@ from fastpubsub.__about__ import __version__
 from fastpubsub.cli.options import (
     AppApmProvider,
     AppArgument,
+    AppConsumerProcessesOption,
+    AppDrainBatchSizeOption,
+    AppDrainConcurrencyOption,
+    AppDrainMaxMessagesOption,
+    AppDrainSubscribersOption,
+    AppEventLoopOption,
+    AppEventLoopThreadsOption,
+    AppForceProvisionOption,
     AppHostOption,
     AppHotReloadOption,
     AppLogColorizeOption,
     AppLogLevelOption,
     AppLogSerializeOption,
+    AppNoHttpOption,
     AppNumWorkersOption,
     AppPortOption,
+    AppPreloadOption,
+    AppProvisioningConcurrencyOption,
     AppSelectedSubscribersOption,
     AppServerLogLevelOption,
+    AppSubscriberWeightsOption,
     AppVersionOption,
     CLIContext,
 )
-from fastpubsub.cli.runner import AppConfiguration, ApplicationRunner, ServerConfiguration
-from fastpubsub.cli.utils import LogLevels, ensure_pubsub_credentials, get_log_level
+from fastpubsub.cli.utils import (
+    EventLoops,
+    LogLevels,
+    ensure_pubsub_credentials,
+    get_event_loop,
+    get_log_level,
+    get_subscriber_weights,
+)
 
 app = typer.Typer(
     name="fastpubsub",
@@ -30,6 +48,13 @@ app = typer.Typer(
     rich_markup_mode="markdown",
 )
 
+provision = typer.Typer(
+    name="provision",
+    help="Plan and apply the topics and subscriptions of a FastPubSub application.",
+    rich_markup_mode="markdown",
+)
+app.add_typer(provision)
+
 # V2: this command and its subcommands will be released on the future"
 """
 pubsub = typer.Typer(
@@ -68,6 +93,8 @@ def main(
         rich.print("\n[bold]Usage[/bold]: [cyan]fastpubsub [COMMAND] [ARGS]...[/cyan]")
         rich.print("\n[bold]Common Commands:[/bold]")
         rich.print("  [green]run[/green]    Run a FastPubSub application.")
+        rich.print("  [green]provision[/green]  Plan and apply topics and subscriptions.")
+        rich.print("  [green]drain[/green]  Consume the backlog of subscribers and exit.")
         rich.print("  [green]help[/green]   Get detailed help for a command.")
         rich.print(
             "\nRun '[cyan]fastpubsub --help[/cyan]' for "
@@ -102,6 +129,13 @@ def run(
     log_colorize: AppLogColorizeOption = False,
     server_log_level: AppServerLogLevelOption = LogLevels.WARNING,
     apm_provider: AppApmProvider = AppApmProvider.NOOP,
+    force_provision: AppForceProvisionOption = False,
+    no_http: AppNoHttpOption = False,
+    consumers: AppConsumerProcessesOption = 0,
+    event_loops: AppEventLoopThreadsOption = 0,
+    subscriber_weights: AppSubscriberWeightsOption = [],
+    preload: AppPreloadOption = False,
+    loop: AppEventLoopOption = EventLoops.AUTO,
 ) -> None:
     """Runs a FastPubSub application.
 
@@ -117,7 +151,16 @@ def run(
         log_colorize: Whether to colorize logs.
         server_log_level: The server (uvicorn) log level.
         apm_provider: The APM provider to use.
+        force_provision: Whether to provision up to date topics and subscriptions.
+        no_http: Whether to run only the consumers without the HTTP server.
+        consumers: The number of supervised consumer processes.
+        event_loops: The number of event loop threads of the subscribers.
+        subscriber_weights: The expected load of the subscribers as 'alias=weight'.
+        preload: Whether to import the application once before forking the workers.
+        loop: The event loop implementation.
     """
+    from fastpubsub.cli.runner import AppConfiguration, ApplicationRunner, ServerConfiguration
+
     ensure_pubsub_credentials()
     translated_log_level = get_log_level(log_level)
     app_configuration = AppConfiguration(
@@ -127,6 +170,12 @@ def run(
         log_colorize=log_colorize,
         apm_provider=apm_provider,
         subscribers=set(subscribers) if subscribers else set(),
+        force_provision=force_provision,
+        http_server=not no_http,
+        consumer_processes=consumers,
+        event_loops=event_loops,
+        subscriber_weights=get_subscriber_weights(subscriber_weights),
+        preload=preload,
     )
 
     translated_server_log_level = get_log_level(server_log_level)
@@ -136,12 +185,112 @@ def run(
         workers=workers,
         reload=reload,
         log_level=translated_server_log_level,
+        loop=get_event_loop(loop),
     )
 
     application_runner = ApplicationRunner()
     application_runner.run(app_configuration, server_configuration)
 
 
+@provision.command(name="plan")
+def provision_plan(
+    app: AppArgument,
+    subscribers: AppSelectedSubscribersOption = [],
+    concurrency: AppProvisioningConcurrencyOption = 10,
+) -> None:
+    """Shows the changes needed to provision the topics and subscriptions of an application.
+
+    Args:
+        app: The application to plan.
+        subscribers: The subscribers to plan.
+        concurrency: The maximum number of concurrent admin calls.
+    """
+    from fastpubsub.cli.runner import ProvisioningConfiguration, ProvisioningRunner
+
+    ensure_pubsub_credentials()
+    provisioning_configuration = ProvisioningConfiguration(
+        app=app,
+        max_concurrency=concurrency,
+        subscribers=set(subscribers) if subscribers else set(),
+    )
+
+    provisioning_runner = ProvisioningRunner()
+    provisioning_runner.run(provisioning_configuration, apply=False)
+
+
+@provision.command(name="apply")
+def provision_apply(
+    app: AppArgument,
+    subscribers: AppSelectedSubscribersOption = [],
+    concurrency: AppProvisioningConcurrencyOption = 10,
+) -> None:
+    """Provisions the topics and subscriptions of an application.
+
+    Args:
+        app: The application to provision.
+        subscribers: The subscribers to provision.
+        concurrency: The maximum number of concurrent admin calls.
+    """
+    from fastpubsub.cli.runner import ProvisioningConfiguration, ProvisioningRunner
+
+    ensure_pubsub_credentials()
+    provisioning_configuration = ProvisioningConfiguration(
+        app=app,
+        max_concurrency=concurrency,
+        subscribers=set(subscribers) if subscribers else set(),
+    )
+
+    provisioning_runner = ProvisioningRunner()
+    provisioning_runner.run(provisioning_configuration, apply=True)
+
+
+@app.command(name="drain")
+def drain(
+    app: AppArgument,
+    subscribers: AppDrainSubscribersOption = [],
+    max_messages: AppDrainMaxMessagesOption = 0,
+    batch_size: AppDrainBatchSizeOption = 100,
+    concurrency: AppDrainConcurrencyOption = 4,
+    log_level: AppLogLevelOption = LogLevels.INFO,
+    log_serialize: AppLogSerializeOption = False,
+    log_colorize: AppLogColorizeOption = False,
+    apm_provider: AppApmProvider = AppApmProvider.NOOP,
+    loop: AppEventLoopOption = EventLoops.AUTO,
+) -> None:
+    """Consumes the backlog of the subscribers with batched pulls and exits once it is empty.
+
+    Args:
+        app: The application to drain.
+        subscribers: The subscribers to drain.
+        max_messages: The maximum number of messages received by each subscriber.
+        batch_size: The maximum number of messages of each pull.
+        concurrency: The number of concurrent pulls of each subscription.
+        log_level: The log level.
+        log_serialize: Whether to serialize logs.
+        log_colorize: Whether to colorize logs.
+        apm_provider: The APM provider to use.
+        loop: The event loop implementation.
+    """
+    from fastpubsub.cli.runner import DrainConfiguration, DrainRunner
+
+    ensure_pubsub_credentials()
+    drain_configuration = DrainConfiguration(
+        app=app,
+        log_level=get_log_level(log_level),
+        log_serialize=log_serialize,
+        log_colorize=log_colorize,
+        apm_provider=apm_provider,
+        subscribers=set(subscribers) if subscribers else set(),
+        max_messages=max_messages,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        loop=get_event_loop(loop),
+    )
+
+    drain_runner = DrainRunner()
+    drain_runner.run(drain_configuration)
+
+
 @app.command(name="help")
 def show_help(ctx: typer.Context) -> None:
     """Show this message and exit."""
@@ -4,7 +4,7 @@ from typing import Annotated
 
 import typer
 
-from fastpubsub.cli.utils import APMProviders, LogLevels
+from fastpubsub.cli.utils import APMProviders, EventLoops, LogLevels
 
 CLIContext = typer.Context
 
@@ -40,6 +40,122 @@ AppSelectedSubscribersOption = Annotated[
     ),
 ]
 
+AppForceProvisionOption = Annotated[
+    bool,
+    typer.Option(
+        "--force-provision",
+        help="Create and update the topics and subscriptions even if they are up to date.",
+        envvar="FASTPUBSUB_FORCE_PROVISION",
+    ),
+]
+
+AppProvisioningConcurrencyOption = Annotated[
+    int,
+    typer.Option(
+        "-c",
+        "--concurrency",
+        show_default=True,
+        help="The maximum number of concurrent calls to the Pub/Sub admin API.",
+        envvar="FASTPUBSUB_PROVISIONING_CONCURRENCY",
+    ),
+]
+
+AppDrainSubscribersOption = Annotated[
+    list[str],
+    typer.Option(
+        "-s",
+        "--subscriber",
+        "--subscribers",
+        help="Specify the subscribers to drain. If not selected, all will be drained.",
+        envvar="FASTPUBSUB_SELECTED_SUBSCRIBERS",
+    ),
+]
+
+AppDrainMaxMessagesOption = Annotated[
+    int,
+    typer.Option(
+        "-m",
+        "--max",
+        show_default=True,
+        help="The maximum number of messages received by each subscriber. "
+        "If 0, the subscriptions are drained until they are empty.",
+        envvar="FASTPUBSUB_DRAIN_MAX_MESSAGES",
+    ),
+]
+
+AppDrainBatchSizeOption = Annotated[
+    int,
+    typer.Option(
+        "--batch-size",
+        show_default=True,
+        help="The maximum number of messages of each pull.",
+        envvar="FASTPUBSUB_DRAIN_BATCH_SIZE",
+    ),
+]
+
+AppDrainConcurrencyOption = Annotated[
+    int,
+    typer.Option(
+        "-c",
+        "--concurrency",
+        show_default=True,
+        help="The number of concurrent pulls of each subscription.",
+        envvar="FASTPUBSUB_DRAIN_CONCURRENCY",
+    ),
+]
+
+AppNoHttpOption = Annotated[
+    bool,
+    typer.Option(
+        "--no-http",
+        help="Run only the consumers without the HTTP server. "
+        "The health probes are served by a minimal responder on --host and --port.",
+        envvar="FASTPUBSUB_DISABLE_HTTP",
+    ),
+]
+
+AppConsumerProcessesOption = Annotated[
+    int,
+    typer.Option(
+        "--consumers",
+        show_default=True,
+        help="Run the subscribers on [consumers] supervised processes without the HTTP "
+        "server. Each subscriber runs on a single process. If 0, the supervisor is disabled.",
+        envvar="FASTPUBSUB_CONSUMER_PROCESSES",
+    ),
+]
+
+AppEventLoopThreadsOption = Annotated[
+    int,
+    typer.Option(
+        "--event-loops",
+        show_default=True,
+        help="Shard the subscribers of each process across [event-loops] event loop threads, "
+        "each one with its own clients. If 0, the subscribers run on the app event loop.",
+        envvar="FASTPUBSUB_EVENT_LOOPS",
+    ),
+]
+
+AppSubscriberWeightsOption = Annotated[
+    list[str],
+    typer.Option(
+        "--subscriber-weight",
+        help="The expected load of a subscriber as 'alias=weight', "
+        "used to balance the subscribers across the --consumers processes.",
+        envvar="FASTPUBSUB_SUBSCRIBER_WEIGHTS",
+    ),
+]
+
+AppPreloadOption = Annotated[
+    bool,
+    typer.Option(
+        "--preload",
+        help="Import the app once before forking the --workers, which share its memory "
+        "as copy-on-write pages. The --reload flag is ignored.",
+        envvar="FASTPUBSUB_PRELOAD_APP",
+    ),
+]
+
 AppHotReloadOption = Annotated[
     bool,
     typer.Option(
@@ -129,6 +245,17 @@ AppApmProvider = Annotated[
     ),
 ]
 
+AppEventLoopOption = Annotated[
+    EventLoops,
+    typer.Option(
+        "--loop",
+        case_sensitive=False,
+        help="The event loop implementation. The 'auto' option uses uvloop when it is installed.",
+        show_default=True,
+        envvar="FASTPUBSUB_LOOP",
+    ),
+]
+
 AppVersionOption = Annotated[
     bool,
     typer.Option(
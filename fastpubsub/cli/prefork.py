@@ -0,0 +1,110 @@
+"""A pre-fork server that shares a preloaded application across the workers."""
+
+import gc
+import os
+import signal
+import socket
+import time
+from types import FrameType
+
+import uvicorn
+
+from fastpubsub.exceptions import FastPubSubCLIException
+from fastpubsub.logger import logger
+
+RESPAWN_DELAY = 1.0
+STARTUP_FAILURE = 3
+
+
+class PreforkServer:
+    """Forks the uvicorn workers from a process that already imported the application.
+
+    The workers inherit the imported modules as copy-on-write pages instead
+    of importing the application again, so the application is imported only
+    once and the memory of its modules is shared across the workers.
+    """
+
+    def __init__(self, config: uvicorn.Config, workers: int) -> None:
+        """Initializes the PreforkServer.
+
+        Args:
+            config: The uvicorn configuration with the preloaded application.
+            workers: The number of worker processes.
+        """
+        if not hasattr(os, "fork"):
+            raise FastPubSubCLIException("The --preload option requires a platform with fork.")
+
+        self.config = config
+        self.workers = max(1, workers)
+        self.should_exit = False
+        self._children: set[int] = set()
+
+    def run(self) -> None:
+        """Forks the workers and supervises them until SIGINT or SIGTERM."""
+        sock = self.config.bind_socket()
+
+        # Objects that survive the collections before the fork are never
+        # scanned again, so the collector does not dirty the shared pages.
+        gc.collect()
+        gc.freeze()
+
+        previous_handlers = {
+            signum: signal.signal(signum, self._handle_exit)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            for _ in range(self.workers):
+                self._spawn(sock)
+
+            while self._children:
+                pid, status = os.wait()
+                self._children.discard(pid)
+                if self.should_exit:
+                    continue
+
+                exit_code = os.waitstatus_to_exitcode(status)
+                if exit_code == STARTUP_FAILURE:
+                    logger.error(f"The worker {pid} failed to start, stopping the workers.")
+                    self._handle_exit(signal.SIGTERM, None)
+                    continue
+
+                logger.error(
+                    f"The worker {pid} exited with code {exit_code}, "
+                    f"restarting it in {RESPAWN_DELAY:.1f}s."
+                )
+                time.sleep(RESPAWN_DELAY)
+                if not self.should_exit:
+                    self._spawn(sock)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            sock.close()
+            gc.unfreeze()
+
+    def _spawn(self, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            exit_code = 0
+            try:
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                server = uvicorn.Server(self.config)
+                server.run(sockets=[sock])
+                if not server.started:
+                    exit_code = STARTUP_FAILURE
+            except Exception:
+                logger.exception(f"The worker {os.getpid()} crashed.")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        self._children.add(pid)
+        logger.info(f"Forked the worker {pid}.")
+
+    def _handle_exit(self, signum: int, frame: FrameType | None) -> None:
+        self.should_exit = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.discard(pid)
@@ -1,16 +1,35 @@
 """Application runner."""
 
+import asyncio
+import importlib.util
 import os
 import sys
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import rich
 import uvicorn
 import uvicorn.importer
 
 from fastpubsub.applications import FastPubSub
+from fastpubsub.broker import PubSubBroker
+from fastpubsub.cli.prefork import PreforkServer
+from fastpubsub.cli.utils import get_peak_memory_usage
+from fastpubsub.concurrency.drain import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PULL_CONCURRENCY,
+    DrainResult,
+)
+from fastpubsub.concurrency.loops import resolve_event_loop, run_with_event_loop
 from fastpubsub.exceptions import FastPubSubCLIException
+from fastpubsub.health import serve_without_http
 from fastpubsub.logger import logger, setup_logger
+from fastpubsub.provisioning import ProvisioningChange, ProvisioningPlanner
+from fastpubsub.pubsub.publisher import Publisher
+from fastpubsub.pubsub.subscriber import Subscriber
+from fastpubsub.supervisor import ConsumerSupervisor, assign_subscribers
+from fastpubsub.types import EventLoopType
 
 
 @dataclass(frozen=True)
@@ -22,6 +41,7 @@ class ServerConfiguration:
     workers: int
     reload: bool
     log_level: int
+    loop: EventLoopType = "auto"
 
 
 @dataclass(frozen=True)
@@ -34,6 +54,37 @@ class AppConfiguration:
     log_colorize: bool
     apm_provider: str
     subscribers: set[str] = field(default_factory=set)
+    force_provision: bool = False
+    http_server: bool = True
+    consumer_processes: int = 0
+    event_loops: int = 0
+    subscriber_weights: dict[str, float] = field(default_factory=dict)
+    preload: bool = False
+
+
+@dataclass(frozen=True)
+class ProvisioningConfiguration:
+    """Provisioning configuration."""
+
+    app: str
+    max_concurrency: int
+    subscribers: set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True)
+class DrainConfiguration:
+    """Drain configuration."""
+
+    app: str
+    log_level: int
+    log_serialize: bool
+    log_colorize: bool
+    apm_provider: str
+    subscribers: set[str] = field(default_factory=set)
+    max_messages: int = 0
+    batch_size: int = DEFAULT_BATCH_SIZE
+    concurrency: int = DEFAULT_PULL_CONCURRENCY
+    loop: EventLoopType = "auto"
 
 
 class ApplicationRunner:
@@ -49,21 +100,100 @@ class ApplicationRunner:
         self._setup_enviroment(app_config=app_config)
 
         setup_logger()
+        logger.info(f"Using the {resolve_event_loop(server_config.loop)} event loop.")
+
+        if app_config.consumer_processes > 0:
+            self._run_consumer_processes(app_config, server_config)
+            return
+
+        if not app_config.http_server:
+            self._run_without_http(app_config, server_config)
+            return
+
+        if app_config.preload:
+            self._run_preloaded(app_config, server_config)
+            return
 
         self._validate_application(app_config.app)
 
         logger.info("FastPubSub app starting...")
         uvicorn.run(
-            app_config.app,
+            APPLICATION_FACTORY,
+            factory=True,
             lifespan="on",
             log_level=server_config.log_level,
             host=server_config.host,
             port=server_config.port,
             workers=server_config.workers,
             reload=server_config.reload,
+            loop=server_config.loop,
         )
         logger.info("FastPubSub app terminated.")
 
+    def _run_preloaded(
+        self, app_config: AppConfiguration, server_config: ServerConfiguration
+    ) -> None:
+        if server_config.reload:
+            logger.warning("The --reload option is ignored with --preload.")
+
+        application = self.load_application(app_config.app)
+        config = uvicorn.Config(
+            application,
+            lifespan="on",
+            log_level=server_config.log_level,
+            host=server_config.host,
+            port=server_config.port,
+            loop=server_config.loop,
+        )
+
+        logger.info("FastPubSub app starting with the preloaded application...")
+        if server_config.workers > 1:
+            PreforkServer(config=config, workers=server_config.workers).run()
+        else:
+            uvicorn.Server(config).run()
+        logger.info("FastPubSub app terminated.")
+
+    def _run_without_http(
+        self, app_config: AppConfiguration, server_config: ServerConfiguration
+    ) -> None:
+        if server_config.workers > 1 or server_config.reload:
+            logger.warning("The --workers and --reload options are ignored with --no-http.")
+
+        application = self.load_application(app_config.app)
+
+        logger.info("FastPubSub app starting without the HTTP server...")
+        run_with_event_loop(
+            serve_without_http(application, server_config.host, server_config.port),
+            loop=server_config.loop,
+        )
+        logger.info("FastPubSub app terminated.")
+
+    def _run_consumer_processes(
+        self, app_config: AppConfiguration, server_config: ServerConfiguration
+    ) -> None:
+        if server_config.workers > 1 or server_config.reload:
+            logger.warning("The --workers and --reload options are ignored with --consumers.")
+
+        application = self.load_application(app_config.app)
+        aliases = application.broker._filter_subscriber_aliases()
+        if not aliases:
+            raise FastPubSubCLIException("No subscriber found for running.")
+
+        assignments = assign_subscribers(
+            aliases, app_config.consumer_processes, app_config.subscriber_weights
+        )
+        supervisor = ConsumerSupervisor(
+            app=app_config.app,
+            assignments=assignments,
+            host=server_config.host,
+            port=server_config.port,
+            loop=server_config.loop,
+        )
+
+        logger.info(f"FastPubSub app starting {len(assignments)} consumer processes...")
+        run_with_event_loop(supervisor.run(), loop=server_config.loop)
+        logger.info("FastPubSub app terminated.")
+
     def _setup_enviroment(self, app_config: AppConfiguration) -> None:
         os.environ["FASTPUBSUB_LOG_LEVEL"] = str(app_config.log_level)
         os.environ["FASTPUBSUB_ENABLE_LOG_SERIALIZE"] = (
@@ -72,15 +202,49 @@ class ApplicationRunner:
         os.environ["FASTPUBSUB_ENABLE_LOG_COLORS"] = str(1) if app_config.log_colorize else str(0)
         os.environ["FASTPUBSUB_SUBSCRIBERS"] = ",".join(app_config.subscribers)
         os.environ["FASTPUBSUB_APM_PROVIDER"] = app_config.apm_provider
+        os.environ["FASTPUBSUB_FORCE_PROVISION"] = str(1) if app_config.force_provision else str(0)
+        os.environ["FASTPUBSUB_APPLICATION"] = app_config.app
+        os.environ["FASTPUBSUB_EVENT_LOOPS"] = str(app_config.event_loops)
 
-    def _validate_application(self, path: str) -> None:
+    def load_application(self, path: str) -> FastPubSub:
+        """Imports a FastPubSub application from its path.
+
+        Args:
+            path: The application path in the '<module>:<attribute>' format.
+
+        Returns:
+            The imported application.
+        """
         posix_path = self._translate_pypath_to_posix(pypath=path)
         self._resolve_application_posix_path(posix_path=posix_path)
 
+        started_at = time.perf_counter()
         app = uvicorn.importer.import_from_string(path)
         if not app or not isinstance(app, FastPubSub):
             raise FastPubSubCLIException(f"The app {path} is not a {FastPubSub} instance")
 
+        elapsed = time.perf_counter() - started_at
+        logger.info(
+            f"Imported the app {path} in {elapsed:.3f}s "
+            f"(peak RSS of {get_peak_memory_usage():.1f} MiB)."
+        )
+        return app
+
+    def _validate_application(self, path: str) -> None:
+        # Only the module is located here: the app is imported and checked
+        # by the server process itself, so the CLI never keeps another copy.
+        posix_path = self._translate_pypath_to_posix(pypath=path)
+        self._resolve_application_posix_path(posix_path=posix_path)
+
+        module, _ = path.split(os.path.pathsep)
+        try:
+            spec = importlib.util.find_spec(module)
+        except (ImportError, ValueError) as e:
+            raise FastPubSubCLIException(f"The module of the app {path} could not be found") from e
+
+        if not spec:
+            raise FastPubSubCLIException(f"The module of the app {path} could not be found")
+
     def _translate_pypath_to_posix(self, pypath: str) -> Path:
         try:
             module, _ = pypath.split(os.path.pathsep)
@@ -107,3 +271,140 @@ class ApplicationRunner:
         current_directory = os.getcwd()
         sys.path.insert(0, current_directory)
         sys.path.insert(0, str(extra_sys_path))
+
+
+APPLICATION_FACTORY = "fastpubsub.cli.runner:load_application_from_environment"
+
+
+def load_application_from_environment() -> FastPubSub:
+    """Imports the application set by the CLI in the FASTPUBSUB_APPLICATION variable.
+
+    It is the application factory given to uvicorn, so each server process
+    imports and validates the application only once.
+
+    Returns:
+        The imported application.
+    """
+    path = os.getenv("FASTPUBSUB_APPLICATION", "")
+    if not path:
+        raise FastPubSubCLIException("The FASTPUBSUB_APPLICATION variable is not set.")
+
+    return ApplicationRunner().load_application(path)
+
+
+class ProvisioningRunner:
+    """Plans and applies the topics and subscriptions of a FastPubSub application."""
+
+    def run(
+        self, config: ProvisioningConfiguration, apply: bool = False
+    ) -> list[ProvisioningChange]:
+        """Diffs the application against the live project and optionally applies the plan.
+
+        Args:
+            config: The provisioning configuration.
+            apply: Whether to apply the plan after printing it.
+
+        Returns:
+            The changes needed to converge the project.
+        """
+        broker = self._load_broker(config)
+        planner = ProvisioningPlanner(
+            project_id=broker.project_id, max_concurrency=config.max_concurrency
+        )
+        subscribers = broker._filter_subscribers()
+        publishers = list(broker.router._get_publishers().values())
+        return asyncio.run(self._run(planner, subscribers, publishers, apply))
+
+    async def _run(
+        self,
+        planner: ProvisioningPlanner,
+        subscribers: list[Subscriber],
+        publishers: list[Publisher],
+        apply: bool,
+    ) -> list[ProvisioningChange]:
+        changes = await planner.plan(subscribers, publishers)
+        self._print_plan(changes)
+
+        if apply and changes:
+            await planner.apply(changes)
+            rich.print(f"\n[bold green]Applied {len(changes)} changes.[/bold green]")
+
+        return changes
+
+    def _print_plan(self, changes: list[ProvisioningChange]) -> None:
+        if not changes:
+            rich.print("[bold]No changes.[/bold] The project matches the application.")
+            return
+
+        symbols = {
+            "create_topic": "[green]+ topic[/green]",
+            "create_subscription": "[green]+ subscription[/green]",
+            "update_subscription": "[yellow]~ subscription[/yellow]",
+        }
+
+        rich.print(f"[bold]Plan:[/bold] {len(changes)} changes.")
+        for change in changes:
+            target = f" -> {change.topic_name}" if change.topic_name else ""
+            rich.print(f"  {symbols[change.action]} {change.name}{target}")
+
+    def _load_broker(self, config: ProvisioningConfiguration) -> PubSubBroker:
+        os.environ["FASTPUBSUB_SUBSCRIBERS"] = ",".join(config.subscribers)
+        application = ApplicationRunner().load_application(config.app)
+        return application.broker
+
+
+class DrainRunner:
+    """Consumes the backlog of the subscribers of a FastPubSub application and exits."""
+
+    def run(self, config: DrainConfiguration) -> list[DrainResult]:
+        """Drains the subscribers with batched pulls until they are empty.
+
+        The startup and shutdown hooks of the application run around the
+        drain, but its subscriptions are not provisioned.
+
+        Args:
+            config: The drain configuration.
+
+        Returns:
+            The number of messages received, acknowledged and nacked by each subscriber.
+        """
+        self._setup_enviroment(config)
+        setup_logger()
+
+        application = ApplicationRunner().load_application(config.app)
+        results = run_with_event_loop(self._run(application, config), loop=config.loop)
+        self._print_results(results)
+        return results
+
+    async def _run(self, application: FastPubSub, config: DrainConfiguration) -> list[DrainResult]:
+        application.apm.start()
+        try:
+            async with application._start_hooks():
+                pass
+
+            try:
+                return await application.broker.drain(
+                    max_messages=config.max_messages,
+                    batch_size=config.batch_size,
+                    concurrency=config.concurrency,
+                )
+            finally:
+                async with application._shutdown_hooks():
+                    pass
+        finally:
+            application.apm.shutdown()
+
+    def _print_results(self, results: list[DrainResult]) -> None:
+        for result in results:
+            rich.print(
+                f"[bold]{result.subscriber}[/bold]: received {result.received}, "
+                f"[green]acknowledged {result.acknowledged}[/green], "
+                f"[yellow]nacked {result.nacked}[/yellow]."
+            )
+
+    def _setup_enviroment(self, config: DrainConfiguration) -> None:
+        os.environ["FASTPUBSUB_LOG_LEVEL"] = str(config.log_level)
+        os.environ["FASTPUBSUB_ENABLE_LOG_SERIALIZE"] = str(1) if config.log_serialize else str(0)
+        os.environ["FASTPUBSUB_ENABLE_LOG_COLORS"] = str(1) if config.log_colorize else str(0)
+        os.environ["FASTPUBSUB_SUBSCRIBERS"] = ",".join(config.subscribers)
+        os.environ["FASTPUBSUB_APM_PROVIDER"] = config.apm_provider
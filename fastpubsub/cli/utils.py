@@ -2,9 +2,11 @@
 
 import logging
 import os
+import sys
 from enum import StrEnum
 
 from fastpubsub.exceptions import FastPubSubCLIException
+from fastpubsub.types import EventLoopType
 
 
 class LogLevels(StrEnum):
@@ -64,6 +66,39 @@ class APMProviders(StrEnum):
     NEWRELIC = "NEWRELIC"
 
 
+class EventLoops(StrEnum):
+    """A class to represent the possible event loop implementations."""
+
+    AUTO = "auto"
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+
+EVENT_LOOP_MAP: dict[str, EventLoopType] = {
+    EventLoops.AUTO: "auto",
+    EventLoops.ASYNCIO: "asyncio",
+    EventLoops.UVLOOP: "uvloop",
+}
+
+
+def get_event_loop(loop: EventLoops | str) -> EventLoopType:
+    """Get the event loop implementation.
+
+    Args:
+        loop: The event loop to get. Can be an EventLoops enum value or a string.
+
+    Returns:
+        The event loop implementation.
+    """
+    event_loop = EVENT_LOOP_MAP.get(str(loop).lower())
+    if not event_loop:
+        possible_values = list(EventLoops._value2member_map_.values())
+        raise FastPubSubCLIException(
+            f"Invalid value for '--loop', it should be one of {possible_values}"
+        )
+    return event_loop
+
+
 def ensure_pubsub_credentials() -> None:
     """Ensures that the Pub/Sub credentials are set."""
     credentials = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
@@ -73,3 +108,48 @@ def ensure_pubsub_credentials() -> None:
             "You should set either of the environment variables for authentication: "
             "(GOOGLE_APPLICATION_CREDENTIALS, PUBSUB_EMULATOR_HOST)"
         )
+
+
+def get_subscriber_weights(values: list[str]) -> dict[str, float]:
+    """Parses the subscriber weights given as 'alias=weight'.
+
+    Args:
+        values: The subscriber weights to parse.
+
+    Returns:
+        The weight of each subscriber alias.
+    """
+    weights: dict[str, float] = {}
+    for value in values:
+        alias, _, weight = value.partition("=")
+        try:
+            parsed_weight = float(weight)
+        except ValueError:
+            parsed_weight = 0.0
+
+        if not alias.strip() or parsed_weight <= 0:
+            raise FastPubSubCLIException(
+                f"Invalid value '{value}' for '--subscriber-weight', "
+                "it should be in the 'alias=weight' format with a positive weight."
+            )
+
+        weights[alias.lower().strip()] = parsed_weight
+
+    return weights
+
+
+def get_peak_memory_usage() -> float:
+    """Gets the peak resident set size of the current process.
+
+    Returns:
+        The peak resident set size in MiB, or 0 if the platform does not report it.
+    """
+    try:
+        import resource
+    except ImportError:  # pragma: no cover
+        return 0.0
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":  # pragma: no cover
+        return peak_rss / (1024 * 1024)
+    return peak_rss / 1024
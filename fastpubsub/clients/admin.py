@@ -0,0 +1,309 @@
+"""An async-native client for managing Google Cloud Pub/Sub resources."""
+
+import asyncio
+import os
+from contextlib import suppress
+from datetime import timedelta
+from functools import cache
+from weakref import WeakKeyDictionary
+
+import grpc
+from google.api_core.exceptions import AlreadyExists, NotFound
+from google.protobuf.field_mask_pb2 import FieldMask
+from google.pubsub import DeadLetterPolicy as DLTPolicy
+from google.pubsub import (
+    PublisherAsyncClient,
+    RetryPolicy,
+    SubscriberAsyncClient,
+    Subscription,
+    Topic,
+)
+from google.pubsub_v1.services.publisher.transports import PublisherGrpcAsyncIOTransport
+from google.pubsub_v1.services.subscriber.transports import SubscriberGrpcAsyncIOTransport
+
+from fastpubsub.datastructures import DeadLetterPolicy, MessageDeliveryPolicy, MessageRetryPolicy
+from fastpubsub.exceptions import FastPubSubException
+from fastpubsub.logger import logger
+
+DEFAULT_PUBSUB_TIMEOUT = 20.0
+DEFAULT_PULL_TIMEOUT = 120.0
+
+
+class _LoopClients:
+    def __init__(self) -> None:
+        self.publisher_client: PublisherAsyncClient | None = None
+        self.subscriber_client: SubscriberAsyncClient | None = None
+
+
+class PubSubAdminClient:
+    """A client for creating and updating topics and subscriptions.
+
+    It uses the async gapic clients, so the administrative calls run on the
+    event loop instead of worker threads. The gapic clients are bound to the
+    event loop where they are created, so each event loop using the client
+    gets its own gapic clients.
+    """
+
+    def __init__(self, project_id: str) -> None:
+        """Initializes the PubSubAdminClient.
+
+        Args:
+            project_id: The Google Cloud project ID.
+        """
+        self.project_id = project_id
+        self.emulator_host = os.getenv("PUBSUB_EMULATOR_HOST", "")
+        self.is_emulator = True if self.emulator_host else False
+
+        self._clients: WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients] = (
+            WeakKeyDictionary()
+        )
+
+    @property
+    def publisher_client(self) -> PublisherAsyncClient:
+        """The async publisher client bound to the running event loop."""
+        clients = self._get_loop_clients()
+        if not clients.publisher_client:
+            if self.is_emulator:
+                channel = grpc.aio.insecure_channel(self.emulator_host)
+                transport = PublisherGrpcAsyncIOTransport(channel=channel)
+                clients.publisher_client = PublisherAsyncClient(transport=transport)
+            else:
+                clients.publisher_client = PublisherAsyncClient()
+        return clients.publisher_client
+
+    @property
+    def subscriber_client(self) -> SubscriberAsyncClient:
+        """The async subscriber client bound to the running event loop."""
+        clients = self._get_loop_clients()
+        if not clients.subscriber_client:
+            if self.is_emulator:
+                channel = grpc.aio.insecure_channel(self.emulator_host)
+                transport = SubscriberGrpcAsyncIOTransport(channel=channel)
+                clients.subscriber_client = SubscriberAsyncClient(transport=transport)
+            else:
+                clients.subscriber_client = SubscriberAsyncClient()
+        return clients.subscriber_client
+
+    def _get_loop_clients(self) -> _LoopClients:
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if not clients:
+            clients = self._clients.setdefault(loop, _LoopClients())
+        return clients
+
+    def _create_subscription_request(
+        self,
+        topic_name: str,
+        subscription_name: str,
+        retry_policy: MessageRetryPolicy,
+        delivery_policy: MessageDeliveryPolicy,
+        dead_letter_policy: DeadLetterPolicy | None = None,
+    ) -> Subscription:
+        name = SubscriberAsyncClient.subscription_path(self.project_id, subscription_name)
+        topic = SubscriberAsyncClient.topic_path(self.project_id, topic_name)
+
+        dlt_policy = None
+        if dead_letter_policy:
+            dlt_topic = SubscriberAsyncClient.topic_path(
+                self.project_id,
+                dead_letter_policy.topic_name,
+            )
+
+            dlt_policy = DLTPolicy(
+                dead_letter_topic=dlt_topic,
+                max_delivery_attempts=dead_letter_policy.max_delivery_attempts,
+            )
+
+        min_backoff_delay = timedelta(seconds=retry_policy.min_backoff_delay_secs)
+        max_backoff_delay = timedelta(seconds=retry_policy.max_backoff_delay_secs)
+        message_retry_policy = RetryPolicy(
+            minimum_backoff=min_backoff_delay, maximum_backoff=max_backoff_delay
+        )
+
+        return Subscription(
+            name=name,
+            topic=topic,
+            dead_letter_policy=dlt_policy,
+            retry_policy=message_retry_policy,
+            filter=delivery_policy.filter_expression,
+            ack_deadline_seconds=delivery_policy.ack_deadline_seconds,
+            enable_exactly_once_delivery=delivery_policy.enable_exactly_once_delivery,
+        )
+
+    async def create_subscription(
+        self,
+        topic_name: str,
+        subscription_name: str,
+        retry_policy: MessageRetryPolicy,
+        delivery_policy: MessageDeliveryPolicy,
+        dead_letter_policy: DeadLetterPolicy | None = None,
+    ) -> None:
+        """Creates a subscription.
+
+        Args:
+            topic_name: The name of the topic.
+            subscription_name: The name of the subscription.
+            retry_policy: The retry policy for the subscription.
+            delivery_policy: The delivery policy for the subscription.
+            dead_letter_policy: The dead-letter policy for the subscription.
+        """
+        subscription_request = self._create_subscription_request(
+            topic_name=topic_name,
+            subscription_name=subscription_name,
+            retry_policy=retry_policy,
+            delivery_policy=delivery_policy,
+            dead_letter_policy=dead_letter_policy,
+        )
+
+        with suppress(AlreadyExists):
+            logger.debug(f"Attempting to create subscription: {subscription_request.name}")
+            await self.subscriber_client.create_subscription(
+                request=subscription_request, timeout=DEFAULT_PUBSUB_TIMEOUT
+            )
+
+            logger.debug(f"Successfully created subscription: {subscription_request.name}")
+
+    async def update_subscription(
+        self,
+        topic_name: str,
+        subscription_name: str,
+        retry_policy: MessageRetryPolicy,
+        delivery_policy: MessageDeliveryPolicy,
+        dead_letter_policy: DeadLetterPolicy | None = None,
+    ) -> None:
+        """Updates a subscription.
+
+        Args:
+            topic_name: The name of the topic.
+            subscription_name: The name of the subscription.
+            retry_policy: The retry policy for the subscription.
+            delivery_policy: The delivery policy for the subscription.
+            dead_letter_policy: The dead-letter policy for the subscription.
+        """
+        subscription_request = self._create_subscription_request(
+            topic_name=topic_name,
+            subscription_name=subscription_name,
+            retry_policy=retry_policy,
+            delivery_policy=delivery_policy,
+            dead_letter_policy=dead_letter_policy,
+        )
+
+        update_fields = [
+            "ack_deadline_seconds",
+            "dead_letter_policy",
+            "retry_policy",
+            "enable_exactly_once_delivery",
+        ]
+
+        if not self.is_emulator:
+            update_fields.append("filter")
+
+        update_mask = FieldMask(paths=update_fields)
+
+        try:
+            logger.debug(f"Attempting to update the subscription: {subscription_request.name}")
+            response = await self.subscriber_client.update_subscription(
+                subscription=subscription_request,
+                update_mask=update_mask,
+                timeout=DEFAULT_PUBSUB_TIMEOUT,
+            )
+
+            logger.debug(f"Successfully updated the subscription: {subscription_request.name}")
+            logger.debug(f"The subscription is now following the configuration: {response}")
+        except NotFound as e:
+            raise FastPubSubException(
+                "We could not update the subscription configuration. "
+                f"The topic {subscription_request.topic} or "
+                f"subscription {subscription_request.name} were not found. "
+                "They may be deleted or not autocreated. "
+                "Please, setup your @subscriber with the 'autocreate=True' "
+                "option to automatically create them."
+            ) from e
+
+    async def get_topic(self, topic_name: str) -> Topic | None:
+        """Fetches a topic.
+
+        Args:
+            topic_name: The name of the topic.
+
+        Returns:
+            The topic or None if it does not exist.
+        """
+        topic_path = PublisherAsyncClient.topic_path(self.project_id, topic_name)
+
+        try:
+            return await self.publisher_client.get_topic(
+                topic=topic_path, timeout=DEFAULT_PUBSUB_TIMEOUT
+            )
+        except NotFound:
+            logger.debug(f"The topic {topic_path} does not exist.")
+            return None
+
+    async def get_subscription(self, subscription_name: str) -> Subscription | None:
+        """Fetches the current configuration of a subscription.
+
+        Args:
+            subscription_name: The name of the subscription.
+
+        Returns:
+            The subscription or None if it does not exist.
+        """
+        subscription_path = SubscriberAsyncClient.subscription_path(
+            self.project_id, subscription_name
+        )
+
+        try:
+            return await self.subscriber_client.get_subscription(
+                subscription=subscription_path, timeout=DEFAULT_PUBSUB_TIMEOUT
+            )
+        except NotFound:
+            logger.debug(f"The subscription {subscription_path} does not exist.")
+            return None
+
+    async def create_topic(self, topic_name: str, create_default_subscription: bool = True) -> None:
+        """Creates a topic.
+
+        Args:
+            topic_name: The name of the topic.
+            create_default_subscription: Whether to create a default
+                subscription for the topic.
+        """
+        with suppress(AlreadyExists):
+            logger.debug(f"Creating topic '{topic_name}'.")
+            topic_path = PublisherAsyncClient.topic_path(self.project_id, topic_name)
+
+            topic = await self.publisher_client.create_topic(
+                name=topic_path, timeout=DEFAULT_PUBSUB_TIMEOUT
+            )
+            logger.debug(f"Created topic '{topic.name}' sucessfully.")
+
+            if not create_default_subscription:
+                return
+
+            logger.debug(f"Creating default subscription for '{topic_path}'.")
+            default_subscription_path = SubscriberAsyncClient.subscription_path(
+                self.project_id, topic_name
+            )
+            subscription = await self.subscriber_client.create_subscription(
+                name=default_subscription_path,
+                topic=topic_path,
+                timeout=DEFAULT_PULL_TIMEOUT,
+            )
+
+            logger.debug(
+                "Creating default subscription created successfully for "
+                f"'{topic_path}' as {subscription.name}."
+            )
+
+
+@cache
+def get_admin_client(project_id: str) -> PubSubAdminClient:
+    """Gets the admin client shared by the whole process for a project.
+
+    Args:
+        project_id: The Google Cloud project ID.
+
+    Returns:
+        The shared admin client of the project.
+    """
+    return PubSubAdminClient(project_id=project_id)
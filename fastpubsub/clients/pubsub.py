@@ -3,29 +3,21 @@
 import os
 from collections.abc import Callable
 from concurrent.futures import Future
-from contextlib import suppress
-from datetime import timedelta
 from typing import Any
 
-from google.api_core.exceptions import AlreadyExists, NotFound
+from google.api_core.exceptions import DeadlineExceeded
 from google.cloud.pubsub import PublisherClient, SubscriberClient
 from google.cloud.pubsub_v1.subscriber.futures import StreamingPullFuture
 from google.cloud.pubsub_v1.subscriber.message import Message as PubSubMessage
-from google.cloud.pubsub_v1.types import FlowControl, PublisherOptions
-from google.protobuf.field_mask_pb2 import FieldMask
-from google.pubsub import DeadLetterPolicy as DLTPolicy
-from google.pubsub import RetryPolicy, Subscription
+from google.cloud.pubsub_v1.types import FlowControl, PublisherOptions, ReceivedMessage
 
 from fastpubsub import observability
 from fastpubsub.clients.scheduler import AsyncScheduler
 from fastpubsub.concurrency.utils import apply_async
-from fastpubsub.datastructures import DeadLetterPolicy, MessageDeliveryPolicy, MessageRetryPolicy
-from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.logger import logger
 
-DEFAULT_PUBSUB_TIMEOUT = 20.0
-DEFAULT_PULL_TIMEOUT = 120.0
 DEFAULT_PUSH_TIMEOUT = 60.0
+DEFAULT_PULL_TIMEOUT = 10.0
 
 
 class PubSubClient:
@@ -46,173 +38,6 @@ class PubSubClient:
         if self.subscriber_client and not self.subscriber_client.closed:
             self.subscriber_client.transport.close()
 
-    def _create_subscription_request(
-        self,
-        topic_name: str,
-        subscription_name: str,
-        retry_policy: MessageRetryPolicy,
-        delivery_policy: MessageDeliveryPolicy,
-        dead_letter_policy: DeadLetterPolicy | None = None,
-    ) -> Subscription:
-        name = SubscriberClient.subscription_path(self.project_id, subscription_name)
-        topic = SubscriberClient.topic_path(self.project_id, topic_name)
-
-        dlt_policy = None
-        if dead_letter_policy:
-            dlt_topic = SubscriberClient.topic_path(
-                self.project_id,
-                dead_letter_policy.topic_name,
-            )
-
-            dlt_policy = DLTPolicy(
-                dead_letter_topic=dlt_topic,
-                max_delivery_attempts=dead_letter_policy.max_delivery_attempts,
-            )
-
-        min_backoff_delay = timedelta(seconds=retry_policy.min_backoff_delay_secs)
-        max_backoff_delay = timedelta(seconds=retry_policy.max_backoff_delay_secs)
-        message_retry_policy = RetryPolicy(
-            minimum_backoff=min_backoff_delay, maximum_backoff=max_backoff_delay
-        )
-
-        return Subscription(
-            name=name,
-            topic=topic,
-            dead_letter_policy=dlt_policy,
-            retry_policy=message_retry_policy,
-            filter=delivery_policy.filter_expression,
-            ack_deadline_seconds=delivery_policy.ack_deadline_seconds,
-            enable_exactly_once_delivery=delivery_policy.enable_exactly_once_delivery,
-        )
-
-    async def create_subscription(
-        self,
-        topic_name: str,
-        subscription_name: str,
-        retry_policy: MessageRetryPolicy,
-        delivery_policy: MessageDeliveryPolicy,
-        dead_letter_policy: DeadLetterPolicy | None = None,
-    ) -> None:
-        """Creates a subscription.
-
-        Args:
-            topic_name: The name of the topic.
-            subscription_name: The name of the subscription.
-            retry_policy: The retry policy for the subscription.
-            delivery_policy: The delivery policy for the subscription.
-            dead_letter_policy: The dead-letter policy for the subscription.
-        """
-        subscription_request = self._create_subscription_request(
-            topic_name=topic_name,
-            subscription_name=subscription_name,
-            retry_policy=retry_policy,
-            delivery_policy=delivery_policy,
-            dead_letter_policy=dead_letter_policy,
-        )
-
-        with suppress(AlreadyExists):
-            logger.debug(f"Attempting to create subscription: {subscription_request.name}")
-            await apply_async(
-                self.subscriber_client.create_subscription,
-                request=subscription_request,
-                timeout=DEFAULT_PUBSUB_TIMEOUT,
-            )
-
-            logger.debug(f"Successfully created subscription: {subscription_request.name}")
-
-    async def update_subscription(
-        self,
-        topic_name: str,
-        subscription_name: str,
-        retry_policy: MessageRetryPolicy,
-        delivery_policy: MessageDeliveryPolicy,
-        dead_letter_policy: DeadLetterPolicy | None = None,
-    ) -> None:
-        """Updates a subscription.
-
-        Args:
-            topic_name: The name of the topic.
-            subscription_name: The name of the subscription.
-            retry_policy: The retry policy for the subscription.
-            delivery_policy: The delivery policy for the subscription.
-            dead_letter_policy: The dead-letter policy for the subscription.
-        """
-        subscription_request = self._create_subscription_request(
-            topic_name=topic_name,
-            subscription_name=subscription_name,
-            retry_policy=retry_policy,
-            delivery_policy=delivery_policy,
-            dead_letter_policy=dead_letter_policy,
-        )
-
-        update_fields = [
-            "ack_deadline_seconds",
-            "dead_letter_policy",
-            "retry_policy",
-            "enable_exactly_once_delivery",
-        ]
-
-        if not self.is_emulator:
-            update_fields.append("filter")
-
-        update_mask = FieldMask(paths=update_fields)
-
-        try:
-            logger.debug(f"Attempting to update the subscription: {subscription_request.name}")
-            response = await apply_async(
-                self.subscriber_client.update_subscription,
-                subscription=subscription_request,
-                update_mask=update_mask,
-                timeout=DEFAULT_PUBSUB_TIMEOUT,
-            )
-
-            logger.debug(f"Successfully updated the subscription: {subscription_request.name}")
-            logger.debug(f"The subscription is now following the configuration: {response}")
-        except NotFound as e:
-            raise FastPubSubException(
-                "We could not update the subscription configuration. "
-                f"The topic {subscription_request.topic} or "
-                f"subscription {subscription_request.name} were not found. "
-                "They may be deleted or not autocreated. "
-                "Please, setup your @subscriber with the 'autocreate=True' "
-                "option to automatically create them."
-            ) from e
-
-    async def create_topic(self, topic_name: str, create_default_subscription: bool = True) -> None:
-        """Creates a topic.
-
-        Args:
-            topic_name: The name of the topic.
-            create_default_subscription: Whether to create a default
-                subscription for the topic.
-        """
-        publisher = PublisherClient()
-        with suppress(AlreadyExists):
-            logger.debug(f"Creating topic '{topic_name}'.")
-            topic_path = PublisherClient.topic_path(self.project_id, topic_name)
-
-            topic = await apply_async(publisher.create_topic, name=topic_path)
-            logger.debug(f"Created topic '{topic.name}' sucessfully.")
-
-            if not create_default_subscription:
-                return
-
-            logger.debug(f"Creating default subscription for '{topic_path}'.")
-            default_subscription_path = SubscriberClient.subscription_path(
-                self.project_id, topic_name
-            )
-            subscription = await apply_async(
-                self.subscriber_client.create_subscription,
-                name=default_subscription_path,
-                topic=topic_path,
-                timeout=DEFAULT_PULL_TIMEOUT,
-            )
-
-            logger.debug(
-                "Creating default subscription created successfully for "
-                f"'{topic_path}' as {subscription.name}."
-            )
-
     async def publish(
         self,
         topic_name: str,
@@ -220,7 +45,7 @@ class PubSubClient:
         data: bytes,
         ordering_key: str,
         attributes: dict[str, str] | None,
-    ) -> None:
+    ) -> str:
         """Publishes a message.
 
         Args:
@@ -228,6 +53,9 @@ class PubSubClient:
             data: The message data.
             ordering_key: The ordering key for the message.
             attributes: A dictionary of message attributes.
+
+        Returns:
+            The id of the published message.
         """
         topic_path = PublisherClient.topic_path(self.project_id, topic_name)
         new_attributes = {} if attributes is None else attributes
@@ -250,6 +78,7 @@ class PubSubClient:
             message_id = await apply_async(response.result)
             logger.info(f"Message published for topic {topic_path} with id {message_id}")
             logger.debug(f"We sent {data!r} with metadata {attributes}")
+            return message_id
         except Exception:
             logger.exception("Publisher failure", stacklevel=5)
             raise
@@ -259,6 +88,8 @@ class PubSubClient:
         callback: Callable[[PubSubMessage], Any],
         subscription_name: str,
         max_messages: int,
+        min_lease_extension: int = 0,
+        max_lease_extension: int = 0,
     ) -> StreamingPullFuture:
         """Starts the subscription listening on backgroud given  a subscription.
 
@@ -266,6 +97,10 @@ class PubSubClient:
             callback: The function called when a message is received.
             subscription_name: The name of the subscription.
             max_messages: The maximum number of messages to pull.
+            min_lease_extension: The minimum seconds of each lease extension.
+                If 0, the client library default is used.
+            max_lease_extension: The maximum seconds of each lease extension.
+                If 0, the client library default is used.
 
         Returns:
             A future that can be used to check the progress and get the result.
@@ -275,7 +110,107 @@ class PubSubClient:
             callback=callback,
             subscription=subscription_path,
             scheduler=AsyncScheduler(),
-            flow_control=FlowControl(max_messages=max_messages),
+            flow_control=FlowControl(
+                max_messages=max_messages,
+                min_duration_per_lease_extension=min_lease_extension,
+                max_duration_per_lease_extension=max_lease_extension,
+            ),
             await_callbacks_on_shutdown=True,
         )
         return future
+
+    def update_lease_extension(
+        self, future: StreamingPullFuture, min_lease_extension: int, max_lease_extension: int
+    ) -> bool:
+        """Updates the bounds of the lease extensions of a running stream.
+
+        The client library has no public API for it, so the flow control
+        of the stream manager is replaced. It is read again on the next
+        lease extension.
+
+        Args:
+            future: The future of the stream.
+            min_lease_extension: The minimum seconds of each lease extension.
+            max_lease_extension: The maximum seconds of each lease extension.
+
+        Returns:
+            True if the stream was updated, False if it is not supported.
+        """
+        manager = getattr(future, "_StreamingPullFuture__manager", None)
+        flow_control = getattr(manager, "_flow_control", None)
+        if manager is None or not isinstance(flow_control, FlowControl):
+            return False
+
+        manager._flow_control = flow_control._replace(
+            min_duration_per_lease_extension=min_lease_extension,
+            max_duration_per_lease_extension=max_lease_extension,
+        )
+        return True
+
+    async def pull(
+        self, subscription_name: str, max_messages: int, timeout: float = DEFAULT_PULL_TIMEOUT
+    ) -> list[ReceivedMessage]:
+        """Pulls a batch of messages with the unary Pull API.
+
+        Args:
+            subscription_name: The name of the subscription.
+            max_messages: The maximum number of messages to pull.
+            timeout: The seconds to wait for the messages.
+
+        Returns:
+            The received messages. It is empty when the subscription has
+            no messages available until the timeout.
+        """
+        subscription_path = SubscriberClient.subscription_path(self.project_id, subscription_name)
+        try:
+            response = await apply_async(
+                self.subscriber_client.pull,
+                subscription=subscription_path,
+                max_messages=max_messages,
+                timeout=timeout,
+            )
+        except DeadlineExceeded:
+            return []
+
+        return list(response.received_messages)
+
+    async def acknowledge(self, subscription_name: str, ack_ids: list[str]) -> None:
+        """Acknowledges a batch of pulled messages.
+
+        Args:
+            subscription_name: The name of the subscription.
+            ack_ids: The ack ids of the messages.
+        """
+        if not ack_ids:
+            return
+
+        subscription_path = SubscriberClient.subscription_path(self.project_id, subscription_name)
+        await apply_async(
+            self.subscriber_client.acknowledge,
+            subscription=subscription_path,
+            ack_ids=ack_ids,
+            timeout=DEFAULT_PUSH_TIMEOUT,
+        )
+
+    async def modify_ack_deadline(
+        self, subscription_name: str, ack_ids: list[str], seconds: int
+    ) -> None:
+        """Modifies the ack deadline of a batch of pulled messages.
+
+        Args:
+            subscription_name: The name of the subscription.
+            ack_ids: The ack ids of the messages.
+            seconds: The new ack deadline. If 0, the messages are nacked
+                and redelivered right away.
+        """
+        if not ack_ids:
+            return
+
+        subscription_path = SubscriberClient.subscription_path(self.project_id, subscription_name)
+        await apply_async(
+            self.subscriber_client.modify_ack_deadline,
+            subscription=subscription_path,
+            ack_ids=ack_ids,
+            ack_deadline_seconds=seconds,
+            timeout=DEFAULT_PUSH_TIMEOUT,
+        )
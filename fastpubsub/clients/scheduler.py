@@ -2,11 +2,12 @@
 
 import asyncio
 import functools
+import itertools
 import queue
+import threading
 import warnings
 from collections.abc import Callable
 from typing import Any
-from weakref import WeakKeyDictionary
 
 from google.cloud.pubsub_v1.subscriber.message import Message as PubSubMessage
 from google.cloud.pubsub_v1.subscriber.scheduler import Scheduler
@@ -22,16 +23,16 @@ class AsyncScheduler(Scheduler):  # type: ignore[misc]
         """Initializes an asyncio-based schedule for typical I/O-bound message processing."""
         self._queue: queue.Queue[Any] = queue.Queue()
         self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
-        self._tasks: WeakKeyDictionary[asyncio.Handle, PubSubMessage] = WeakKeyDictionary()
+        self._pending: dict[int, tuple[asyncio.Handle, PubSubMessage]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
 
     @property
     def queue(self) -> queue.Queue[Any]:
         """A thread-safe queue for communication between callbacks and the scheduling thread."""
         return self._queue
 
-    def schedule(
-        self, callback: Callable[[Any], Any], *args: list[Any], **kwargs: dict[str, Any]
-    ) -> None:
+    def schedule(self, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
         """Schedule the callback to be called asynchronously in the event loop thread.
 
         Args:
@@ -40,11 +41,11 @@ class AsyncScheduler(Scheduler):  # type: ignore[misc]
             kwargs: Key-word arguments passed to the callback.
         """
         try:
+            key = next(self._counter)
             wrapped_callback = functools.partial(callback, *args, **kwargs)
-            handle = self._loop.call_soon_threadsafe(wrapped_callback)
-
-            message = args[0]
-            self._tasks[handle] = message
+            with self._lock:
+                handle = self._loop.call_soon_threadsafe(self._run, key, wrapped_callback)
+                self._pending[key] = (handle, args[0])
         except RuntimeError:
             warnings.warn(
                 "Scheduling a callback after executor shutdown.",
@@ -52,23 +53,35 @@ class AsyncScheduler(Scheduler):  # type: ignore[misc]
                 stacklevel=2,
             )
 
+    def _run(self, key: int, callback: Callable[[], Any]) -> None:
+        with self._lock:
+            if self._pending.pop(key, None) is None:
+                return
+
+        callback()
+
     def shutdown(self, await_msg_callbacks: bool = True) -> list[PubSubMessage]:
-        """Shuts down the scheduler and immediately cancel all executing tasks.
+        """Shuts down the scheduler and drops the callbacks that did not start yet.
+
+        The callbacks that already started run as asyncio tasks on the event
+        loop, which are drained by the subscriber task instead.
 
         Args:
-            await_msg_callbacks:
-                If ``True`` (default), the method will cancel the executing callbacks remaining.
-                This will allow a graceful termination of the messages execution.
-                If ``False``, the method will not cancel the callbacks.
+            await_msg_callbacks: Kept for compatibility with the scheduler
+                interface. The started callbacks are never awaited here, as
+                this method is called outside the event loop thread.
 
         Returns:
-            The messages dispatched to the asyncio loop that are currently
-            executed but did not completed yet.
+            The messages dispatched to the asyncio loop whose callbacks
+            did not start yet.
         """
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+
         dropped_messages = []
-        for handle, message in self._tasks.items():
+        for handle, message in pending:
+            handle.cancel()
             dropped_messages.append(message)
-            if not handle.cancelled() and await_msg_callbacks:
-                handle.cancel()
 
         return dropped_messages
@@ -0,0 +1,48 @@
+"""Backpressure signals consulted before dispatching the messages."""
+
+import asyncio
+
+from fastpubsub.types import BackpressureSignal
+
+BACKPRESSURE_CHECK_INTERVAL = 0.05
+
+
+def is_backpressured(signal: BackpressureSignal | None) -> bool:
+    """Checks if a backpressure signal is raised.
+
+    Args:
+        signal: The backpressure signal of a subscriber.
+
+    Returns:
+        True if the event is set or the callable returns True, False otherwise.
+    """
+    if signal is None:
+        return False
+
+    if isinstance(signal, asyncio.Event):
+        return signal.is_set()
+
+    return bool(signal())
+
+
+async def wait_for_backpressure(
+    signal: BackpressureSignal | None, interval: float = BACKPRESSURE_CHECK_INTERVAL
+) -> bool:
+    """Waits until a backpressure signal is lowered.
+
+    The signal is polled instead of awaited, so the same signal can be shared
+    by the subscribers running on different event loop threads.
+
+    Args:
+        signal: The backpressure signal of a subscriber.
+        interval: The seconds between each check of the signal.
+
+    Returns:
+        True if the signal was raised and the caller waited, False otherwise.
+    """
+    if not is_backpressured(signal):
+        return False
+
+    while is_backpressured(signal):
+        await asyncio.sleep(interval)
+    return True
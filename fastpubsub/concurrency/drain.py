@@ -0,0 +1,171 @@
+"""Batch consumption of the subscriptions with the unary Pull API."""
+
+import asyncio
+from dataclasses import dataclass
+
+from google.cloud.pubsub_v1.types import ReceivedMessage
+
+from fastpubsub.clients.pubsub import PubSubClient
+from fastpubsub.concurrency.backpressure import wait_for_backpressure
+from fastpubsub.concurrency.tasks import (
+    MessageMapper,
+    _contextualize,
+    handle_with_timeout_policy,
+)
+from fastpubsub.exceptions import Drop, Retry
+from fastpubsub.logger import logger
+from fastpubsub.observability import get_apm_provider
+from fastpubsub.pubsub.subscriber import Subscriber
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_PULL_CONCURRENCY = 4
+DEFAULT_EMPTY_PULLS = 2
+
+
+@dataclass(frozen=True)
+class DrainResult:
+    """The outcome of draining a subscriber."""
+
+    subscriber: str
+    received: int
+    acknowledged: int
+    nacked: int
+
+
+class SubscriptionDrainer:
+    """Consumes the backlog of a subscriber with the unary Pull API until it is empty.
+
+    Unlike the streaming pull, which waits for new messages forever, the
+    drainer pulls batches of messages concurrently and stops once the
+    subscriptions return no messages on consecutive pulls or the maximum
+    number of messages is received. The messages are not leased, so each
+    batch must be handled within the ack deadline of the subscription.
+    """
+
+    def __init__(
+        self,
+        subscriber: Subscriber,
+        max_messages: int = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_PULL_CONCURRENCY,
+        empty_pulls: int = DEFAULT_EMPTY_PULLS,
+    ) -> None:
+        """Initializes the SubscriptionDrainer.
+
+        Args:
+            subscriber: The subscriber to drain.
+            max_messages: The maximum number of messages received. If 0,
+                the subscriptions are drained until they are empty.
+            batch_size: The maximum number of messages of each pull.
+            concurrency: The number of concurrent pulls of each subscription.
+            empty_pulls: The number of consecutive pulls without messages
+                after which a subscription is considered empty.
+        """
+        self.subscriber = subscriber
+        self.client = PubSubClient(subscriber.project_id)
+        self.max_messages = max(0, max_messages)
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.empty_pulls = max(1, empty_pulls)
+        self._reserved = 0
+        self._received = 0
+        self._acknowledged = 0
+        self._nacked = 0
+        self._empty: dict[str, int] = {}
+
+    async def run(self) -> DrainResult:
+        """Drains the subscriptions of the subscriber.
+
+        Returns:
+            The number of messages received, acknowledged and nacked.
+        """
+        name = self.subscriber.name
+        logger.info(f"The {name} handler is draining its subscriptions.")
+
+        workers = [
+            self._pull_until_empty(subscription_name)
+            for subscription_name in self.subscriber.subscription_names
+            for _ in range(self.concurrency)
+        ]
+        await asyncio.gather(*workers)
+
+        apm = get_apm_provider()
+        apm.add_custom_metric(f"Custom/FastPubSub/Drain/{name}/Acknowledged", self._acknowledged)
+        apm.add_custom_metric(f"Custom/FastPubSub/Drain/{name}/Nacked", self._nacked)
+        logger.info(
+            f"The {name} handler received {self._received} messages, "
+            f"acknowledged {self._acknowledged} and nacked {self._nacked}."
+        )
+        return DrainResult(
+            subscriber=name,
+            received=self._received,
+            acknowledged=self._acknowledged,
+            nacked=self._nacked,
+        )
+
+    async def _pull_until_empty(self, subscription_name: str) -> None:
+        self._empty.setdefault(subscription_name, 0)
+        while self._empty[subscription_name] < self.empty_pulls:
+            # The budget is reserved before pulling, so the concurrent pulls
+            # never receive more messages than the maximum.
+            batch_size = self._reserve()
+            if not batch_size:
+                return
+
+            received_messages = await self.client.pull(subscription_name, batch_size)
+            self._reserved -= batch_size - len(received_messages)
+            if not received_messages:
+                self._empty[subscription_name] += 1
+                continue
+
+            self._empty[subscription_name] = 0
+            self._received += len(received_messages)
+            await self._handle_batch(subscription_name, received_messages)
+
+    def _reserve(self) -> int:
+        if not self.max_messages:
+            return self.batch_size
+
+        batch_size = min(self.batch_size, self.max_messages - self._reserved)
+        self._reserved += batch_size
+        return batch_size
+
+    async def _handle_batch(
+        self, subscription_name: str, received_messages: list[ReceivedMessage]
+    ) -> None:
+        outcomes = await asyncio.gather(
+            *(self._consume(received_message) for received_message in received_messages)
+        )
+
+        ack_ids: list[str] = []
+        nack_ids: list[str] = []
+        for received_message, acknowledged in zip(received_messages, outcomes, strict=True):
+            target = ack_ids if acknowledged else nack_ids
+            target.append(received_message.ack_id)
+
+        await asyncio.gather(
+            self.client.acknowledge(subscription_name, ack_ids),
+            self.client.modify_ack_deadline(subscription_name, nack_ids, 0),
+        )
+        self._acknowledged += len(ack_ids)
+        self._nacked += len(nack_ids)
+
+    async def _consume(self, received_message: ReceivedMessage) -> bool:
+        mapper = MessageMapper()
+        message = mapper.convert_pulled(received_message)
+        with _contextualize(self.subscriber.name, self.subscriber.topic_name, message):
+            try:
+                await wait_for_backpressure(self.subscriber.backpressure)
+                callstack = self.subscriber._build_callstack()
+                await handle_with_timeout_policy(self.subscriber, callstack, message)
+                logger.info("The message successfully processed.")
+                return True
+            except Drop:
+                logger.info("The message will be dropped.")
+                return True
+            except Retry:
+                logger.warning("The message will be retried later.")
+                return False
+            except Exception:
+                logger.exception("Unhandled exception on message", stacklevel=5)
+                return False
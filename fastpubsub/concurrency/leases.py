@@ -0,0 +1,88 @@
+"""Lease management based on the observed handler latency."""
+
+import math
+from collections import deque
+
+MIN_ACK_DEADLINE = 10
+MAX_ACK_DEADLINE = 600
+DEFAULT_MAX_SAMPLES = 10_000
+LEASE_MARGIN = 1.5
+
+
+class LatencyHistogram:
+    """A histogram of the most recent handler latencies in whole seconds.
+
+    Only the latest samples are kept, so the percentiles follow the changes
+    on the handler latency instead of its whole history.
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        """Initializes the LatencyHistogram.
+
+        Args:
+            max_samples: The number of most recent samples kept.
+        """
+        self.max_samples = max(1, max_samples)
+        self._samples: deque[int] = deque()
+        self._counts: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        """The number of samples on the histogram."""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Records a handler latency.
+
+        Args:
+            seconds: The latency in seconds. It is rounded up to a whole
+                second between one and the maximum ack deadline.
+        """
+        if len(self._samples) == self.max_samples:
+            evicted = self._samples.popleft()
+            self._counts[evicted] -= 1
+            if not self._counts[evicted]:
+                del self._counts[evicted]
+
+        value = min(MAX_ACK_DEADLINE, max(1, math.ceil(seconds)))
+        self._samples.append(value)
+        self._counts[value] = self._counts.get(value, 0) + 1
+
+    def percentile(self, percent: float) -> int:
+        """Gets a percentile of the recorded latencies.
+
+        Args:
+            percent: The percentile between 0 and 100.
+
+        Returns:
+            The latency in whole seconds, or zero if there are no samples.
+        """
+        target = len(self._samples) * percent / 100
+        running = 0
+        for value in sorted(self._counts):
+            running += self._counts[value]
+            if running >= target:
+                return value
+        return 0
+
+
+def get_lease_extension_bounds(histogram: LatencyHistogram) -> tuple[int, int]:
+    """Computes the bounds of the lease extensions from the handler latency.
+
+    The minimum extension covers the 99th percentile of the latency, so slow
+    handlers keep their leases, while the maximum extension covers the 99.9th
+    percentile, so the messages of a crashed consumer are redelivered soon.
+    Both have a safety margin and stay inside the Pub/Sub ack deadline range.
+
+    Args:
+        histogram: The latencies of the handler.
+
+    Returns:
+        The minimum and maximum seconds of each lease extension.
+    """
+    minimum = _to_ack_deadline(histogram.percentile(99) * LEASE_MARGIN)
+    maximum = _to_ack_deadline(histogram.percentile(99.9) * LEASE_MARGIN)
+    return minimum, max(minimum, maximum)
+
+
+def _to_ack_deadline(seconds: float) -> int:
+    return min(MAX_ACK_DEADLINE, max(MIN_ACK_DEADLINE, math.ceil(seconds)))
@@ -0,0 +1,177 @@
+"""Event loop selection."""
+
+import asyncio
+import importlib.util
+import threading
+from collections.abc import Callable, Coroutine
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from fastpubsub.exceptions import FastPubSubException
+from fastpubsub.logger import logger
+from fastpubsub.types import EventLoopType
+
+T = TypeVar("T")
+
+
+def resolve_event_loop(loop: EventLoopType = "auto") -> EventLoopType:
+    """Resolves the event loop implementation to use.
+
+    Args:
+        loop: The requested event loop. The 'auto' option uses uvloop
+            when it is installed and asyncio otherwise.
+
+    Returns:
+        Either 'asyncio' or 'uvloop'.
+    """
+    uvloop_installed = importlib.util.find_spec("uvloop") is not None
+    if loop == "auto":
+        return "uvloop" if uvloop_installed else "asyncio"
+
+    if loop == "uvloop" and not uvloop_installed:
+        raise FastPubSubException(
+            "The uvloop event loop is not installed. Please install it using 'pip install uvloop'."
+        )
+    return loop
+
+
+def get_event_loop_factory(
+    loop: EventLoopType = "auto",
+) -> Callable[[], asyncio.AbstractEventLoop]:
+    """Gets a factory of new event loops of the requested implementation.
+
+    Args:
+        loop: The requested event loop.
+
+    Returns:
+        A callable that creates a new event loop.
+    """
+    if resolve_event_loop(loop) == "uvloop":
+        import uvloop
+
+        return uvloop.new_event_loop
+
+    return asyncio.new_event_loop
+
+
+def run_with_event_loop(  # noqa: UP047
+    coroutine: Coroutine[Any, Any, T], loop: EventLoopType = "auto"
+) -> T:
+    """Runs a coroutine until it completes on a new event loop of the requested implementation.
+
+    Args:
+        coroutine: The coroutine to run.
+        loop: The requested event loop.
+
+    Returns:
+        The result of the coroutine.
+    """
+    with asyncio.Runner(loop_factory=get_event_loop_factory(loop)) as runner:
+        return runner.run(coroutine)
+
+
+def get_running_event_loop_type() -> EventLoopType:
+    """Gets the implementation of the running event loop.
+
+    Returns:
+        Either 'asyncio' or 'uvloop'.
+    """
+    loop = asyncio.get_running_loop()
+    return "uvloop" if type(loop).__module__.startswith("uvloop") else "asyncio"
+
+
+class EventLoopThread:
+    """An event loop running on a dedicated daemon thread."""
+
+    def __init__(self, name: str, loop: EventLoopType = "auto") -> None:
+        """Initializes the EventLoopThread.
+
+        Args:
+            name: The name of the thread.
+            loop: The event loop implementation.
+        """
+        self.name = name
+        self.loop_type = loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> None:
+        """Starts the thread and waits until its event loop is running."""
+        self._thread.start()
+        self._started.wait()
+        if not self._loop:
+            raise FastPubSubException(f"The event loop thread {self.name} failed to start.")
+
+        logger.debug(f"The event loop thread {self.name} is running.")
+
+    def call(self, func: Callable[[], T], timeout: float | None = None) -> T:
+        """Calls a function inside the event loop of the thread and waits for its result.
+
+        Args:
+            func: The function to call.
+            timeout: The seconds to wait for the result.
+
+        Returns:
+            The result of the function.
+        """
+        if not self._loop or not self.is_alive():
+            raise FastPubSubException(f"The event loop thread {self.name} is not running.")
+
+        async def _call() -> T:
+            return func()
+
+        return asyncio.run_coroutine_threadsafe(_call(), self._loop).result(timeout)
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        """Runs a coroutine inside the event loop of the thread.
+
+        Args:
+            coroutine: The coroutine to run.
+
+        Returns:
+            A future with the result of the coroutine.
+        """
+        if not self._loop or not self.is_alive():
+            coroutine.close()
+            raise FastPubSubException(f"The event loop thread {self.name} is not running.")
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def is_alive(self) -> bool:
+        """Checks if the thread and its event loop are running.
+
+        Returns:
+            True if it is running, False otherwise.
+        """
+        return self._thread.is_alive()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops the event loop and waits for the thread to finish.
+
+        The tasks still running on the event loop are cancelled.
+
+        Args:
+            timeout: The seconds to wait for the thread to finish.
+        """
+        if self._loop and self._stop_event and self.is_alive():
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+
+        if self._thread.ident is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            with asyncio.Runner(loop_factory=get_event_loop_factory(self.loop_type)) as runner:
+                runner.run(self._serve())
+        except Exception:
+            logger.exception(f"The event loop thread {self.name} crashed.")
+        finally:
+            self._started.set()
+
+    async def _serve(self) -> None:
+        self._stop_event = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._started.set()
+        await self._stop_event.wait()
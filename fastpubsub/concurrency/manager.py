@@ -1,50 +1,333 @@
 """Task manager for subscriber tasks."""
 
+import asyncio
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from functools import partial
+
+from google.cloud.pubsub_v1.subscriber.futures import StreamingPullFuture
+
+from fastpubsub.concurrency.loops import EventLoopThread, get_running_event_loop_type
+from fastpubsub.concurrency.retry import FATAL_GCP_EXCEPTIONS, full_jitter_backoff
 from fastpubsub.concurrency.tasks import PubSubStreamingPullTask
+from fastpubsub.concurrency.utils import apply_async
+from fastpubsub.exceptions import FastPubSubException
+from fastpubsub.logger import logger
+from fastpubsub.observability import get_apm_provider
 from fastpubsub.pubsub.subscriber import Subscriber
+from fastpubsub.types import PauseBehavior
 
+EVENT_LOOP_SHUTDOWN_TIMEOUT = 30.0
+DEFAULT_DRAIN_TIMEOUT = 20.0
+STREAM_INITIAL_BACKOFF = 1.0
+STREAM_MAX_BACKOFF = 60.0
+STREAM_STABLE_AFTER = 60.0
 
-class AsyncTaskManager:
-    """Public-facing controller for managing a fleet of subscriber tasks."""
 
+class _StreamState:
     def __init__(self) -> None:
-        """Initializes the AsyncTaskManager."""
+        self.attempts = 0
+        self.started_at = time.monotonic()
+        self.reconnect: asyncio.TimerHandle | None = None
+
+
+class AsyncTaskManager:
+    """Public-facing controller for managing a fleet of subscriber tasks.
+
+    The manager supervises the streams of the tasks. A stream closed by a
+    retryable error is reopened after a jittered backoff, so the subscriber
+    only stops being alive when its stream fails with a fatal error.
+    """
+
+    def __init__(self, event_loops: int = 0, drain_timeout: float = DEFAULT_DRAIN_TIMEOUT) -> None:
+        """Initializes the AsyncTaskManager.
+
+        Args:
+            event_loops: The number of event loop threads the subscribers
+                are sharded across. Each thread runs its subscribers with
+                their own scheduler and clients. If 0, the subscribers run
+                on the event loop that starts the manager.
+            drain_timeout: The seconds to wait for the messages in flight
+                on shutdown before nacking them.
+        """
+        self.event_loops = max(0, event_loops)
+        self.drain_timeout = drain_timeout
         self._tasks: list[PubSubStreamingPullTask] = []
+        self._subscribers: list[Subscriber] = []
+        self._threads: list[EventLoopThread] = []
+        self._task_threads: dict[int, EventLoopThread] = {}
+        self._streams: dict[tuple[int, int], _StreamState] = {}
+        self._restarts: dict[str, int] = {}
+        self._closing = False
 
     def create_task(self, subscriber: Subscriber) -> None:
         """Registers a subscriber configuration to be managed."""
+        if self.event_loops:
+            self._subscribers.append(subscriber)
+            return
+
         self._tasks.append(PubSubStreamingPullTask(subscriber))
 
     def start(self) -> None:
         """Starts the subscribers tasks process using a task group."""
+        if self._subscribers:
+            self._start_on_event_loop_threads()
+            return
+
         for task in self._tasks:
             task.start()
+            self._supervise(task)
+
+    def _start_on_event_loop_threads(self) -> None:
+        # The threads use the same event loop implementation of the application.
+        loop = get_running_event_loop_type()
+        count = min(self.event_loops, len(self._subscribers))
+        self._threads = [
+            EventLoopThread(name=f"fastpubsub-loop-{index}", loop=loop) for index in range(count)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        for index, subscriber in enumerate(self._subscribers):
+            thread = self._threads[index % count]
+            task = thread.call(partial(self._start_task, subscriber))
+            self._task_threads[id(task)] = thread
+            self._tasks.append(task)
+
+        self._subscribers.clear()
+        logger.info(f"Started {len(self._tasks)} subscribers on {count} event loop threads.")
+
+    def _start_task(self, subscriber: Subscriber) -> PubSubStreamingPullTask:
+        task = PubSubStreamingPullTask(subscriber)
+        task.start()
+        self._supervise(task)
+        return task
+
+    def _supervise(self, task: PubSubStreamingPullTask) -> None:
+        self._restarts.setdefault(task.subscriber.name, 0)
+        for index, future in enumerate(task.tasks):
+            self._watch(task, index, future)
+
+    def _watch(
+        self, task: PubSubStreamingPullTask, index: int, future: StreamingPullFuture
+    ) -> None:
+        stream = self._streams.setdefault((id(task), index), _StreamState())
+        stream.started_at = time.monotonic()
+        future.add_done_callback(partial(self._on_stream_closed, task, index))
+
+    def _on_stream_closed(
+        self, task: PubSubStreamingPullTask, index: int, future: StreamingPullFuture
+    ) -> None:
+        # The future is completed by the client threads, so the stream is
+        # handled on the event loop of its task.
+        with suppress(RuntimeError):
+            task.loop.call_soon_threadsafe(self._handle_stream_closed, task, index, future)
+
+    def _handle_stream_closed(
+        self, task: PubSubStreamingPullTask, index: int, future: StreamingPullFuture
+    ) -> None:
+        if self._closing or future.cancelled():
+            return
+
+        error = future.exception()
+        if isinstance(error, FATAL_GCP_EXCEPTIONS):
+            get_apm_provider().add_custom_metric(
+                f"Custom/FastPubSub/StreamingPull/{task.subscriber.name}/Failed", 1
+            )
+            logger.error(
+                f"The stream of the {task.subscriber.name} subscriber failed "
+                f"with a fatal error: {error!r}"
+            )
+            return
+
+        self._schedule_reconnect(task, index, error)
+
+    def _schedule_reconnect(
+        self, task: PubSubStreamingPullTask, index: int, error: BaseException | None
+    ) -> None:
+        stream = self._streams[(id(task), index)]
+        if time.monotonic() - stream.started_at >= STREAM_STABLE_AFTER:
+            stream.attempts = 0
+
+        backoff = full_jitter_backoff(stream.attempts, STREAM_INITIAL_BACKOFF, STREAM_MAX_BACKOFF)
+        stream.attempts += 1
+        stream.reconnect = task.loop.call_later(backoff, self._reconnect, task, index)
+        logger.warning(
+            f"The stream of the {task.subscriber.name} subscriber was closed ({error!r}), "
+            f"reconnecting in {backoff:.3f}s."
+        )
+
+    def _reconnect(self, task: PubSubStreamingPullTask, index: int) -> None:
+        self._streams[(id(task), index)].reconnect = None
+        if self._closing:
+            return
+
+        try:
+            future = task.reopen(index)
+        except Exception as e:
+            logger.exception(f"The stream of the {task.subscriber.name} subscriber failed to open.")
+            self._schedule_reconnect(task, index, e)
+            return
+
+        self._restarts[task.subscriber.name] += 1
+        get_apm_provider().add_custom_metric(
+            f"Custom/FastPubSub/StreamingPull/{task.subscriber.name}/Restarts", 1
+        )
+        logger.info(f"The stream of the {task.subscriber.name} subscriber was reopened.")
+        self._watch(task, index, future)
+
+    def _is_reconnecting(self, task: PubSubStreamingPullTask) -> bool:
+        closed = [index for index, future in enumerate(task.tasks) if future.done()]
+        return bool(closed) and all(
+            self._streams[(id(task), index)].reconnect is not None
+            for index in closed
+            if (id(task), index) in self._streams
+        )
 
     def alive(self) -> dict[str, bool]:
         """Checks if the tasks are alive.
 
+        It is safe to call from any thread. The tasks reconnecting their
+        streams are alive, while the tasks of an event loop thread that
+        stopped are not.
+
         Returns:
             A dictionary mapping task names to their liveness status.
         """
         liveness: dict[str, bool] = {}
         for pull_task in self._tasks:
-            liveness[pull_task.subscriber.name] = pull_task.task_alive()
+            liveness[pull_task.subscriber.name] = self._is_thread_alive(pull_task) and (
+                pull_task.task_alive() or self._is_reconnecting(pull_task)
+            )
         return liveness
 
     def ready(self) -> dict[str, bool]:
         """Checks if the tasks are ready.
 
+        It is safe to call from any thread. The tasks of an event loop
+        thread that stopped are not ready.
+
         Returns:
             A dictionary mapping task names to their readiness status.
         """
         readiness: dict[str, bool] = {}
         for task in self._tasks:
-            readiness[task.subscriber.name] = task.task_ready()
+            readiness[task.subscriber.name] = self._is_thread_alive(task) and task.task_ready()
         return readiness
 
-    def shutdown(self) -> None:
-        """Terminates the manager process and all its children gracefully."""
+    def _is_thread_alive(self, task: PubSubStreamingPullTask) -> bool:
+        thread = self._task_threads.get(id(task))
+        return thread.is_alive() if thread else True
+
+    def restarts(self) -> dict[str, int]:
+        """Gets the number of times the streams of each task were reopened.
+
+        Returns:
+            A dictionary mapping task names to their number of restarts.
+        """
+        return dict(self._restarts)
+
+    async def pause(self, name: str, behavior: PauseBehavior = "hold") -> None:
+        """Stops dispatching new messages to the handler of a task.
+
+        Args:
+            name: The name of the task.
+            behavior: What happens with the messages received while paused:
+                'hold' keeps their leases until the task is resumed and 'nack'
+                closes the streams and redelivers them.
+        """
+        task = self._get_task(name)
+        await self._call_on_event_loop(task, partial(self._pause_task, task, behavior))
+
+    async def resume(self, name: str) -> None:
+        """Dispatches the messages to the handler of a paused task again.
+
+        Args:
+            name: The name of the task.
+        """
+        task = self._get_task(name)
+        await self._call_on_event_loop(task, partial(self._resume_task, task))
+
+    def _get_task(self, name: str) -> PubSubStreamingPullTask:
         for task in self._tasks:
-            task.shutdown()
+            if task.subscriber.name == name:
+                return task
+
+        raise FastPubSubException(f"The {name} subscriber is not running.")
+
+    async def _call_on_event_loop(
+        self, task: PubSubStreamingPullTask, func: Callable[[], None]
+    ) -> None:
+        thread = self._task_threads.get(id(task))
+        if not thread:
+            func()
+            return
+
+        await apply_async(thread.call, func)
+
+    def _pause_task(self, task: PubSubStreamingPullTask, behavior: PauseBehavior) -> None:
+        if behavior == "nack":
+            # The closed streams must not be reopened while the task is paused
+            self._cancel_reconnects(task)
+
+        task.pause(behavior)
+        get_apm_provider().add_custom_metric(
+            f"Custom/FastPubSub/Pause/{task.subscriber.name}/Paused", 1
+        )
+
+    def _resume_task(self, task: PubSubStreamingPullTask) -> None:
+        for index in task.resume():
+            self._watch(task, index, task.tasks[index])
+
+        get_apm_provider().add_custom_metric(
+            f"Custom/FastPubSub/Pause/{task.subscriber.name}/Resumed", 1
+        )
+
+    def _cancel_reconnects(self, task: PubSubStreamingPullTask) -> None:
+        for (task_id, _), stream in self._streams.items():
+            if task_id == id(task) and stream.reconnect:
+                stream.reconnect.cancel()
+                stream.reconnect = None
+
+    async def shutdown(self) -> None:
+        """Drains and terminates the tasks gracefully.
+
+        The tasks are drained at the same time, each one on its own event
+        loop, so the drain timeout bounds the whole shutdown.
+        """
+        self._closing = True
+        await asyncio.gather(*(self._shutdown_on_event_loop(task) for task in self._tasks))
+
+        for thread in self._threads:
+            await apply_async(thread.stop, timeout=EVENT_LOOP_SHUTDOWN_TIMEOUT)
 
         self._tasks.clear()
+        self._threads.clear()
+        self._task_threads.clear()
+        self._streams.clear()
+
+    async def _shutdown_on_event_loop(self, task: PubSubStreamingPullTask) -> None:
+        thread = self._task_threads.get(id(task))
+        if not thread:
+            await self._shutdown_task(task)
+        elif thread.is_alive():
+            await asyncio.wrap_future(thread.submit(self._shutdown_task(task)))
+        else:
+            task.shutdown()
+
+    async def _shutdown_task(self, task: PubSubStreamingPullTask) -> None:
+        self._cancel_reconnects(task)
+
+        name = task.subscriber.name
+        try:
+            drained, nacked = await task.drain(self.drain_timeout)
+        except Exception:
+            logger.exception(f"The {name} handler failed to drain its messages.")
+        else:
+            apm = get_apm_provider()
+            apm.add_custom_metric(f"Custom/FastPubSub/Shutdown/{name}/Drained", drained)
+            apm.add_custom_metric(f"Custom/FastPubSub/Shutdown/{name}/Nacked", nacked)
+            logger.info(f"The {name} handler drained {drained} messages and nacked {nacked}.")
+        finally:
+            task.shutdown()
@@ -0,0 +1,77 @@
+"""Rate limiting utilities."""
+
+import asyncio
+import threading
+import time
+
+from fastpubsub.exceptions import RateLimitExceeded
+from fastpubsub.logger import logger
+from fastpubsub.observability import get_apm_provider
+from fastpubsub.types import RateLimitBehavior
+
+
+class TokenBucketRateLimiter:
+    """A token bucket rate limiter for asynchronous operations."""
+
+    def __init__(
+        self,
+        name: str,
+        max_rate: float,
+        burst: int | None = None,
+        on_limit: RateLimitBehavior = "wait",
+    ) -> None:
+        """Initializes the TokenBucketRateLimiter.
+
+        Args:
+            name: The name of the limiter used on logs and metrics.
+            max_rate: The maximum number of operations per second.
+            burst: The maximum number of operations allowed at once.
+                If not set, it is the rate rounded up.
+            on_limit: Whether to 'wait' for a token or 'raise' a
+                RateLimitExceeded exception when the limit is hit.
+        """
+        if max_rate <= 0:
+            raise ValueError(f"The max rate of '{name}' must be positive but it is {max_rate}.")
+
+        self.name = name
+        self.max_rate = max_rate
+        self.burst = max(1, burst if burst else int(max_rate + 0.999))
+        self.on_limit = on_limit
+        self.throttled = 0
+
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Takes a token from the bucket, waiting or raising if it is empty."""
+        wait_time = self._reserve()
+        if wait_time <= 0:
+            return
+
+        self.throttled += 1
+        get_apm_provider().add_custom_metric(f"Custom/FastPubSub/RateLimited/{self.name}", 1)
+
+        if self.on_limit == "raise":
+            raise RateLimitExceeded(
+                f"The rate limit of {self.max_rate} operations/s was hit on '{self.name}'."
+            )
+
+        logger.debug(f"The rate limit was hit on '{self.name}', waiting {wait_time:.3f}s.")
+        await asyncio.sleep(wait_time)
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.max_rate)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+            wait_time = (1 - self._tokens) / self.max_rate
+            if self.on_limit == "wait":
+                self._tokens -= 1
+            return wait_time
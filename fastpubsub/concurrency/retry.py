@@ -0,0 +1,178 @@
+"""Retry utilities."""
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from functools import cache
+from typing import TypeVar
+
+from google.api_core.exceptions import (
+    Aborted,
+    Cancelled,
+    DeadlineExceeded,
+    GatewayTimeout,
+    InternalServerError,
+    InvalidArgument,
+    NotFound,
+    PermissionDenied,
+    ResourceExhausted,
+    ServiceUnavailable,
+    Unauthenticated,
+    Unauthorized,
+    Unknown,
+)
+
+from fastpubsub.datastructures import PublishRetryPolicy
+from fastpubsub.logger import logger
+from fastpubsub.observability import get_apm_provider
+
+T = TypeVar("T")
+
+RETRYABLE_GCP_EXCEPTIONS = (
+    Aborted,
+    DeadlineExceeded,
+    GatewayTimeout,
+    InternalServerError,
+    ResourceExhausted,
+    ServiceUnavailable,
+    Unknown,
+)
+
+FATAL_GCP_EXCEPTIONS = (
+    Cancelled,
+    InvalidArgument,
+    NotFound,
+    PermissionDenied,
+    Unauthenticated,
+    Unauthorized,
+)
+
+
+def full_jitter_backoff(
+    attempt: int, initial_backoff: float, max_backoff: float, multiplier: float = 2.0
+) -> float:
+    """Computes a capped exponential backoff with full jitter.
+
+    Args:
+        attempt: The number of the failed attempt, starting at zero.
+        initial_backoff: The backoff ceiling of the first attempt in seconds.
+        max_backoff: The maximum backoff ceiling in seconds.
+        multiplier: The growth factor of the backoff ceiling per attempt.
+
+    Returns:
+        A random backoff in seconds between zero and the ceiling.
+    """
+    ceiling = min(max_backoff, initial_backoff * multiplier**attempt)
+    return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """A token-based budget that throttles retries when most calls are failing.
+
+    Every failure withdraws one token and every success deposits a fraction of
+    a token. Retries are only allowed while more than half of the tokens remain,
+    so a service brownout does not multiply the load with retries.
+    """
+
+    def __init__(self, max_tokens: float = 100.0, token_ratio: float = 0.1) -> None:
+        """Initializes the RetryBudget.
+
+        Args:
+            max_tokens: The maximum number of tokens on the budget.
+            token_ratio: The number of tokens deposited by each success.
+        """
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently on the budget."""
+        return self._tokens
+
+    def can_retry(self) -> bool:
+        """Checks if the budget allows a retry.
+
+        Returns:
+            True if a retry is allowed, False otherwise.
+        """
+        return self._tokens > self.max_tokens / 2
+
+    def on_success(self) -> None:
+        """Deposits tokens for a successful call."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def on_failure(self) -> None:
+        """Withdraws a token for a failed call."""
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+
+
+@cache
+def get_retry_budget() -> RetryBudget:
+    """Gets the retry budget shared by the whole process.
+
+    Returns:
+        The shared retry budget.
+    """
+    return RetryBudget()
+
+
+async def call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    *,
+    name: str,
+    policy: PublishRetryPolicy,
+    budget: RetryBudget | None = None,
+) -> T:
+    """Calls an async function retrying it on retryable Google Cloud errors.
+
+    Args:
+        func: The async function to call.
+        name: The name of the operation used on logs and metrics.
+        policy: The retry policy to follow.
+        budget: The retry budget to draw from. If not set, the
+            budget shared by the process is used.
+
+    Returns:
+        The result of the function.
+    """
+    apm = get_apm_provider()
+    retry_budget = budget or get_retry_budget()
+    started_at = time.monotonic()
+
+    attempt = 0
+    while True:
+        apm.add_custom_metric(f"Custom/FastPubSub/Retry/{name}/Attempts", 1)
+        try:
+            result = await func()
+        except RETRYABLE_GCP_EXCEPTIONS as e:
+            retry_budget.on_failure()
+
+            backoff = full_jitter_backoff(
+                attempt, policy.initial_backoff, policy.max_backoff, policy.multiplier
+            )
+            elapsed = time.monotonic() - started_at
+            attempt += 1
+
+            if attempt >= policy.max_attempts or elapsed + backoff > policy.deadline:
+                apm.add_custom_metric(f"Custom/FastPubSub/Retry/{name}/Exhausted", 1)
+                logger.error(f"The retries of '{name}' were exhausted after {attempt} attempts.")
+                raise
+
+            if not retry_budget.can_retry():
+                apm.add_custom_metric(f"Custom/FastPubSub/Retry/{name}/Throttled", 1)
+                logger.error(f"The retry budget is exhausted, '{name}' will not be retried.")
+                raise
+
+            logger.warning(f"Retrying '{name}' in {backoff:.3f}s after failure: {e!r}")
+            await asyncio.sleep(backoff)
+            continue
+
+        retry_budget.on_success()
+        apm.add_custom_metric(f"Custom/FastPubSub/Retry/{name}/Succeeded", 1)
+        return result
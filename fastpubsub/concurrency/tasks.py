@@ -1,55 +1,32 @@
 """Subscriber task for polling messages."""
 
 import asyncio
-from collections.abc import Generator
+import time
+from collections.abc import Callable, Generator
 from concurrent.futures import Future
 from contextlib import contextmanager
 from typing import Any
 
-from google.api_core.exceptions import (
-    Aborted,
-    Cancelled,
-    DeadlineExceeded,
-    GatewayTimeout,
-    InternalServerError,
-    InvalidArgument,
-    NotFound,
-    PermissionDenied,
-    ResourceExhausted,
-    ServiceUnavailable,
-    Unauthenticated,
-    Unauthorized,
-    Unknown,
-)
 from google.cloud.pubsub_v1.subscriber.exceptions import AcknowledgeError, AcknowledgeStatus
 from google.cloud.pubsub_v1.subscriber.futures import StreamingPullFuture
 from google.cloud.pubsub_v1.subscriber.message import Message as PubSubMessage
+from google.cloud.pubsub_v1.types import PubsubMessage, ReceivedMessage
 
 from fastpubsub.clients.pubsub import PubSubClient
+from fastpubsub.concurrency.backpressure import wait_for_backpressure
+from fastpubsub.concurrency.leases import LatencyHistogram, get_lease_extension_bounds
 from fastpubsub.datastructures import Message
 from fastpubsub.exceptions import Drop, Retry
 from fastpubsub.logger import logger
+from fastpubsub.middlewares.base import BaseMiddleware
 from fastpubsub.observability import get_apm_provider
+from fastpubsub.pubsub.commands import HandleMessageCommand
 from fastpubsub.pubsub.subscriber import Subscriber
+from fastpubsub.types import PauseBehavior
 
-RETRYABLE_GCP_EXCEPTIONS = (
-    Aborted,
-    DeadlineExceeded,
-    GatewayTimeout,
-    InternalServerError,
-    ResourceExhausted,
-    ServiceUnavailable,
-    Unknown,
-)
-
-FATAL_GCP_EXCEPTIONS = (
-    Cancelled,
-    InvalidArgument,
-    NotFound,
-    PermissionDenied,
-    Unauthenticated,
-    Unauthorized,
-)
+CANCELLATION_TIMEOUT = 5.0
+LEASE_TUNING_INTERVAL = 30.0
+LEASE_TUNING_MIN_SAMPLES = 100
 
 
 @contextmanager
@@ -67,6 +44,49 @@ def _contextualize(name: str, topic_name: str, message: Message) -> Generator[No
             yield
 
 
+async def handle_with_timeout_policy(
+    subscriber: Subscriber,
+    callstack: HandleMessageCommand | BaseMiddleware,
+    message: Message,
+    on_timeout: Callable[[], None] | None = None,
+) -> Any:
+    """Handles a message within the timeout policy of its subscriber.
+
+    Args:
+        subscriber: The subscriber of the message.
+        callstack: The middlewares and handler of the subscriber.
+        message: The message to handle.
+        on_timeout: A callable called when the handler times out.
+
+    Returns:
+        The handler response.
+
+    Raises:
+        Drop: If the handler timed out and the policy drops the message.
+        Retry: If the handler timed out and the policy retries the message.
+    """
+    policy = subscriber.timeout_policy
+    if not policy:
+        return await callstack.on_message(message)
+
+    try:
+        async with asyncio.timeout(policy.timeout) as deadline:
+            return await callstack.on_message(message)
+    except TimeoutError:
+        if not deadline.expired():
+            raise
+
+        if on_timeout:
+            on_timeout()
+        get_apm_provider().add_custom_metric(
+            f"Custom/FastPubSub/HandlerTimeout/{subscriber.name}", 1
+        )
+        logger.error(f"The handler was cancelled after the {policy.timeout}s timeout.")
+        if policy.behavior == "drop":
+            raise Drop from None
+        raise Retry from None
+
+
 class MessageMapper:
     """A mapper used to deserialize a Pub/Sub message into a fastpubsub.Message class."""
 
@@ -91,6 +111,24 @@ class MessageMapper:
             delivery_attempt=delivery_attempt,
         )
 
+    def convert_pulled(self, received_message: ReceivedMessage) -> Message:
+        """Converts a message pulled with the unary Pull API into a fastpubsub.Message.
+
+        Args:
+            received_message: The message pulled from the subscription.
+
+        Returns:
+            A fastpubsub.Message object.
+        """
+        pubsub_message = received_message.message
+        return Message(
+            id=pubsub_message.message_id,
+            data=pubsub_message.data,
+            size=PubsubMessage.pb(pubsub_message).ByteSize(),
+            attributes=dict(pubsub_message.attributes),
+            delivery_attempt=received_message.delivery_attempt,
+        )
+
 
 class PubSubStreamingPullTask:
     """A task for polling messages from a Pub/Sub subscription with StreamingPull API."""
@@ -103,54 +141,183 @@ class PubSubStreamingPullTask:
         """
         self.subscriber: Subscriber = subscriber
         self.client = PubSubClient(self.subscriber.project_id)
-        self.task: StreamingPullFuture | None = None
+        self.tasks: list[StreamingPullFuture] = []
         self.loop = asyncio.get_running_loop()
+        self._consumers: set[asyncio.Task[Any]] = set()
+        self.handler_timeouts = 0
+        self.latency = LatencyHistogram()
+        self.lease_extension = (0, 0)
+        self._lease_tuner: asyncio.TimerHandle | None = None
+        self._draining = False
+        self._rejected = 0
+        self._paused: PauseBehavior | None = None
+        self._held: list[PubSubMessage] = []
 
     def start(self) -> None:
         """Starts the message polling loop."""
         logger.info(f"The {self.subscriber.name} handler is waiting for messages.")
-        future = self.client.subscribe(
+
+        # The list is replaced at once, as the health checks may read it
+        # from another thread when the task runs on an event loop thread.
+        tasks = list(self.tasks)
+        for subscription_name in self.subscriber.subscription_names:
+            tasks.append(self._subscribe(subscription_name))
+        self.tasks = tasks
+        self._lease_tuner = self.loop.call_later(LEASE_TUNING_INTERVAL, self._tune_lease)
+
+    def reopen(self, index: int) -> StreamingPullFuture:
+        """Reopens a stream of the task after it was closed.
+
+        Args:
+            index: The index of the stream on the task futures.
+
+        Returns:
+            The future of the new stream.
+        """
+        future = self._subscribe(self.subscriber.subscription_names[index])
+        tasks = list(self.tasks)
+        tasks[index] = future
+        self.tasks = tasks
+        return future
+
+    def _subscribe(self, subscription_name: str) -> StreamingPullFuture:
+        # The shards share the flow control budget of the subscriber
+        subscription_names = self.subscriber.subscription_names
+        max_messages = self.subscriber.control_flow_policy.max_messages
+        shard_max_messages = max(1, max_messages // len(subscription_names))
+
+        min_lease_extension, max_lease_extension = self.lease_extension
+        return self.client.subscribe(
             callback=self._on_message,
-            subscription_name=self.subscriber.subscription_name,
-            max_messages=self.subscriber.control_flow_policy.max_messages,
+            subscription_name=subscription_name,
+            max_messages=shard_max_messages,
+            min_lease_extension=min_lease_extension,
+            max_lease_extension=max_lease_extension,
         )
 
-        self.task = future
+    def _tune_lease(self) -> None:
+        self._lease_tuner = self.loop.call_later(LEASE_TUNING_INTERVAL, self._tune_lease)
+        self.tune_lease()
+
+    def tune_lease(self) -> bool:
+        """Adapts the lease extensions of the streams to the handler latency.
+
+        The streams keep leasing the messages for as long as the handler
+        usually takes, instead of the static ack deadline of the
+        subscription. It is skipped until enough latencies are recorded.
+
+        Returns:
+            True if the lease extensions changed, False otherwise.
+        """
+        if len(self.latency) < LEASE_TUNING_MIN_SAMPLES:
+            return False
+
+        lease_extension = get_lease_extension_bounds(self.latency)
+        if lease_extension == self.lease_extension:
+            return False
+
+        self.lease_extension = lease_extension
+        min_lease_extension, max_lease_extension = lease_extension
+        for task in self.tasks:
+            self.client.update_lease_extension(task, min_lease_extension, max_lease_extension)
+
+        apm = get_apm_provider()
+        apm.add_custom_metric(
+            f"Custom/FastPubSub/Lease/{self.subscriber.name}/MinExtension", min_lease_extension
+        )
+        apm.add_custom_metric(
+            f"Custom/FastPubSub/Lease/{self.subscriber.name}/MaxExtension", max_lease_extension
+        )
+        logger.info(
+            f"The {self.subscriber.name} handler leases are extended by "
+            f"{min_lease_extension}s to {max_lease_extension}s."
+        )
+        return True
 
     def _on_message(self, received_message: PubSubMessage) -> Any:
+        if self._draining:
+            # The lease of the messages received while draining is released
+            # at once, so they are redelivered to another consumer.
+            received_message.nack()
+            self._rejected += 1
+            return None
+
+        if self._paused == "hold":
+            # The client keeps leasing the held messages, and the flow control
+            # stops the stream once max_messages are held.
+            self._held.append(received_message)
+            return None
+
+        if self._paused == "nack":
+            received_message.nack()
+            return None
+
+        return self._dispatch(received_message)
+
+    def _dispatch(self, received_message: PubSubMessage) -> asyncio.Task[Any]:
+        # The loop only keeps weak references to its tasks, so the running
+        # consumers are referenced here until they finish.
         coroutine = self._consume(received_message)
-        return self.loop.create_task(coroutine)
+        task = self.loop.create_task(coroutine)
+        self._consumers.add(task)
+        task.add_done_callback(self._consumers.discard)
+        return task
 
     async def _consume(self, received_message: PubSubMessage) -> Any:
         mapper = MessageMapper()
         message = mapper.convert(received_message)
         with _contextualize(self.subscriber.name, self.subscriber.topic_name, message):
             try:
+                if await wait_for_backpressure(self.subscriber.backpressure):
+                    get_apm_provider().add_custom_metric(
+                        f"Custom/FastPubSub/Backpressure/{self.subscriber.name}/Held", 1
+                    )
+
                 callstack = self.subscriber._build_callstack()
-                response = await callstack.on_message(message)
+                response = await self._handle(callstack, message)
                 future = received_message.ack_with_response()
-                self._wait_acknowledge_response(future=future)
+                await self._wait_acknowledge_response(future=future)
                 logger.info("The message successfully processed.")
                 return response
             except Drop:
                 future = received_message.ack_with_response()
-                self._wait_acknowledge_response(future=future)
+                await self._wait_acknowledge_response(future=future)
                 logger.info("The message will be dropped.")
                 return
             except Retry:
                 future = received_message.nack_with_response()
-                self._wait_acknowledge_response(future=future)
+                await self._wait_acknowledge_response(future=future)
                 logger.warning("The message will be retried later.")
                 return
             except Exception:
                 future = received_message.nack_with_response()
-                self._wait_acknowledge_response(future=future)
+                await self._wait_acknowledge_response(future=future)
                 logger.exception("Unhandled exception on message", stacklevel=5)
                 return
+            except asyncio.CancelledError:
+                received_message.nack()
+                logger.warning("The message handling was cancelled. It will be redelivered.")
+                raise
 
-    def _wait_acknowledge_response(self, future: Future[Any]) -> None:
+    async def _handle(
+        self, callstack: HandleMessageCommand | BaseMiddleware, message: Message
+    ) -> Any:
+        started_at = time.monotonic()
         try:
-            future.result(timeout=60)
+            return await handle_with_timeout_policy(
+                self.subscriber, callstack, message, on_timeout=self._on_handler_timeout
+            )
+        finally:
+            self.latency.record(time.monotonic() - started_at)
+
+    def _on_handler_timeout(self) -> None:
+        self.handler_timeouts += 1
+
+    async def _wait_acknowledge_response(self, future: Future[Any]) -> None:
+        # The acknowledge future is completed by the client threads, so it is
+        # awaited through the loop instead of blocking it.
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(future), timeout=60)
         except AcknowledgeError as e:
             self._on_acknowledge_failed(e)
         except TimeoutError:
@@ -183,10 +350,13 @@ class PubSubStreamingPullTask:
         Returns:
             True if the task is ready, False otherwise.
         """
-        if not self.task or not isinstance(self.task, StreamingPullFuture):
+        if self._paused == "nack":
+            return True
+
+        if not self.tasks:
             return False
 
-        return bool(self.task.running())
+        return all(task.running() for task in self.tasks)
 
     def task_alive(self) -> bool:
         """Checks if the task is alive.
@@ -194,13 +364,112 @@ class PubSubStreamingPullTask:
         Returns:
             True if the task is alive, False otherwise.
         """
-        if not self.task or not isinstance(self.task, StreamingPullFuture):
+        if self._paused == "nack":
+            return True
+
+        if not self.tasks:
             return False
 
-        return not bool(self.task.done())
+        return not any(task.done() for task in self.tasks)
+
+    @property
+    def paused(self) -> bool:
+        """Whether the task is paused."""
+        return self._paused is not None
+
+    def pause(self, behavior: PauseBehavior = "hold") -> None:
+        """Stops dispatching new messages to the handler.
+
+        The messages already being handled are not affected. With the 'hold'
+        behavior the streams stay open and the messages received while paused
+        keep their leases until the task is resumed. With the 'nack' behavior
+        the streams are closed and the held messages are redelivered.
+
+        Args:
+            behavior: What happens with the messages received while paused.
+        """
+        self._paused = behavior
+        logger.info(f"The {self.subscriber.name} handler is paused ({behavior}).")
+        if behavior == "hold":
+            return
+
+        for task in self.tasks:
+            if task.running():
+                task.cancel()
+
+        held, self._held = self._held, []
+        for received_message in held:
+            received_message.nack()
+
+    def resume(self) -> list[int]:
+        """Dispatches the held messages and the new ones to the handler again.
+
+        Returns:
+            The indexes of the streams reopened, when they were closed by
+            the 'nack' behavior.
+        """
+        behavior, self._paused = self._paused, None
+        if behavior is None:
+            return []
+
+        reopened: list[int] = []
+        if behavior == "nack":
+            for index in range(len(self.tasks)):
+                self.reopen(index)
+                reopened.append(index)
+
+        held, self._held = self._held, []
+        for received_message in held:
+            self._dispatch(received_message)
+
+        logger.info(
+            f"The {self.subscriber.name} handler is resumed with {len(held)} held messages."
+        )
+        return reopened
+
+    async def drain(self, timeout: float) -> tuple[int, int]:
+        """Waits for the messages in flight before the task is shut down.
+
+        The streams stay open while draining, so the handled messages can
+        still be acknowledged, but the new messages are nacked at once. The
+        handlers still running after the timeout are cancelled and their
+        messages are nacked to be redelivered right away instead of after
+        their ack deadline.
+
+        Args:
+            timeout: The seconds to wait for the running handlers.
+
+        Returns:
+            The number of messages drained and the number of messages nacked.
+        """
+        self._draining = True
+        held, self._held = self._held, []
+        for received_message in held:
+            received_message.nack()
+        self._rejected += len(held)
+
+        in_flight = set(self._consumers)
+        if not in_flight:
+            return 0, self._rejected
+
+        logger.info(
+            f"The {self.subscriber.name} handler is draining {len(in_flight)} messages "
+            f"for up to {timeout:.1f}s."
+        )
+        done, pending = await asyncio.wait(in_flight, timeout=timeout)
+        for consumer in pending:
+            consumer.cancel()
+
+        if pending:
+            await asyncio.wait(pending, timeout=CANCELLATION_TIMEOUT)
+
+        return len(done), len(pending) + self._rejected
 
     def shutdown(self) -> None:
         """Shuts down the task."""
         logger.info(f"The {self.subscriber.name} handler is turning off...")
-        if self.task and self.task.running():
-            self.task.cancel()
+        if self._lease_tuner:
+            self._lease_tuner.cancel()
+        for task in self.tasks:
+            if task.running():
+                task.cancel()
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from fastpubsub.types import HandlerTimeoutBehavior
+
 
 @dataclass(frozen=True)
 class Message:
@@ -41,6 +43,17 @@ class MessageRetryPolicy:
     max_backoff_delay_secs: int
 
 
+@dataclass(frozen=True)
+class PublishRetryPolicy:
+    """A class to represent a publish retry policy."""
+
+    max_attempts: int = 5
+    initial_backoff: float = 0.1
+    max_backoff: float = 10.0
+    multiplier: float = 2.0
+    deadline: float = 60.0
+
+
 @dataclass(frozen=True)
 class DeadLetterPolicy:
     """A class to represent a dead-letter policy."""
@@ -49,6 +62,14 @@ class DeadLetterPolicy:
     max_delivery_attempts: int
 
 
+@dataclass(frozen=True)
+class HandlerTimeoutPolicy:
+    """A class to represent a handler timeout policy."""
+
+    timeout: float
+    behavior: HandlerTimeoutBehavior = "retry"
+
+
 @dataclass(frozen=True)
 class LifecyclePolicy:
     """A class to represent a lifecycle policy."""
@@ -57,14 +78,13 @@ class LifecyclePolicy:
     autoupdate: bool
 
 
-# TODO: Create an example for that
 class PushMessageContent(BaseModel):
     """A class to represent a Pub/Sub message data sent via Push."""
 
     model_config = ConfigDict(validate_by_alias=True)
 
     id: str = Field(alias="messageId", title="The message id")
-    data: str = Field(title="The message content base64-encoded")
+    data: str = Field("", title="The message content base64-encoded")
     publish_time: str = Field(alias="publishTime", title="The publish datetime of the message")
     attributes: dict[str, str] = Field({}, title="The attributes of the message")
 
@@ -72,5 +92,10 @@ class PushMessageContent(BaseModel):
 class PushMessage(BaseModel):
     """A class to represent a Pub/Sub message sent via Push."""
 
+    model_config = ConfigDict(validate_by_alias=True)
+
     subscription: str
     message: PushMessageContent
+    delivery_attempt: int = Field(
+        0, alias="deliveryAttempt", title="The delivery attempt when a dead-letter is set"
+    )
@@ -21,3 +21,7 @@ class Retry(Exception):
 
     Raising it results in a ack on the message.
     """
+
+
+class RateLimitExceeded(FastPubSubException):
+    """Exception raised when a publish rate limit is hit."""
@@ -0,0 +1,167 @@
+"""A minimal health check responder for consumer-only applications."""
+
+import asyncio
+import json
+import signal
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Protocol
+
+from fastpubsub.applications import Application, FastPubSub
+from fastpubsub.logger import logger
+
+DEFAULT_LIVENESS_URL = "/consumers/alive"
+DEFAULT_READINESS_URL = "/consumers/ready"
+REQUEST_TIMEOUT = 5.0
+MAX_REQUEST_SIZE = 8192
+
+
+class HealthProbe(Protocol):
+    """Anything that can tell whether the consumers are alive and ready."""
+
+    def alive(self) -> bool:
+        """Checks if the consumers are alive."""
+        ...
+
+    def ready(self) -> bool:
+        """Checks if the consumers are ready."""
+        ...
+
+
+class HealthServer:
+    """A raw socket responder that serves the liveness and readiness probes.
+
+    It only understands the request line of HTTP/1.x GET requests, which is
+    enough for orchestrator probes without booting a full ASGI server.
+    """
+
+    def __init__(
+        self,
+        probe: HealthProbe,
+        host: str,
+        port: int,
+        liveness_url: str = DEFAULT_LIVENESS_URL,
+        readiness_url: str = DEFAULT_READINESS_URL,
+    ) -> None:
+        """Initializes the HealthServer.
+
+        Args:
+            probe: The object checked by the probes, usually a broker.
+            host: The host to bind to.
+            port: The port to bind to.
+            liveness_url: The url path of the liveness probe.
+            readiness_url: The url path of the readiness probe.
+        """
+        self.probe = probe
+        self.host = host
+        self.port = port
+        self.liveness_url = liveness_url
+        self.readiness_url = readiness_url
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Starts listening for probes."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"Health probes served on http://{self.host}:{self.port}.")
+
+    async def stop(self) -> None:
+        """Stops listening for probes."""
+        if not self._server:
+            return
+
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), REQUEST_TIMEOUT)
+            status, content = self._route(request[:MAX_REQUEST_SIZE])
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, TimeoutError):
+            status, content = "400 Bad Request", {}
+
+        body = json.dumps(content).encode(encoding="utf-8")
+        headers = (
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+
+        with suppress(ConnectionError):
+            writer.write(headers.encode(encoding="latin-1") + body)
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+    def _route(self, request: bytes) -> tuple[str, dict[str, bool]]:
+        request_line = request.split(b"\r\n", 1)[0].decode(encoding="latin-1")
+        parts = request_line.split(" ")
+        if len(parts) != 3:
+            return "400 Bad Request", {}
+
+        method, target, _ = parts
+        path = target.split("?", 1)[0]
+        if path not in (self.liveness_url, self.readiness_url):
+            return "404 Not Found", {}
+
+        if method != "GET":
+            return "405 Method Not Allowed", {}
+
+        if path == self.liveness_url:
+            alive = self.probe.alive()
+            return ("200 OK" if alive else "500 Internal Server Error"), {"alive": alive}
+
+        ready = self.probe.ready()
+        return ("200 OK" if ready else "500 Internal Server Error"), {"ready": ready}
+
+
+async def serve_without_http(application: Application, host: str, port: int) -> None:
+    """Runs the application lifecycle on the current event loop without an ASGI server.
+
+    The application runs until the process receives SIGINT or SIGTERM. The
+    health probes are served by a HealthServer on the given host and port.
+
+    Args:
+        application: The application to run.
+        host: The host of the health probes.
+        port: The port of the health probes.
+    """
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_event.set)
+
+    health_server = HealthServer(probe=application.broker, host=host, port=port)
+    if isinstance(application, FastPubSub):
+        health_server.liveness_url = application.liveness_url
+        health_server.readiness_url = application.readiness_url
+
+    try:
+        async with application_lifespan(application):
+            await health_server.start()
+            try:
+                logger.info("FastPubSub consumers running without the HTTP server.")
+                await stop_event.wait()
+            finally:
+                await health_server.stop()
+    finally:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+
+
+@asynccontextmanager
+async def application_lifespan(application: Application) -> AsyncIterator[None]:
+    """Starts and shuts down an application around the context.
+
+    Args:
+        application: The application to run.
+    """
+    if isinstance(application, FastPubSub):
+        async with application._run(application):
+            yield
+        return
+
+    await application._start()
+    yield
+    await application._shutdown()
@@ -1,9 +1,27 @@
 """Middlewares for FastPubSub."""
 
 from fastpubsub.middlewares.base import BaseMiddleware
+from fastpubsub.middlewares.claimcheck import (
+    BlobStore,
+    ClaimCheckMiddleware,
+    FileSystemBlobStore,
+)
+from fastpubsub.middlewares.deduplication import (
+    DeduplicationMiddleware,
+    DeduplicationStore,
+    MemoryDeduplicationStore,
+    SQLiteDeduplicationStore,
+)
 from fastpubsub.middlewares.gzip import GZipMiddleware
 
 __all__ = [
     "BaseMiddleware",
+    "BlobStore",
+    "ClaimCheckMiddleware",
+    "DeduplicationMiddleware",
+    "DeduplicationStore",
+    "FileSystemBlobStore",
     "GZipMiddleware",
+    "MemoryDeduplicationStore",
+    "SQLiteDeduplicationStore",
 ]
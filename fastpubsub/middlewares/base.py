@@ -4,7 +4,11 @@ from abc import abstractmethod
 from typing import Any, Union
 
 from fastpubsub.datastructures import Message
-from fastpubsub.pubsub.commands import HandleMessageCommand, PublishMessageCommand
+from fastpubsub.pubsub.commands import (
+    FanOutPublishCommand,
+    HandleMessageCommand,
+    PublishMessageCommand,
+)
 
 
 class BaseMiddleware:
@@ -15,7 +19,13 @@ class BaseMiddleware:
     """
 
     def __init__(
-        self, next_call: Union["BaseMiddleware", "PublishMessageCommand", "HandleMessageCommand"]
+        self,
+        next_call: Union[
+            "BaseMiddleware",
+            "PublishMessageCommand",
+            "FanOutPublishCommand",
+            "HandleMessageCommand",
+        ],
     ):
         """Initializes the BaseMiddleware.
 
@@ -34,7 +44,7 @@ class BaseMiddleware:
         Args:
             message: The message to handle.
         """
-        if isinstance(self.next_call, PublishMessageCommand):
+        if isinstance(self.next_call, PublishMessageCommand | FanOutPublishCommand):
             raise TypeError(f"Incorrect middleware stack build for {self.__class__.__name__}")
 
         if not self.next_call:
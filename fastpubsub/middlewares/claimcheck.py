@@ -0,0 +1,225 @@
+"""Claim-check middleware for FastPubSub."""
+
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, BinaryIO
+from uuid import uuid4
+
+from fastpubsub.concurrency.utils import apply_async
+from fastpubsub.datastructures import Message
+from fastpubsub.exceptions import FastPubSubException
+from fastpubsub.middlewares.base import BaseMiddleware
+
+CLAIM_CHECK_ATTRIBUTE = "X-FastPubSub-Claim-Check"
+CLAIM_CHECK_SIZE_ATTRIBUTE = "X-FastPubSub-Claim-Check-Size"
+
+
+class BlobStore(ABC):
+    """Abstract base class defining the contract for any claim-check blob store."""
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> str:
+        """Stores a payload and returns the reference used to fetch it later."""
+        pass
+
+    @abstractmethod
+    def get(self, reference: str) -> bytes:
+        """Fetches the whole payload stored under the reference."""
+        pass
+
+    @abstractmethod
+    def open(self, reference: str) -> BinaryIO:
+        """Opens a binary stream over the payload stored under the reference."""
+        pass
+
+
+class FileSystemBlobStore(BlobStore):
+    """A blob store that keeps the payloads as files in a local directory."""
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initializes the FileSystemBlobStore.
+
+        Args:
+            directory: The directory where the payloads are stored.
+        """
+        self.directory = Path(directory).resolve()
+
+    def put(self, key: str, data: bytes) -> str:
+        """Stores a payload atomically on the directory.
+
+        Args:
+            key: The unique key of the payload.
+            data: The payload content.
+
+        Returns:
+            The reference of the stored payload.
+        """
+        path = self._resolve(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(data)
+
+        os.replace(temporary_path, path)
+        return key
+
+    def get(self, reference: str) -> bytes:
+        """Fetches a payload from the directory.
+
+        Args:
+            reference: The reference of the payload.
+
+        Returns:
+            The payload content.
+        """
+        return self._resolve(reference).read_bytes()
+
+    def open(self, reference: str) -> BinaryIO:
+        """Opens a payload file for streaming.
+
+        Args:
+            reference: The reference of the payload.
+
+        Returns:
+            A binary file object over the payload.
+        """
+        return self._resolve(reference).open("rb")
+
+    def _resolve(self, reference: str) -> Path:
+        path = (self.directory / reference).resolve()
+        if path.parent != self.directory:
+            raise FastPubSubException(f"The claim-check reference '{reference}' is invalid.")
+        return path
+
+
+class ClaimCheckMessage(Message):
+    """A message whose payload is only fetched from the blob store when accessed."""
+
+    _reference: str
+    _blob_store: BlobStore
+
+    def __init__(
+        self,
+        *,
+        id: str,
+        size: int,
+        attributes: dict[str, str],
+        delivery_attempt: int,
+        reference: str,
+        blob_store: BlobStore,
+    ) -> None:
+        """Initializes the ClaimCheckMessage.
+
+        Args:
+            id: The message id.
+            size: The size of the offloaded payload.
+            attributes: The attributes of the message.
+            delivery_attempt: The delivery attempt of the message.
+            reference: The claim-check reference of the payload.
+            blob_store: The blob store holding the payload.
+        """
+        object.__setattr__(self, "_reference", reference)
+        object.__setattr__(self, "_blob_store", blob_store)
+        super().__init__(
+            id=id, size=size, data=b"", attributes=attributes, delivery_attempt=delivery_attempt
+        )
+
+    @property
+    def data(self) -> bytes:
+        """The payload of the message, fetched from the blob store on first access."""
+        payload: bytes | None = self.__dict__.get("_payload")
+        if payload is None:
+            payload = self._blob_store.get(self._reference)
+            object.__setattr__(self, "_payload", payload)
+        return payload
+
+    @data.setter
+    def data(self, value: bytes) -> None:
+        object.__setattr__(self, "_payload", value or None)
+
+    @property
+    def reference(self) -> str:
+        """The claim-check reference of the payload."""
+        return self._reference
+
+    def open(self) -> BinaryIO:
+        """Opens a binary stream over the payload without loading it in memory.
+
+        Returns:
+            A binary file object over the payload.
+        """
+        return self._blob_store.open(self._reference)
+
+    def __repr__(self) -> str:
+        """Represents the message without fetching its payload."""
+        return (
+            f"{self.__class__.__name__}(id={self.id!r}, size={self.size!r}, "
+            f"reference={self.reference!r}, attributes={self.attributes!r}, "
+            f"delivery_attempt={self.delivery_attempt!r})"
+        )
+
+
+class ClaimCheckMiddleware(BaseMiddleware):
+    """A middleware that offloads oversized payloads to a blob store.
+
+    Extend this class to configure it, for example:
+
+        class MyClaimCheck(ClaimCheckMiddleware):
+            blob_store = FileSystemBlobStore("/mnt/payloads")
+            threshold = 512 * 1024
+    """
+
+    blob_store: BlobStore | None = None
+    threshold: int = 1024 * 1024
+
+    async def on_message(self, message: Message) -> Any:
+        """Replaces a claim-check message by a lazily fetched one.
+
+        Args:
+            message: The message to handle.
+        """
+        reference = message.attributes.get(CLAIM_CHECK_ATTRIBUTE) if message.attributes else None
+        if reference:
+            size = message.attributes.get(CLAIM_CHECK_SIZE_ATTRIBUTE, "")
+            message = ClaimCheckMessage(
+                id=message.id,
+                size=int(size) if size.isdigit() else message.size,
+                attributes=message.attributes,
+                delivery_attempt=message.delivery_attempt,
+                reference=reference,
+                blob_store=self._get_blob_store(),
+            )
+
+        return await super().on_message(message)
+
+    async def on_publish(
+        self, data: bytes, ordering_key: str, attributes: dict[str, str] | None
+    ) -> Any:
+        """Offloads the payload when it is above the threshold.
+
+        Args:
+            data: The message data.
+            ordering_key: The ordering key for the message.
+            attributes: A dictionary of message attributes.
+        """
+        if len(data) <= self.threshold:
+            return await super().on_publish(data, ordering_key, attributes)
+
+        blob_store = self._get_blob_store()
+        reference = await apply_async(blob_store.put, uuid4().hex, data)
+
+        attributes = dict(attributes) if attributes else {}
+        attributes[CLAIM_CHECK_ATTRIBUTE] = reference
+        attributes[CLAIM_CHECK_SIZE_ATTRIBUTE] = str(len(data))
+        return await super().on_publish(b"", ordering_key, attributes)
+
+    def _get_blob_store(self) -> BlobStore:
+        if not self.blob_store:
+            raise FastPubSubException(
+                f"The {self.__class__.__name__} has no blob store. "
+                "Please, extend it and set the 'blob_store' attribute."
+            )
+        return self.blob_store
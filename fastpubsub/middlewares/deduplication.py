@@ -0,0 +1,231 @@
+"""Deduplication middleware for FastPubSub."""
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from fastpubsub.datastructures import Message
+from fastpubsub.exceptions import FastPubSubException
+from fastpubsub.logger import logger
+from fastpubsub.middlewares.base import BaseMiddleware
+from fastpubsub.observability import get_apm_provider
+
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_SIZE = 100_000
+PURGE_INTERVAL = 1000
+
+
+class DeduplicationStore(ABC):
+    """Abstract base class defining the contract for any deduplication store."""
+
+    @abstractmethod
+    def contains(self, key: str) -> bool:
+        """Checks if a message key was already processed and did not expire."""
+        pass
+
+    @abstractmethod
+    def add(self, key: str) -> None:
+        """Marks a message key as processed."""
+        pass
+
+
+class MemoryDeduplicationStore(DeduplicationStore):
+    """A store that keeps the processed keys in memory with LRU eviction and expiration."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL) -> None:
+        """Initializes the MemoryDeduplicationStore.
+
+        Args:
+            max_size: The maximum number of keys kept. The least recently
+                used keys are evicted first.
+            ttl: The seconds a key is kept after being processed.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._keys: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """The number of keys on the store, including the expired ones."""
+        return len(self._keys)
+
+    def contains(self, key: str) -> bool:
+        """Checks if a key was processed.
+
+        Args:
+            key: The message key.
+
+        Returns:
+            True if the key was processed and did not expire, False otherwise.
+        """
+        with self._lock:
+            expires_at = self._keys.get(key)
+            if expires_at is None:
+                return False
+
+            if expires_at <= time.monotonic():
+                del self._keys[key]
+                return False
+
+            self._keys.move_to_end(key)
+            return True
+
+    def add(self, key: str) -> None:
+        """Marks a key as processed.
+
+        Args:
+            key: The message key.
+        """
+        with self._lock:
+            self._keys[key] = time.monotonic() + self.ttl
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.max_size:
+                self._keys.popitem(last=False)
+
+
+class SQLiteDeduplicationStore(DeduplicationStore):
+    """A store that keeps the processed keys on a local SQLite database.
+
+    The keys survive the restarts of the process. The database uses the
+    write-ahead log without syncing each commit, so a crash of the host
+    may lose the most recent keys but never blocks the handlers on disk.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = DEFAULT_TTL) -> None:
+        """Initializes the SQLiteDeduplicationStore.
+
+        Args:
+            path: The path of the database file.
+            ttl: The seconds a key is kept after being processed.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._additions = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS processed_messages "
+                "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+            )
+
+    def contains(self, key: str) -> bool:
+        """Checks if a key was processed.
+
+        Args:
+            key: The message key.
+
+        Returns:
+            True if the key was processed and did not expire, False otherwise.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM processed_messages WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row is not None
+
+    def add(self, key: str) -> None:
+        """Marks a key as processed and purges the expired keys from time to time.
+
+        Args:
+            key: The message key.
+        """
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO processed_messages (key, expires_at) VALUES (?, ?)",
+                (key, now + self.ttl),
+            )
+
+            self._additions += 1
+            if self._additions % PURGE_INTERVAL == 0:
+                self._connection.execute(
+                    "DELETE FROM processed_messages WHERE expires_at <= ?", (now,)
+                )
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class DeduplicationMiddleware(BaseMiddleware):
+    """A middleware that acknowledges the duplicated messages without handling them.
+
+    A message is only marked as processed after its handler succeeds, so
+    the messages that failed are still retried. Extend this class to
+    configure it, for example:
+
+        class MyDeduplication(DeduplicationMiddleware):
+            store = MemoryDeduplicationStore(max_size=50_000, ttl=600)
+
+            def get_key(self, message: Message) -> str:
+                return message.attributes["order_id"]
+    """
+
+    store: DeduplicationStore | None = None
+
+    def get_key(self, message: Message) -> str:
+        """Gets the key identifying a message.
+
+        Override it to deduplicate by a business key instead of the message id.
+
+        Args:
+            message: The received message.
+
+        Returns:
+            The key of the message.
+        """
+        return message.id
+
+    async def on_message(self, message: Message) -> Any:
+        """Skips the handler when the message was already processed.
+
+        Args:
+            message: The message to handle.
+        """
+        store = self._get_store()
+        key = self.get_key(message)
+
+        apm = get_apm_provider()
+        if store.contains(key):
+            apm.add_custom_metric(f"Custom/FastPubSub/Deduplication/{self._name}/Hits", 1)
+            logger.info("The message was already processed. It will be acknowledged.")
+            return None
+
+        apm.add_custom_metric(f"Custom/FastPubSub/Deduplication/{self._name}/Misses", 1)
+        response = await super().on_message(message)
+        store.add(key)
+        return response
+
+    async def on_publish(
+        self, data: bytes, ordering_key: str, attributes: dict[str, str] | None
+    ) -> Any:
+        """Publishes the message without changes.
+
+        Args:
+            data: The message data.
+            ordering_key: The ordering key for the message.
+            attributes: A dictionary of message attributes.
+        """
+        return await super().on_publish(data, ordering_key, attributes)
+
+    @property
+    def _name(self) -> str:
+        return self.__class__.__name__
+
+    def _get_store(self) -> DeduplicationStore:
+        if self.store is None:
+            raise FastPubSubException(
+                f"The {self._name} has no store. Please, extend it and set the 'store' attribute."
+            )
+        return self.store
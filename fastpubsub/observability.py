@@ -11,13 +11,23 @@ from typing import Any
 from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.logger import logger
 
-try:
-    import newrelic.agent
+_NOT_LOADED: Any = object()
+_new_relic_agent: Any = _NOT_LOADED
 
-    _new_relic_agent = newrelic.agent
-except ModuleNotFoundError:
-    _new_relic_agent = None
-    pass
+
+def _get_new_relic_agent() -> Any:
+    # The agent is imported by the first New Relic provider, so processes
+    # that do not use it never pay for its import.
+    global _new_relic_agent
+    if _new_relic_agent is _NOT_LOADED:
+        try:
+            import newrelic.agent
+
+            _new_relic_agent = newrelic.agent
+        except ModuleNotFoundError:
+            _new_relic_agent = None
+
+    return _new_relic_agent
 
 
 class ApmProvider(ABC):
@@ -229,13 +239,14 @@ class NewRelicProvider(ApmProvider):
 
     def __init__(self) -> None:
         """Initializes the NewRelicProvider."""
-        if not _new_relic_agent:
+        agent = _get_new_relic_agent()
+        if not agent:
             raise FastPubSubException(
                 "No newrelic agent found. "
                 "Please install it using 'pip install fastpubsub[newrelic]'."
             )
 
-        self._agent = _new_relic_agent
+        self._agent = agent
 
     def start(self) -> None:
         """Initializes and registers the agent if not already active."""
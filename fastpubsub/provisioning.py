@@ -0,0 +1,312 @@
+"""Provisioning of topics and subscriptions."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from anyio import CapacityLimiter, create_task_group
+from google.pubsub import Subscription
+
+from fastpubsub.clients.admin import get_admin_client
+from fastpubsub.exceptions import FastPubSubException
+from fastpubsub.logger import logger
+from fastpubsub.pubsub.publisher import Publisher
+from fastpubsub.pubsub.sharding import get_shard_names
+from fastpubsub.pubsub.subscriber import Subscriber
+from fastpubsub.types import ProvisioningAction
+
+DEFAULT_PROVISIONING_CONCURRENCY = 10
+DEFAULT_PROVISIONING_CACHE_TTL = 3600.0
+DEFAULT_PROVISIONING_CACHE_PATH = Path(tempfile.gettempdir()) / "fastpubsub-provisioning.json"
+
+
+def fingerprint_subscription(subscription: Subscription) -> str:
+    """Computes a fingerprint of the managed fields of a subscription.
+
+    Args:
+        subscription: The subscription to fingerprint.
+
+    Returns:
+        A hexadecimal digest that only changes when a managed field changes.
+    """
+    dead_letter_policy = subscription.dead_letter_policy
+    retry_policy = subscription.retry_policy
+    state = {
+        "name": subscription.name,
+        "topic": subscription.topic,
+        "filter": subscription.filter,
+        "ack_deadline_seconds": subscription.ack_deadline_seconds,
+        "enable_exactly_once_delivery": subscription.enable_exactly_once_delivery,
+        "dead_letter_topic": dead_letter_policy.dead_letter_topic,
+        "max_delivery_attempts": dead_letter_policy.max_delivery_attempts,
+        "minimum_backoff": _to_seconds(retry_policy.minimum_backoff),
+        "maximum_backoff": _to_seconds(retry_policy.maximum_backoff),
+    }
+
+    content = json.dumps(state, sort_keys=True).encode(encoding="utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def _to_seconds(duration: Any) -> float:
+    if not duration:
+        return 0.0
+    return float(duration.total_seconds())
+
+
+class ProvisioningCache:
+    """A local file that remembers which subscriptions are already provisioned."""
+
+    def __init__(self, path: str | Path, ttl: float = DEFAULT_PROVISIONING_CACHE_TTL) -> None:
+        """Initializes the ProvisioningCache.
+
+        Args:
+            path: The path of the cache file.
+            ttl: The number of seconds a provisioned state is trusted.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    @classmethod
+    def from_environment(cls) -> "ProvisioningCache | None":
+        """Creates the cache configured by the environment variables.
+
+        The cache file is set by FASTPUBSUB_PROVISIONING_CACHE and its TTL
+        in seconds by FASTPUBSUB_PROVISIONING_CACHE_TTL. A non-positive TTL
+        disables the cache.
+
+        Returns:
+            The configured cache or None if it is disabled.
+        """
+        path = os.getenv("FASTPUBSUB_PROVISIONING_CACHE", "") or DEFAULT_PROVISIONING_CACHE_PATH
+        ttl_text = os.getenv("FASTPUBSUB_PROVISIONING_CACHE_TTL", "")
+
+        try:
+            ttl = float(ttl_text) if ttl_text else DEFAULT_PROVISIONING_CACHE_TTL
+        except ValueError:
+            logger.warning(f"The provisioning cache TTL '{ttl_text}' is invalid, using default.")
+            ttl = DEFAULT_PROVISIONING_CACHE_TTL
+
+        if ttl <= 0:
+            return None
+
+        return cls(path=path, ttl=ttl)
+
+    def is_converged(self, key: str, fingerprint: str) -> bool:
+        """Checks if a resource was provisioned with the fingerprint within the TTL.
+
+        Args:
+            key: The resource path.
+            fingerprint: The fingerprint of the desired state.
+
+        Returns:
+            True if the cached state matches, False otherwise.
+        """
+        entry = self._entries.get(key)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+
+        return time.time() - float(entry.get("provisioned_at", 0)) < self.ttl
+
+    def store(self, key: str, fingerprint: str) -> None:
+        """Records that a resource was provisioned with the fingerprint.
+
+        Args:
+            key: The resource path.
+            fingerprint: The fingerprint of the provisioned state.
+        """
+        with self._lock:
+            self._entries[key] = {"fingerprint": fingerprint, "provisioned_at": time.time()}
+
+    def save(self) -> None:
+        """Writes the cache atomically, merging entries written by other processes."""
+        with self._lock:
+            entries = self._load()
+            entries.update(self._entries)
+            self._entries = entries
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                file_descriptor, temporary_path = tempfile.mkstemp(dir=self.path.parent)
+                with os.fdopen(file_descriptor, "w") as file:
+                    json.dump(entries, file)
+
+                os.replace(temporary_path, self.path)
+            except OSError as e:
+                logger.warning(f"Could not write the provisioning cache at '{self.path}': {e}")
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            content = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring the unreadable provisioning cache at '{self.path}': {e}")
+            return {}
+
+        if not isinstance(content, dict):
+            return {}
+        return content
+
+
+@dataclass(frozen=True)
+class ProvisioningChange:
+    """A change needed to converge a topic or subscription to the desired state."""
+
+    action: ProvisioningAction
+    name: str
+    topic_name: str = ""
+    create_default_subscription: bool = False
+    subscriber: Subscriber | None = field(default=None, compare=False, repr=False)
+
+
+class ProvisioningPlanner:
+    """Plans and applies the topics and subscriptions of an application."""
+
+    def __init__(
+        self, project_id: str, max_concurrency: int = DEFAULT_PROVISIONING_CONCURRENCY
+    ) -> None:
+        """Initializes the ProvisioningPlanner.
+
+        Args:
+            project_id: The Google Cloud project ID.
+            max_concurrency: The maximum number of concurrent admin calls.
+        """
+        self.client = get_admin_client(project_id)
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def plan(
+        self, subscribers: Sequence[Subscriber], publishers: Sequence[Publisher]
+    ) -> list[ProvisioningChange]:
+        """Diffs the desired topics and subscriptions against the live project.
+
+        Args:
+            subscribers: The subscribers whose topics and subscriptions are desired.
+            publishers: The publishers whose topics are desired.
+
+        Returns:
+            The changes needed to converge the project, topics first.
+        """
+        topics: dict[str, bool] = {}
+        for publisher in publishers:
+            for topic_name in get_shard_names(publisher.topic_name, publisher.shards):
+                topics.setdefault(topic_name, False)
+
+        for subscriber in subscribers:
+            for topic_name in subscriber.topic_names:
+                topics.setdefault(topic_name, False)
+
+            if subscriber.dead_letter_policy:
+                topics[subscriber.dead_letter_policy.topic_name] = True
+
+        changes: list[ProvisioningChange] = []
+        limiter = CapacityLimiter(self.max_concurrency)
+
+        async def _plan_topic(topic_name: str, create_default_subscription: bool) -> None:
+            async with limiter:
+                topic = await self.client.get_topic(topic_name)
+
+            if not topic:
+                change = ProvisioningChange(
+                    action="create_topic",
+                    name=topic_name,
+                    create_default_subscription=create_default_subscription,
+                )
+                changes.append(change)
+
+        async def _plan_subscription(
+            subscriber: Subscriber, topic_name: str, subscription_name: str
+        ) -> None:
+            desired_subscription = self.client._create_subscription_request(
+                topic_name=topic_name,
+                subscription_name=subscription_name,
+                retry_policy=subscriber.retry_policy,
+                delivery_policy=subscriber.delivery_policy,
+                dead_letter_policy=subscriber.dead_letter_policy,
+            )
+
+            async with limiter:
+                current_subscription = await self.client.get_subscription(subscription_name)
+
+            action: ProvisioningAction = "create_subscription"
+            if current_subscription:
+                current_fingerprint = fingerprint_subscription(current_subscription)
+                if current_fingerprint == fingerprint_subscription(desired_subscription):
+                    return
+                action = "update_subscription"
+
+            change = ProvisioningChange(
+                action=action, name=subscription_name, topic_name=topic_name, subscriber=subscriber
+            )
+            changes.append(change)
+
+        async with create_task_group() as tg:
+            for topic_name, create_default_subscription in topics.items():
+                tg.start_soon(_plan_topic, topic_name, create_default_subscription)
+
+            for subscriber in subscribers:
+                shards = zip(subscriber.topic_names, subscriber.subscription_names, strict=True)
+                for topic_name, subscription_name in shards:
+                    tg.start_soon(_plan_subscription, subscriber, topic_name, subscription_name)
+
+        order: dict[ProvisioningAction, int] = {
+            "create_topic": 0,
+            "create_subscription": 1,
+            "update_subscription": 2,
+        }
+        return sorted(changes, key=lambda change: (order[change.action], change.name))
+
+    async def apply(self, changes: Sequence[ProvisioningChange]) -> None:
+        """Applies the changes of a plan with batched concurrent calls.
+
+        The topics are created before the subscriptions that depend on them.
+
+        Args:
+            changes: The changes to apply.
+        """
+        limiter = CapacityLimiter(self.max_concurrency)
+
+        async def _apply(change: ProvisioningChange) -> None:
+            async with limiter:
+                await self._apply_change(change)
+            logger.info(f"Applied {change.action} on '{change.name}'.")
+
+        topic_changes = [change for change in changes if change.action == "create_topic"]
+        subscription_changes = [change for change in changes if change.action != "create_topic"]
+        for batch in (topic_changes, subscription_changes):
+            async with create_task_group() as tg:
+                for change in batch:
+                    tg.start_soon(_apply, change)
+
+    async def _apply_change(self, change: ProvisioningChange) -> None:
+        if change.action == "create_topic":
+            await self.client.create_topic(
+                topic_name=change.name,
+                create_default_subscription=change.create_default_subscription,
+            )
+            return
+
+        subscriber = change.subscriber
+        if not subscriber:
+            raise FastPubSubException(f"The change {change} has no subscriber to apply.")
+
+        apply_subscription = (
+            self.client.create_subscription
+            if change.action == "create_subscription"
+            else self.client.update_subscription
+        )
+        await apply_subscription(
+            topic_name=change.topic_name,
+            subscription_name=change.name,
+            retry_policy=subscriber.retry_policy,
+            delivery_policy=subscriber.delivery_policy,
+            dead_letter_policy=subscriber.dead_letter_policy,
+        )
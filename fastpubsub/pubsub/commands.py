@@ -1,9 +1,15 @@
 """Internal commands for handling and publishing messages."""
 
+import asyncio
+import functools
+from collections.abc import Mapping, Sequence
 from typing import Any
 
+from fastpubsub.clients.admin import get_admin_client
 from fastpubsub.clients.pubsub import PubSubClient
-from fastpubsub.datastructures import Message
+from fastpubsub.concurrency.ratelimit import TokenBucketRateLimiter
+from fastpubsub.concurrency.retry import call_with_retry
+from fastpubsub.datastructures import Message, PublishRetryPolicy
 from fastpubsub.types import AsyncCallable
 
 
@@ -34,17 +40,29 @@ class HandleMessageCommand:
 class PublishMessageCommand:
     """A command for publishing messages."""
 
-    def __init__(self, *, project_id: str, topic_name: str, autocreate: bool = True):
+    def __init__(
+        self,
+        *,
+        project_id: str,
+        topic_name: str,
+        autocreate: bool = True,
+        rate_limiters: Sequence[TokenBucketRateLimiter] = (),
+        retry_policy: PublishRetryPolicy | None = None,
+    ):
         """Initializes the PublishMessageCommand.
 
         Args:
             project_id: The Google Cloud project ID.
             topic_name: The name of the topic.
             autocreate: Whether to automatically create the topic.
+            rate_limiters: The rate limiters to acquire before publishing.
+            retry_policy: The retry policy applied to the publishing.
         """
         self.project_id = project_id
         self.topic_name = topic_name
         self.autocreate = autocreate
+        self.rate_limiters = rate_limiters
+        self.retry_policy = retry_policy
 
     async def on_publish(
         self, data: bytes, ordering_key: str, attributes: dict[str, str] | None
@@ -55,11 +73,71 @@ class PublishMessageCommand:
             data: The message data.
             ordering_key: The ordering key for the message.
             attributes: A dictionary of message attributes.
+
+        Returns:
+            The id of the published message.
         """
-        client = PubSubClient(project_id=self.project_id)
         if self.autocreate:
-            await client.create_topic(self.topic_name)
+            await get_admin_client(self.project_id).create_topic(self.topic_name)
+
+        client = PubSubClient(project_id=self.project_id)
+
+        publish = functools.partial(self._publish, client, data, ordering_key, attributes)
+        if not self.retry_policy:
+            return await publish()
+
+        return await call_with_retry(publish, name=self.topic_name, policy=self.retry_policy)
 
-        await client.publish(
+    async def _publish(
+        self,
+        client: PubSubClient,
+        data: bytes,
+        ordering_key: str,
+        attributes: dict[str, str] | None,
+    ) -> Any:
+        for rate_limiter in self.rate_limiters:
+            await rate_limiter.acquire()
+
+        return await client.publish(
             topic_name=self.topic_name, data=data, ordering_key=ordering_key, attributes=attributes
         )
+
+
+class FanOutPublishCommand:
+    """A command for publishing the same message to several topics concurrently."""
+
+    def __init__(self, *, commands: Mapping[str, PublishMessageCommand]):
+        """Initializes the FanOutPublishCommand.
+
+        Args:
+            commands: The publish commands mapped by the topic they publish to.
+        """
+        self.commands = commands
+
+    async def on_publish(
+        self, data: bytes, ordering_key: str, attributes: dict[str, str] | None
+    ) -> dict[str, Any]:
+        """Publishes a message to all topics concurrently.
+
+        Args:
+            data: The message data.
+            ordering_key: The ordering key for the message.
+            attributes: A dictionary of message attributes.
+
+        Returns:
+            The id of the published message or the raised exception by topic.
+        """
+        results = await asyncio.gather(
+            *(
+                command.on_publish(data, ordering_key, attributes)
+                for command in self.commands.values()
+            ),
+            return_exceptions=True,
+        )
+
+        responses: dict[str, Any] = {}
+        for topic_name, result in zip(self.commands.keys(), results, strict=True):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            responses[topic_name] = result
+        return responses
@@ -1,29 +1,46 @@
 """Publisher logic."""
 
+import itertools
 import json
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, validate_call
 
+from fastpubsub.concurrency.ratelimit import TokenBucketRateLimiter
 from fastpubsub.concurrency.utils import ensure_async_middleware
+from fastpubsub.datastructures import PublishRetryPolicy
 from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.middlewares.base import BaseMiddleware
-from fastpubsub.pubsub.commands import PublishMessageCommand
+from fastpubsub.pubsub.commands import FanOutPublishCommand, PublishMessageCommand
+from fastpubsub.pubsub.sharding import get_shard_index, get_shard_name
 
 
 class Publisher:
     """A class for publishing messages to a Pub/Sub topic."""
 
-    def __init__(self, topic_name: str, middlewares: list[type[BaseMiddleware]]):
+    def __init__(
+        self,
+        topic_name: str,
+        middlewares: list[type[BaseMiddleware]],
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        retry_policy: PublishRetryPolicy | None = None,
+    ):
         """Initializes the Publisher.
 
         Args:
             topic_name: The name of the topic.
             middlewares: A list of middlewares to apply.
+            rate_limiter: A rate limiter applied only to this topic.
+            retry_policy: The retry policy applied when publishing fails.
         """
         self.project_id = ""
         self.topic_name = topic_name
         self.middlewares: list[type[BaseMiddleware]] = []
+        self.rate_limiter = rate_limiter
+        self.broker_rate_limiter: TokenBucketRateLimiter | None = None
+        self.retry_policy = retry_policy
+        self.shards = 1
+        self._next_shard = itertools.count()
 
         if middlewares:
             for middleware in middlewares:
@@ -36,7 +53,8 @@ class Publisher:
         ordering_key: str = "",
         attributes: dict[str, str] | None = None,
         autocreate: bool = True,
-    ) -> None:
+        partition_key: str = "",
+    ) -> Any:
         """Publishes a message to the topic.
 
         Args:
@@ -44,19 +62,59 @@ class Publisher:
             ordering_key: The ordering key for the message.
             attributes: A dictionary of message attributes.
             autocreate: Whether to automatically create the topic.
+            partition_key: The key used to select the shard of a sharded topic.
+                If not set, the ordering key is used. If neither is set,
+                the shards are selected in round-robin.
+
+        Returns:
+            The id of the published message.
         """
-        callstack = self._build_callstack(autocreate=autocreate)
+        topic_name = self._select_topic_name(partition_key or ordering_key)
+        callstack = self._build_callstack(autocreate=autocreate, topic_name=topic_name)
         serialized_message = await self._serialize_message(data)
 
-        await callstack.on_publish(
+        return await callstack.on_publish(
             data=serialized_message, ordering_key=ordering_key, attributes=attributes
         )
 
-    def _build_callstack(self, autocreate: bool = True) -> PublishMessageCommand | BaseMiddleware:
-        callstack: PublishMessageCommand | BaseMiddleware = PublishMessageCommand(
-            project_id=self.project_id, topic_name=self.topic_name, autocreate=autocreate
+    def _select_topic_name(self, partition_key: str) -> str:
+        if self.shards <= 1:
+            return self.topic_name
+
+        if partition_key:
+            shard = get_shard_index(partition_key, self.shards)
+        else:
+            shard = next(self._next_shard) % self.shards
+
+        return get_shard_name(self.topic_name, shard)
+
+    def _build_callstack(
+        self, autocreate: bool = True, topic_name: str = ""
+    ) -> PublishMessageCommand | FanOutPublishCommand | BaseMiddleware:
+        command = self._build_command(autocreate=autocreate, topic_name=topic_name)
+        return self._wrap_middlewares(command)
+
+    def _build_command(
+        self, autocreate: bool = True, topic_name: str = ""
+    ) -> PublishMessageCommand:
+        rate_limiters = [
+            rate_limiter
+            for rate_limiter in (self.rate_limiter, self.broker_rate_limiter)
+            if rate_limiter
+        ]
+
+        return PublishMessageCommand(
+            project_id=self.project_id,
+            topic_name=topic_name or self.topic_name,
+            autocreate=autocreate,
+            rate_limiters=rate_limiters,
+            retry_policy=self.retry_policy,
         )
 
+    def _wrap_middlewares(
+        self, command: PublishMessageCommand | FanOutPublishCommand
+    ) -> PublishMessageCommand | FanOutPublishCommand | BaseMiddleware:
+        callstack: PublishMessageCommand | FanOutPublishCommand | BaseMiddleware = command
         for middleware in reversed(self.middlewares):
             callstack = middleware(next_call=callstack)
         return callstack
@@ -96,3 +154,6 @@ class Publisher:
 
     def _set_project_id(self, project_id: str) -> None:
         self.project_id = project_id
+
+    def _set_broker_rate_limiter(self, rate_limiter: TokenBucketRateLimiter | None) -> None:
+        self.broker_rate_limiter = rate_limiter
@@ -0,0 +1,48 @@
+"""Sharding utilities for topics and subscriptions."""
+
+import zlib
+
+
+def get_shard_name(name: str, shard: int) -> str:
+    """Gets the name of a topic or subscription shard.
+
+    Args:
+        name: The name of the sharded topic or subscription.
+        shard: The index of the shard.
+
+    Returns:
+        The name of the shard.
+    """
+    return f"{name}-{shard}"
+
+
+def get_shard_names(name: str, shards: int) -> list[str]:
+    """Gets the names of all shards of a topic or subscription.
+
+    Args:
+        name: The name of the sharded topic or subscription.
+        shards: The number of shards.
+
+    Returns:
+        The names of the shards, or the name itself if it is not sharded.
+    """
+    if shards <= 1:
+        return [name]
+
+    return [get_shard_name(name, shard) for shard in range(shards)]
+
+
+def get_shard_index(key: str, shards: int) -> int:
+    """Hashes a partition key onto a shard.
+
+    The hash is stable across processes, so the same key is always
+    published to the same shard.
+
+    Args:
+        key: The partition key.
+        shards: The number of shards.
+
+    Returns:
+        The index of the shard.
+    """
+    return zlib.crc32(key.encode(encoding="utf-8")) % shards
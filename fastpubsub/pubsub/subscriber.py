@@ -7,6 +7,7 @@ from pydantic import ConfigDict, validate_call
 from fastpubsub.concurrency.utils import ensure_async_middleware
 from fastpubsub.datastructures import (
     DeadLetterPolicy,
+    HandlerTimeoutPolicy,
     LifecyclePolicy,
     MessageControlFlowPolicy,
     MessageDeliveryPolicy,
@@ -14,7 +15,8 @@ from fastpubsub.datastructures import (
 )
 from fastpubsub.middlewares.base import BaseMiddleware
 from fastpubsub.pubsub.commands import HandleMessageCommand
-from fastpubsub.types import AsyncCallable
+from fastpubsub.pubsub.sharding import get_shard_names
+from fastpubsub.types import AsyncCallable, BackpressureSignal
 
 
 class Subscriber:
@@ -31,6 +33,10 @@ class Subscriber:
         control_flow_policy: MessageControlFlowPolicy,
         dead_letter_policy: DeadLetterPolicy | None = None,
         middlewares: Sequence[type[BaseMiddleware]] | None = None,
+        shards: int = 1,
+        timeout_policy: HandlerTimeoutPolicy | None = None,
+        push_path: str | None = None,
+        backpressure: BackpressureSignal | None = None,
     ) -> None:
         """Initializes the Subscriber.
 
@@ -44,6 +50,13 @@ class Subscriber:
             control_flow_policy: The control flow policy for the subscription.
             dead_letter_policy: The dead-letter policy for the subscription.
             middlewares: A sequence of middlewares to apply.
+            shards: The number of topic shards consumed by the subscriber.
+            timeout_policy: The timeout policy of the handler. If not set,
+                the handler is never timed out.
+            push_path: The HTTP path where Pub/Sub pushes the messages. If not
+                set, the messages are pulled.
+            backpressure: A signal consulted before dispatching each message.
+                While it is raised, the messages are held instead of handled.
         """
         self.project_id = ""
         self.topic_name = topic_name
@@ -53,6 +66,10 @@ class Subscriber:
         self.delivery_policy = delivery_policy
         self.dead_letter_policy = dead_letter_policy
         self.control_flow_policy = control_flow_policy
+        self.shards = shards
+        self.timeout_policy = timeout_policy
+        self.push_path = push_path
+        self.backpressure = backpressure
         self.handler = HandleMessageCommand(target=func)
         self.middlewares: list[type[BaseMiddleware]] = []
 
@@ -84,6 +101,16 @@ class Subscriber:
         """The name of the subscriber."""
         return self.handler.target.__name__
 
+    @property
+    def topic_names(self) -> list[str]:
+        """The names of the topic shards consumed by the subscriber."""
+        return get_shard_names(self.topic_name, self.shards)
+
+    @property
+    def subscription_names(self) -> list[str]:
+        """The names of the subscription shards consumed by the subscriber."""
+        return get_shard_names(self.subscription_name, self.shards)
+
     def _set_project_id(self, project_id: str) -> None:
         self.project_id = project_id
 
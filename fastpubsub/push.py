@@ -0,0 +1,109 @@
+"""HTTP endpoints for the subscribers delivered by Pub/Sub push subscriptions."""
+
+import base64
+import binascii
+from typing import Any
+
+from pydantic import ValidationError
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
+    HTTP_429_TOO_MANY_REQUESTS,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+from fastpubsub.concurrency.backpressure import is_backpressured
+from fastpubsub.concurrency.tasks import _contextualize, handle_with_timeout_policy
+from fastpubsub.datastructures import Message, PushMessage
+from fastpubsub.exceptions import Drop, Retry
+from fastpubsub.logger import logger
+from fastpubsub.observability import get_apm_provider
+from fastpubsub.pubsub.subscriber import Subscriber
+
+
+class PushEndpoint:
+    """Handles the messages pushed by Pub/Sub to a subscriber.
+
+    Pub/Sub acknowledges a message when the endpoint answers with a success
+    status and redelivers it otherwise. The messages handled at once are
+    bounded by the max_messages of the subscriber: the requests above it, or
+    received while its backpressure signal is raised, are rejected with a 429
+    status, so Pub/Sub backs off instead of the server queueing them without limit.
+    """
+
+    def __init__(self, subscriber: Subscriber) -> None:
+        """Initializes the PushEndpoint.
+
+        Args:
+            subscriber: The subscriber of the pushed messages.
+        """
+        self.subscriber = subscriber
+        self.max_messages = max(1, subscriber.control_flow_policy.max_messages)
+        self.in_flight = 0
+
+    async def handle(self, request: Request) -> Response:
+        """Handles a push request.
+
+        Args:
+            request: The request with the push envelope.
+
+        Returns:
+            A 200 status if the message was handled, a 204 status if it was
+            dropped, a 503 status if it must be retried, a 500 status if the
+            handler failed, a 400 status if the envelope is invalid or a 429
+            status if the subscriber is handling too many messages or is backpressured.
+        """
+        if self.in_flight >= self.max_messages or is_backpressured(self.subscriber.backpressure):
+            get_apm_provider().add_custom_metric(
+                f"Custom/FastPubSub/Push/{self.subscriber.name}/Rejected", 1
+            )
+            return Response(status_code=HTTP_429_TOO_MANY_REQUESTS)
+
+        self.in_flight += 1
+        try:
+            return await self._consume(await request.body())
+        finally:
+            self.in_flight -= 1
+
+    async def _consume(self, body: bytes) -> Response:
+        try:
+            message = self._to_message(body)
+        except (ValidationError, binascii.Error):
+            logger.warning(f"The {self.subscriber.name} handler received an invalid envelope.")
+            return Response(status_code=HTTP_400_BAD_REQUEST)
+
+        with _contextualize(self.subscriber.name, self.subscriber.topic_name, message):
+            try:
+                await self._handle(message)
+                logger.info("The message successfully processed.")
+                return Response(status_code=HTTP_200_OK)
+            except Drop:
+                logger.info("The message will be dropped.")
+                return Response(status_code=HTTP_204_NO_CONTENT)
+            except Retry:
+                logger.warning("The message will be retried later.")
+                return Response(status_code=HTTP_503_SERVICE_UNAVAILABLE)
+            except Exception:
+                logger.exception("Unhandled exception on message", stacklevel=5)
+                return Response(status_code=HTTP_500_INTERNAL_SERVER_ERROR)
+
+    async def _handle(self, message: Message) -> Any:
+        callstack = self.subscriber._build_callstack()
+        return await handle_with_timeout_policy(self.subscriber, callstack, message)
+
+    def _to_message(self, body: bytes) -> Message:
+        # The envelope is parsed straight from the raw JSON and the data is
+        # decoded to bytes once, without an intermediate dictionary.
+        envelope = PushMessage.model_validate_json(body)
+        data = base64.b64decode(envelope.message.data, validate=True)
+        return Message(
+            id=envelope.message.id,
+            size=len(data),
+            data=data,
+            attributes=envelope.message.attributes,
+            delivery_attempt=envelope.delivery_attempt,
+        )
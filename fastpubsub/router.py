@@ -1,5 +1,6 @@
 """A router for organizing publishers and subscribers."""
 
+import asyncio
 import re
 from collections import OrderedDict
 from collections.abc import Sequence
@@ -7,19 +8,29 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, validate_call
 
+from fastpubsub.concurrency.ratelimit import TokenBucketRateLimiter
 from fastpubsub.concurrency.utils import ensure_async_callable_function
 from fastpubsub.datastructures import (
     DeadLetterPolicy,
+    HandlerTimeoutPolicy,
     LifecyclePolicy,
     MessageControlFlowPolicy,
     MessageDeliveryPolicy,
     MessageRetryPolicy,
+    PublishRetryPolicy,
 )
 from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.middlewares.base import BaseMiddleware
+from fastpubsub.pubsub.commands import FanOutPublishCommand, PublishMessageCommand
 from fastpubsub.pubsub.publisher import Publisher
 from fastpubsub.pubsub.subscriber import Subscriber
-from fastpubsub.types import AsyncDecoratedCallable, SubscribedCallable
+from fastpubsub.types import (
+    AsyncDecoratedCallable,
+    BackpressureSignal,
+    HandlerTimeoutBehavior,
+    RateLimitBehavior,
+    SubscribedCallable,
+)
 
 _PREFIX_REGEX = re.compile(r"^[a-zA-Z0-9]+([_./][a-zA-Z0-9]+)*$")
 
@@ -57,6 +68,7 @@ class PubSubRouter:
         self.publishers: dict[str, Publisher] = {}
         self.subscribers: dict[str, Subscriber] = {}
         self.middlewares: list[type[BaseMiddleware]] = []
+        self.broker_rate_limiter: TokenBucketRateLimiter | None = None
 
         if routers:
             if not isinstance(routers, Sequence):
@@ -90,6 +102,17 @@ class PubSubRouter:
         for subscriber in self.subscribers.values():
             subscriber._set_project_id(self.project_id)
 
+    def _set_broker_rate_limiter(self, rate_limiter: TokenBucketRateLimiter | None) -> None:
+        if not rate_limiter or self.broker_rate_limiter is rate_limiter:
+            return
+
+        self.broker_rate_limiter = rate_limiter
+        for router in self.routers:
+            router._set_broker_rate_limiter(rate_limiter)
+
+        for publisher in self.publishers.values():
+            publisher._set_broker_rate_limiter(rate_limiter)
+
     def include_router(self, router: "PubSubRouter") -> None:
         """Includes a child router in the current router.
 
@@ -113,12 +136,13 @@ class PubSubRouter:
                 )
 
         router._set_project_id(self.project_id)
+        router._set_broker_rate_limiter(self.broker_rate_limiter)
         for middleware in self.middlewares:
             router.include_middleware(middleware)
 
         self.routers.append(router)
 
-    @validate_call(config=ConfigDict(strict=True))
+    @validate_call(config=ConfigDict(strict=True, arbitrary_types_allowed=True))
     def subscriber(
         self,
         alias: str,
@@ -137,6 +161,11 @@ class PubSubRouter:
         max_backoff_delay_secs: int = 600,
         max_messages: int = 1000,
         middlewares: Sequence[type[BaseMiddleware]] | None = None,
+        shards: int = 1,
+        handler_timeout: float | None = None,
+        on_handler_timeout: HandlerTimeoutBehavior = "retry",
+        push_path: str | None = None,
+        backpressure: BackpressureSignal | None = None,
     ) -> SubscribedCallable:
         """Decorator to register a function as a subscriber.
 
@@ -160,6 +189,22 @@ class PubSubRouter:
             max_backoff_delay_secs: The maximum backoff delay in seconds.
             max_messages: The maximum number of messages to fetch from the broker.
             middlewares: A sequence of middlewares to apply **only to the subscriber**.
+            shards: The number of topic shards to consume. If set above one, the
+                subscriptions <subscription_name>-0 to <subscription_name>-<shards - 1>
+                are attached to the topics <topic_name>-0 to <topic_name>-<shards - 1>
+                and consumed by the same handler, sharing the max_messages budget.
+            handler_timeout: The maximum seconds a message is handled. The handler
+                is cancelled after it, so a hung call does not hold its flow control
+                slot and lease. If not set, the handler is never timed out.
+            on_handler_timeout: What happens with a message whose handler timed out:
+                'retry' nacks it to be redelivered and 'drop' acknowledges it.
+            push_path: The HTTP path of the FastPubSub app where a push subscription
+                delivers the messages, for example '/push/orders'. If set, the messages
+                are not pulled and at most max_messages are handled at once.
+            backpressure: A signal consulted before dispatching each message, either a
+                callable returning True or an asyncio.Event that is set while the
+                downstream is overloaded. The pulled messages wait, keeping their leases,
+                and the pushed messages are rejected until the signal is lowered.
 
         Returns:
             A decorator that registers the function as a subscriber.
@@ -175,6 +220,19 @@ class PubSubRouter:
                 prefixed_alias = f"{self.prefix}.{prefixed_alias}"
                 prefixed_subscription_name = f"{self.prefix}.{prefixed_subscription_name}"
 
+            if shards < 1:
+                raise FastPubSubException(f"The number of shards must be positive, not {shards}.")
+
+            if handler_timeout is not None and handler_timeout <= 0:
+                raise FastPubSubException(
+                    f"The handler timeout must be positive, not {handler_timeout}."
+                )
+
+            if push_path is not None and not push_path.startswith("/"):
+                raise FastPubSubException(
+                    f"The push path must start with a slash, not '{push_path}'."
+                )
+
             if prefixed_alias in self.subscribers:
                 raise FastPubSubException(
                     f"The alias '{prefixed_alias}' already exists."
@@ -205,6 +263,12 @@ class PubSubRouter:
                 max_messages=max_messages,
             )
 
+            timeout_policy = None
+            if handler_timeout is not None:
+                timeout_policy = HandlerTimeoutPolicy(
+                    timeout=handler_timeout, behavior=on_handler_timeout
+                )
+
             subscriber_middlewares = list(middlewares) if middlewares else []
             for middleware in self.middlewares:
                 subscriber_middlewares.append(middleware)
@@ -219,6 +283,10 @@ class PubSubRouter:
                 control_flow_policy=control_flow_policy,
                 dead_letter_policy=dead_letter_policy,
                 middlewares=subscriber_middlewares,
+                shards=shards,
+                timeout_policy=timeout_policy,
+                push_path=push_path,
+                backpressure=backpressure,
             )
             subscriber._set_project_id(self.project_id)
             self.subscribers[prefixed_alias.lower()] = subscriber
@@ -227,11 +295,31 @@ class PubSubRouter:
         return decorator
 
     @validate_call(config=ConfigDict(strict=True))
-    def publisher(self, topic_name: str) -> Publisher:
+    def publisher(
+        self,
+        topic_name: str,
+        *,
+        max_rate: float | None = None,
+        burst: int | None = None,
+        on_rate_limit: RateLimitBehavior = "wait",
+        retry_policy: PublishRetryPolicy | None = None,
+        shards: int | None = None,
+    ) -> Publisher:
         """Returns a publisher for the given topic.
 
         Args:
             topic_name: The name of the topic.
+            max_rate: The maximum number of messages per second published
+                on the topic. If not set, the topic is not rate limited.
+            burst: The maximum number of messages published at once
+                when the topic is rate limited.
+            on_rate_limit: Whether to 'wait' or 'raise' a RateLimitExceeded
+                exception when the rate limit is hit.
+            retry_policy: The policy used to retry the publishing on retryable
+                errors. If not set, the publishing is not retried.
+            shards: The number of topics the messages are partitioned into.
+                If set above one, the messages are published on the topics
+                <topic_name>-0 to <topic_name>-<shards - 1> by partition key.
 
         Returns:
             A publisher for the given topic.
@@ -240,8 +328,22 @@ class PubSubRouter:
         if not publisher:
             publisher = Publisher(topic_name=topic_name, middlewares=self.middlewares)
             publisher._set_project_id(self.project_id)
+            publisher._set_broker_rate_limiter(self.broker_rate_limiter)
             self.publishers[topic_name] = publisher
 
+        if max_rate is not None:
+            publisher.rate_limiter = TokenBucketRateLimiter(
+                name=topic_name, max_rate=max_rate, burst=burst, on_limit=on_rate_limit
+            )
+
+        if retry_policy is not None:
+            publisher.retry_policy = retry_policy
+
+        if shards is not None:
+            if shards < 1:
+                raise FastPubSubException(f"The number of shards must be positive, not {shards}.")
+            publisher.shards = shards
+
         return publisher
 
     @validate_call(config=ConfigDict(strict=True))
@@ -252,7 +354,8 @@ class PubSubRouter:
         ordering_key: str = "",
         attributes: dict[str, str] | None = None,
         autocreate: bool = True,
-    ) -> None:
+        partition_key: str = "",
+    ) -> Any:
         """Publishes a message to the given topic.
 
         Args:
@@ -261,12 +364,88 @@ class PubSubRouter:
             ordering_key: The ordering key for the message.
             attributes: A dictionary of message attributes.
             autocreate: Whether to automatically create the topic if it does not exists.
+            partition_key: The key used to select the shard of a sharded topic.
+
+        Returns:
+            The id of the published message.
         """
         publisher = self.publisher(topic_name=topic_name)
-        await publisher.publish(
-            data=data, ordering_key=ordering_key, attributes=attributes, autocreate=autocreate
+        return await publisher.publish(
+            data=data,
+            ordering_key=ordering_key,
+            attributes=attributes,
+            autocreate=autocreate,
+            partition_key=partition_key,
         )
 
+    @validate_call(config=ConfigDict(strict=True))
+    async def publish_to(
+        self,
+        topics: list[str],
+        data: dict[str, Any] | str | bytes | BaseModel,
+        ordering_key: str = "",
+        attributes: dict[str, str] | None = None,
+        autocreate: bool = True,
+        partition_key: str = "",
+    ) -> dict[str, Any]:
+        """Publishes the same message to several topics concurrently.
+
+        The message is serialized once and the publishers sharing the same
+        middlewares run their middleware chain only once for all topics.
+
+        Args:
+            topics: The names of the topics.
+            data: The message data.
+            ordering_key: The ordering key for the message.
+            attributes: A dictionary of message attributes.
+            autocreate: Whether to automatically create the topics if they do not exists.
+            partition_key: The key used to select the shard of sharded topics.
+
+        Returns:
+            The id of the published message or the raised exception by topic.
+        """
+        if not topics:
+            raise FastPubSubException("At least one topic must be given to publish the message.")
+
+        publishers = [self.publisher(topic_name=name) for name in dict.fromkeys(topics)]
+        serialized_message = await publishers[0]._serialize_message(data)
+
+        groups: dict[tuple[type[BaseMiddleware], ...], dict[str, PublishMessageCommand]] = {}
+        leaders: dict[tuple[type[BaseMiddleware], ...], Publisher] = {}
+        for publisher in publishers:
+            chain = tuple(publisher.middlewares)
+            leaders.setdefault(chain, publisher)
+
+            topic_name = publisher._select_topic_name(partition_key or ordering_key)
+            command = publisher._build_command(autocreate=autocreate, topic_name=topic_name)
+            groups.setdefault(chain, {})[publisher.topic_name] = command
+
+        callstacks = [
+            leaders[chain]._wrap_middlewares(FanOutPublishCommand(commands=commands))
+            for chain, commands in groups.items()
+        ]
+        results = await asyncio.gather(
+            *(
+                callstack.on_publish(
+                    data=serialized_message, ordering_key=ordering_key, attributes=attributes
+                )
+                for callstack in callstacks
+            ),
+            return_exceptions=True,
+        )
+
+        responses: dict[str, Any] = {}
+        for commands, result in zip(groups.values(), results, strict=True):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+
+            if isinstance(result, Exception):
+                responses.update(dict.fromkeys(commands, result))
+            else:
+                responses.update(result)
+
+        return {publisher.topic_name: responses[publisher.topic_name] for publisher in publishers}
+
     @validate_call(config=ConfigDict(strict=True))
     def include_middleware(self, middleware: type[BaseMiddleware]) -> None:
         """Includes a middleware in the router.
@@ -296,6 +475,16 @@ class PubSubRouter:
 
         return subscribers
 
+    def _get_publishers(self) -> dict[str, Publisher]:
+        publishers: dict[str, Publisher] = {}
+        publishers.update(self.publishers)
+        router: PubSubRouter
+        for router in self.routers:
+            router_publishers = router._get_publishers()
+            publishers.update(router_publishers)
+
+        return publishers
+
     @validate_call
     def _add_prefix(self, prefix: str) -> None:
         if not prefix:
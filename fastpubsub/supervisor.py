@@ -0,0 +1,251 @@
+"""A supervisor that runs the subscribers on a pool of consumer processes."""
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
+from multiprocessing.context import SpawnProcess
+from multiprocessing.sharedctypes import SynchronizedArray
+from typing import Any
+
+from fastpubsub.applications import Application
+from fastpubsub.concurrency.loops import run_with_event_loop
+from fastpubsub.concurrency.utils import apply_async
+from fastpubsub.health import HealthServer, application_lifespan
+from fastpubsub.logger import logger, setup_logger
+from fastpubsub.types import EventLoopType
+
+DEFAULT_MAX_RESTARTS = 5
+DEFAULT_SHUTDOWN_TIMEOUT = 30.0
+MONITOR_INTERVAL = 1.0
+STATUS_REPORT_INTERVAL = 1.0
+INITIAL_RESTART_BACKOFF = 1.0
+MAX_RESTART_BACKOFF = 30.0
+
+
+def assign_subscribers(
+    aliases: Sequence[str], processes: int, weights: Mapping[str, float] | None = None
+) -> list[list[str]]:
+    """Assigns the subscribers to the consumer processes balancing their load.
+
+    The heaviest subscribers are placed first on the least loaded process,
+    so subscribers with the same weight are assigned in round-robin.
+
+    Args:
+        aliases: The aliases of the subscribers.
+        processes: The number of consumer processes.
+        weights: The expected load of each subscriber. The missing
+            subscribers have a weight of one.
+
+    Returns:
+        The aliases of the subscribers assigned to each process. There are
+        never more processes than subscribers.
+    """
+    weights = weights or {}
+    processes = max(1, min(processes, len(aliases)))
+
+    assignments: list[list[str]] = [[] for _ in range(processes)]
+    loads = [0.0] * processes
+    for alias in sorted(aliases, key=lambda alias: -weights.get(alias, 1.0)):
+        index = loads.index(min(loads))
+        assignments[index].append(alias)
+        loads[index] += weights.get(alias, 1.0)
+
+    return assignments
+
+
+class _ConsumerProcess:
+    def __init__(self, index: int, subscribers: list[str]) -> None:
+        self.index = index
+        self.subscribers = subscribers
+        self.process: SpawnProcess | None = None
+        self.restarts = 0
+        self.restart_at: float | None = None
+
+
+class ConsumerSupervisor:
+    """Runs the subscribers on a pool of processes and restarts the crashed ones.
+
+    Each process runs only its assigned subscribers without the HTTP server
+    and reports its health to the supervisor through shared memory. The
+    supervisor serves the liveness and readiness probes aggregated across
+    all processes.
+    """
+
+    def __init__(
+        self,
+        app: str,
+        assignments: Sequence[list[str]],
+        host: str,
+        port: int,
+        max_restarts: int = DEFAULT_MAX_RESTARTS,
+        shutdown_timeout: float = DEFAULT_SHUTDOWN_TIMEOUT,
+        loop: EventLoopType = "auto",
+    ) -> None:
+        """Initializes the ConsumerSupervisor.
+
+        Args:
+            app: The application path in the '<module>:<attribute>' format.
+            assignments: The aliases of the subscribers of each process.
+            host: The host of the aggregated health probes.
+            port: The port of the aggregated health probes.
+            max_restarts: The number of consecutive restarts of a process
+                before the supervisor reports itself as not alive.
+            shutdown_timeout: The seconds to wait for the processes to
+                shut down gracefully before killing them.
+            loop: The event loop implementation of the consumer processes.
+        """
+        self.app = app
+        self.host = host
+        self.port = port
+        self.max_restarts = max_restarts
+        self.shutdown_timeout = shutdown_timeout
+        self.loop = loop
+
+        self._context = multiprocessing.get_context("spawn")
+        self._status: SynchronizedArray[Any] = self._context.Array("b", 2 * len(assignments))
+        self._processes = [
+            _ConsumerProcess(index=index, subscribers=list(subscribers))
+            for index, subscribers in enumerate(assignments)
+        ]
+        self._failed = False
+
+    def alive(self) -> bool:
+        """Checks if every consumer process is alive or being restarted.
+
+        Returns:
+            True if they are alive, False otherwise.
+        """
+        if self._failed:
+            return False
+
+        for consumer in self._processes:
+            if consumer.restart_at is None and not self._status[2 * consumer.index]:
+                return False
+        return True
+
+    def ready(self) -> bool:
+        """Checks if every consumer process is ready.
+
+        Returns:
+            True if they are ready, False otherwise.
+        """
+        return all(self._status[2 * consumer.index + 1] for consumer in self._processes)
+
+    async def run(self) -> None:
+        """Starts the consumer processes and supervises them until SIGINT or SIGTERM."""
+        loop = asyncio.get_running_loop()
+        stop_event = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop_event.set)
+
+        for consumer in self._processes:
+            self._start(consumer)
+
+        health_server = HealthServer(probe=self, host=self.host, port=self.port)
+        await health_server.start()
+        try:
+            while not stop_event.is_set():
+                self._check_processes()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop_event.wait(), MONITOR_INTERVAL)
+        finally:
+            await health_server.stop()
+            await apply_async(self._stop_processes)
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signum)
+
+    def _start(self, consumer: _ConsumerProcess) -> None:
+        consumer.restart_at = None
+        consumer.process = self._context.Process(
+            target=_run_consumer_process,
+            args=(self.app, consumer.subscribers, consumer.index, self._status, self.loop),
+            name=f"fastpubsub-consumer-{consumer.index}",
+        )
+        consumer.process.start()
+        logger.info(
+            f"Started the consumer process {consumer.process.pid} for {consumer.subscribers}."
+        )
+
+    def _check_processes(self) -> None:
+        now = time.monotonic()
+        for consumer in self._processes:
+            if consumer.restart_at is not None:
+                if now >= consumer.restart_at and not self._failed:
+                    self._start(consumer)
+                continue
+
+            if not consumer.process or consumer.process.is_alive():
+                if self._status[2 * consumer.index + 1]:
+                    consumer.restarts = 0
+                continue
+
+            self._status[2 * consumer.index] = 0
+            self._status[2 * consumer.index + 1] = 0
+            consumer.restarts += 1
+            if consumer.restarts > self.max_restarts:
+                logger.error(f"The consumer process for {consumer.subscribers} keeps crashing.")
+                self._failed = True
+
+            backoff = min(MAX_RESTART_BACKOFF, INITIAL_RESTART_BACKOFF * 2**consumer.restarts)
+            consumer.restart_at = now + backoff
+            logger.error(
+                f"The consumer process {consumer.process.pid} exited with code "
+                f"{consumer.process.exitcode}, restarting it in {backoff:.1f}s."
+            )
+
+    def _stop_processes(self) -> None:
+        running = [
+            consumer.process
+            for consumer in self._processes
+            if consumer.process and consumer.process.is_alive()
+        ]
+        for process in running:
+            process.terminate()
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        for process in running:
+            process.join(timeout=max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"The consumer process {process.pid} did not stop, killing it.")
+                process.kill()
+                process.join()
+
+
+def _run_consumer_process(
+    app: str,
+    subscribers: list[str],
+    index: int,
+    status: "SynchronizedArray[Any]",
+    loop: EventLoopType = "auto",
+) -> None:
+    from fastpubsub.cli.runner import ApplicationRunner
+
+    os.environ["FASTPUBSUB_SUBSCRIBERS"] = ",".join(subscribers)
+    setup_logger()
+
+    application = ApplicationRunner().load_application(app)
+    run_with_event_loop(_serve_consumer_process(application, index, status), loop=loop)
+
+
+async def _serve_consumer_process(
+    application: Application, index: int, status: "SynchronizedArray[Any]"
+) -> None:
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_event.set)
+
+    try:
+        async with application_lifespan(application):
+            while not stop_event.is_set():
+                status[2 * index] = int(application.broker.alive())
+                status[2 * index + 1] = int(application.broker.ready())
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(stop_event.wait(), STATUS_REPORT_INTERVAL)
+    finally:
+        status[2 * index] = 0
+        status[2 * index + 1] = 0
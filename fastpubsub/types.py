@@ -1,7 +1,8 @@
 """Type definitions for FastPubSub."""
 
+import asyncio
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import Any, Literal
 
 # V2: We wait a return because in further releases we will allow chaining handlers/publishers
 AsyncDecoratedCallable = Callable[[Any], Awaitable[Any]]
@@ -9,3 +10,13 @@ SubscribedCallable = Callable[[AsyncDecoratedCallable], AsyncDecoratedCallable]
 
 AsyncCallable = Callable[[Any], Awaitable[None]]
 NoArgAsyncCallable = Callable[[], Awaitable[None]]
+
+RateLimitBehavior = Literal["wait", "raise"]
+HandlerTimeoutBehavior = Literal["retry", "drop"]
+PauseBehavior = Literal["hold", "nack"]
+ProvisioningAction = Literal["create_topic", "create_subscription", "update_subscription"]
+EventLoopType = Literal["auto", "asyncio", "uvloop"]
+
+# The signal is raised (the callable returns True or the event is set) while
+# the subscriber must not dispatch new messages.
+BackpressureSignal = Callable[[], bool] | asyncio.Event
@@ -2,13 +2,16 @@ import json
 import os
 from contextlib import asynccontextmanager
 from types import FunctionType
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.responses import JSONResponse
+from pydantic import ValidationError
 
-from fastpubsub.applications import FastPubSub
+from fastpubsub.applications import Application, FastPubSub
 from fastpubsub.broker import PubSubBroker
+from fastpubsub.datastructures import MessageControlFlowPolicy
+from fastpubsub.exceptions import FastPubSubException
 
 
 @pytest.fixture
@@ -17,6 +20,7 @@ def mock_broker() -> MagicMock:
     broker = MagicMock(spec=PubSubBroker)
     broker.start = AsyncMock()
     broker.shutdown = AsyncMock()
+    broker._push_subscribers = []
     return broker
 
 
@@ -45,6 +49,34 @@ class TestApplicationLifecycle:
         after_shutdown_action.assert_called_once()
         mock_broker.shutdown.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_push_endpoints_are_mounted(self, mock_broker: MagicMock):
+        push_subscriber = MagicMock()
+        push_subscriber.name = "sub"
+        push_subscriber.push_path = "/push/sub"
+        push_subscriber.control_flow_policy = MessageControlFlowPolicy(max_messages=10)
+        mock_broker._push_subscribers = [push_subscriber]
+
+        app = FastPubSub(broker=mock_broker)
+        async with app._run(app):
+            pass
+        async with app._run(app):
+            pass
+
+        paths = [route.path for route in app.router.routes if route.path == "/push/sub"]
+        assert paths == ["/push/sub"]
+
+    @pytest.mark.asyncio
+    async def test_push_endpoint_path_conflict(self, mock_broker: MagicMock):
+        push_subscriber = MagicMock()
+        push_subscriber.push_path = "/consumers/alive"
+        mock_broker._push_subscribers = [push_subscriber]
+
+        app = FastPubSub(broker=mock_broker)
+        with pytest.raises(FastPubSubException):
+            async with app._run(app):
+                pass
+
     @pytest.mark.asyncio
     async def test_decorator_hooks_are_called(self, mock_broker: MagicMock):
         app = FastPubSub(broker=mock_broker)
@@ -141,3 +173,31 @@ class TestApplicationProbes:
         assert isinstance(response, JSONResponse)
         assert response.status_code == status_code
         assert json.loads(response.body) == {"alive": alive}
+
+
+class TestApplicationRun:
+    @patch("fastpubsub.applications.run_with_event_loop")
+    @patch("fastpubsub.health.serve_without_http", new_callable=MagicMock)
+    def test_run_without_http(
+        self, mock_serve: MagicMock, mock_run: MagicMock, mock_broker: MagicMock
+    ):
+        app = Application(broker=mock_broker)
+        app.run(host="localhost", port=9000, loop="asyncio")
+
+        mock_serve.assert_called_once_with(app, "localhost", 9000)
+        mock_run.assert_called_once_with(mock_serve.return_value, loop="asyncio")
+
+    @patch("uvicorn.run")
+    def test_run_with_http(self, mock_uvicorn_run: MagicMock, mock_broker: MagicMock):
+        app = FastPubSub(broker=mock_broker)
+        app.run(port=9000, loop="asyncio")
+
+        mock_uvicorn_run.assert_called_once_with(
+            app, host="0.0.0.0", port=9000, loop="asyncio", lifespan="on"
+        )
+
+    def test_run_with_invalid_loop(self, mock_broker: MagicMock):
+        app = FastPubSub(broker=mock_broker)
+
+        with pytest.raises(ValidationError):
+            app.run(loop="trio")
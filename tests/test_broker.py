@@ -17,7 +17,7 @@ class TestPubSubBroker:
         with patch(f"{BROKER_MODULE_PATH}.AsyncTaskManager") as mock:
             instance = mock.return_value
             instance.start = MagicMock()
-            instance.shutdown = MagicMock()
+            instance.shutdown = AsyncMock()
             instance.alive = MagicMock()
             instance.ready = MagicMock()
             instance.create_task = MagicMock()
@@ -28,6 +28,7 @@ class TestPubSubBroker:
         with patch(f"{BROKER_MODULE_PATH}.PubSubSubscriptionBuilder") as mock:
             instance = mock.return_value
             instance.build = AsyncMock()
+            instance.build_all = AsyncMock()
             yield instance
 
     @pytest.mark.parametrize(
@@ -101,9 +102,10 @@ class TestPubSubBroker:
                     f"match the filtered ones {expected_subscribers} {found_subscribers}"
                 )
 
-    def test_shutdown_successfully(self, async_task_manager: MagicMock, broker: PubSubBroker):
-        broker.shutdown()
-        async_task_manager.shutdown.assert_called_once()
+    @pytest.mark.asyncio
+    async def test_shutdown_successfully(self, async_task_manager: MagicMock, broker: PubSubBroker):
+        await broker.shutdown()
+        async_task_manager.shutdown.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_start_broker_no_sub_error(self, broker: PubSubBroker):
@@ -116,13 +118,53 @@ class TestPubSubBroker:
         self, subscription_builder: MagicMock, async_task_manager: MagicMock, broker: PubSubBroker
     ):
         expected_subscriber = MagicMock(spec=Subscriber)
+        expected_subscriber.push_path = None
         broker._filter_subscribers = lambda: [expected_subscriber]
         await broker.start()
 
-        subscription_builder.build.assert_called_once_with(expected_subscriber)
+        subscription_builder.build_all.assert_called_once_with(
+            [expected_subscriber], max_concurrency=broker.max_provisioning_concurrency
+        )
         async_task_manager.create_task.assert_called_once_with(expected_subscriber)
         async_task_manager.start.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_start_broker_with_push_subscribers(
+        self, subscription_builder: MagicMock, async_task_manager: MagicMock, broker: PubSubBroker
+    ):
+        push_subscriber = MagicMock(spec=Subscriber)
+        push_subscriber.push_path = "/push"
+        broker._filter_subscribers = lambda: [push_subscriber]
+        async_task_manager.alive.return_value = {}
+        async_task_manager.ready.return_value = {}
+        await broker.start()
+
+        subscription_builder.build_all.assert_called_once()
+        async_task_manager.create_task.assert_not_called()
+        assert broker._push_subscribers == [push_subscriber]
+        assert broker.alive()
+        assert broker.ready()
+
+    @pytest.mark.asyncio
+    async def test_drain_broker(self, broker: PubSubBroker):
+        expected_subscriber = MagicMock(spec=Subscriber)
+        expected_subscriber.push_path = None
+        broker._filter_subscribers = lambda: [expected_subscriber]
+        with patch(f"{BROKER_MODULE_PATH}.SubscriptionDrainer") as drainer:
+            drainer.return_value.run = AsyncMock(return_value="result")
+            results = await broker.drain(max_messages=10, batch_size=5, concurrency=2)
+
+        assert results == ["result"]
+        drainer.assert_called_once_with(
+            expected_subscriber, max_messages=10, batch_size=5, concurrency=2
+        )
+
+    @pytest.mark.asyncio
+    async def test_drain_broker_no_sub_error(self, broker: PubSubBroker):
+        broker._filter_subscribers = lambda: []
+        with pytest.raises(FastPubSubException):
+            await broker.drain()
+
     @pytest.mark.parametrize(
         ["response", "expected_readiness"],
         [
@@ -1,16 +1,36 @@
 import os
+import signal
 from dataclasses import asdict
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
+import uvicorn
 import uvicorn.importer
 from typer.testing import CliRunner
 
 from fastpubsub.applications import FastPubSub
 from fastpubsub.broker import PubSubBroker
 from fastpubsub.cli.main import app
-from fastpubsub.cli.runner import AppConfiguration, ApplicationRunner, ServerConfiguration
-from fastpubsub.cli.utils import LogLevels, get_log_level
+from fastpubsub.cli.prefork import STARTUP_FAILURE, PreforkServer
+from fastpubsub.cli.runner import (
+    APPLICATION_FACTORY,
+    AppConfiguration,
+    ApplicationRunner,
+    DrainConfiguration,
+    DrainRunner,
+    ProvisioningConfiguration,
+    ServerConfiguration,
+    load_application_from_environment,
+)
+from fastpubsub.cli.utils import (
+    EventLoops,
+    LogLevels,
+    get_event_loop,
+    get_log_level,
+    get_peak_memory_usage,
+    get_subscriber_weights,
+)
+from fastpubsub.concurrency.drain import DrainResult
 from fastpubsub.exceptions import FastPubSubCLIException
 
 runner = CliRunner()
@@ -33,7 +53,7 @@ class TestCLI:
         assert "Running FastPubSub" in result.stdout
 
     @patch("fastpubsub.cli.main.ensure_pubsub_credentials")
-    @patch("fastpubsub.cli.main.ApplicationRunner")
+    @patch("fastpubsub.cli.runner.ApplicationRunner")
     def test_run_command(self, mock_runner: MagicMock, mock_ensure_credentials: MagicMock):
         result = runner.invoke(app, ["run", "some_module:app"])
         assert result.exit_code == 0
@@ -41,7 +61,7 @@ class TestCLI:
         mock_ensure_credentials.assert_called_once()
 
     @patch("fastpubsub.cli.main.ensure_pubsub_credentials")
-    @patch("fastpubsub.cli.main.ApplicationRunner")
+    @patch("fastpubsub.cli.runner.ApplicationRunner")
     def test_run_command_with_options(
         self, mock_runner_class: MagicMock, mock_ensure_credentials: MagicMock
     ):
@@ -66,6 +86,15 @@ class TestCLI:
                 "subscriber1",
                 "--subscribers",
                 "subscriber2",
+                "--force-provision",
+                "--no-http",
+                "--consumers",
+                "3",
+                "--subscriber-weight",
+                "subscriber1=2",
+                "--preload",
+                "--loop",
+                "uvloop",
             ],
         )
         assert result.exit_code == 0
@@ -78,6 +107,11 @@ class TestCLI:
             log_colorize=False,
             apm_provider="NOOP",
             subscribers={"subscriber1", "subscriber2"},
+            force_provision=True,
+            http_server=False,
+            consumer_processes=3,
+            subscriber_weights={"subscriber1": 2.0},
+            preload=True,
         )
         expected_server_config = ServerConfiguration(
             host="127.0.0.1",
@@ -85,12 +119,68 @@ class TestCLI:
             workers=2,
             reload=True,
             log_level=40,  # error
+            loop="uvloop",
         )
 
         mock_runner_instance.run.assert_called_once_with(
             expected_app_config, expected_server_config
         )
 
+    @pytest.mark.parametrize(["command", "apply"], [("plan", False), ("apply", True)])
+    @patch("fastpubsub.cli.main.ensure_pubsub_credentials")
+    @patch("fastpubsub.cli.runner.ProvisioningRunner")
+    def test_provision_command(
+        self,
+        mock_runner_class: MagicMock,
+        mock_ensure_credentials: MagicMock,
+        command: str,
+        apply: bool,
+    ):
+        result = runner.invoke(
+            app, ["provision", command, "some_module:app", "-s", "sub", "--concurrency", "4"]
+        )
+        assert result.exit_code == 0
+        mock_ensure_credentials.assert_called_once()
+
+        expected_config = ProvisioningConfiguration(
+            app="some_module:app", max_concurrency=4, subscribers={"sub"}
+        )
+        mock_runner_class.return_value.run.assert_called_once_with(expected_config, apply=apply)
+
+    @patch("fastpubsub.cli.main.ensure_pubsub_credentials")
+    @patch("fastpubsub.cli.runner.DrainRunner")
+    def test_drain_command(self, mock_runner_class: MagicMock, mock_ensure_credentials: MagicMock):
+        result = runner.invoke(
+            app,
+            [
+                "drain",
+                "some_module:app",
+                "--subscriber",
+                "sub",
+                "--max",
+                "500",
+                "--batch-size",
+                "50",
+                "--concurrency",
+                "2",
+            ],
+        )
+        assert result.exit_code == 0
+        mock_ensure_credentials.assert_called_once()
+
+        expected_config = DrainConfiguration(
+            app="some_module:app",
+            log_level=20,
+            log_serialize=False,
+            log_colorize=False,
+            apm_provider="NOOP",
+            subscribers={"sub"},
+            max_messages=500,
+            batch_size=50,
+            concurrency=2,
+        )
+        mock_runner_class.return_value.run.assert_called_once_with(expected_config)
+
 
 class TestApplicationRunner:
     @patch("uvicorn.run")
@@ -117,31 +207,180 @@ class TestApplicationRunner:
 
         mock_validate.assert_called_once_with(app_config.app)
         mock_uvicorn_run.assert_called_once_with(
-            app_config.app, lifespan="on", **asdict(server_config)
+            APPLICATION_FACTORY, factory=True, lifespan="on", **asdict(server_config)
+        )
+        assert os.environ["FASTPUBSUB_APPLICATION"] == app_config.app
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    @patch("uvicorn.run")
+    @patch("fastpubsub.cli.runner.uvicorn.Server")
+    @patch("fastpubsub.cli.runner.uvicorn.Config")
+    @patch("fastpubsub.cli.runner.PreforkServer")
+    @patch("fastpubsub.cli.runner.ApplicationRunner.load_application")
+    def test_run_preloaded(
+        self,
+        mock_load: MagicMock,
+        mock_prefork: MagicMock,
+        mock_config: MagicMock,
+        mock_server: MagicMock,
+        mock_uvicorn_run: MagicMock,
+        workers: int,
+    ):
+        app_config = AppConfiguration(
+            app="my_app:app",
+            log_level=10,
+            log_serialize=False,
+            log_colorize=False,
+            apm_provider="NOOP",
+            preload=True,
+        )
+        server_config = ServerConfiguration(
+            host="localhost", port=8000, workers=workers, reload=False, log_level=20
+        )
+
+        runner_instance = ApplicationRunner()
+        runner_instance.run(app_config, server_config)
+
+        mock_uvicorn_run.assert_not_called()
+        mock_load.assert_called_once_with("my_app:app")
+        mock_config.assert_called_once_with(
+            mock_load.return_value,
+            lifespan="on",
+            log_level=20,
+            host="localhost",
+            port=8000,
+            loop="auto",
+        )
+        if workers > 1:
+            mock_prefork.assert_called_once_with(config=mock_config.return_value, workers=workers)
+            mock_prefork.return_value.run.assert_called_once()
+            mock_server.assert_not_called()
+        else:
+            mock_prefork.assert_not_called()
+            mock_server.return_value.run.assert_called_once()
+
+    @patch("uvicorn.run")
+    @patch("fastpubsub.cli.runner.run_with_event_loop")
+    @patch("fastpubsub.cli.runner.serve_without_http", new_callable=MagicMock)
+    @patch("fastpubsub.cli.runner.ApplicationRunner.load_application")
+    def test_run_without_http(
+        self,
+        mock_load: MagicMock,
+        mock_serve: MagicMock,
+        mock_asyncio_run: MagicMock,
+        mock_uvicorn_run: MagicMock,
+    ):
+        app_config = AppConfiguration(
+            app="my_app:app",
+            log_level=10,
+            log_serialize=False,
+            log_colorize=False,
+            apm_provider="NOOP",
+            http_server=False,
+        )
+        server_config = ServerConfiguration(
+            host="localhost", port=8000, workers=1, reload=False, log_level=20
+        )
+
+        runner_instance = ApplicationRunner()
+        runner_instance.run(app_config, server_config)
+
+        mock_uvicorn_run.assert_not_called()
+        mock_serve.assert_called_once_with(mock_load.return_value, "localhost", 8000)
+        mock_asyncio_run.assert_called_once_with(mock_serve.return_value, loop="auto")
+
+    @patch("uvicorn.run")
+    @patch("fastpubsub.cli.runner.run_with_event_loop")
+    @patch("fastpubsub.cli.runner.ConsumerSupervisor")
+    @patch("fastpubsub.cli.runner.ApplicationRunner.load_application")
+    def test_run_consumer_processes(
+        self,
+        mock_load: MagicMock,
+        mock_supervisor: MagicMock,
+        mock_asyncio_run: MagicMock,
+        mock_uvicorn_run: MagicMock,
+    ):
+        mock_load.return_value.broker._filter_subscriber_aliases.return_value = ["a", "b", "c"]
+        app_config = AppConfiguration(
+            app="my_app:app",
+            log_level=10,
+            log_serialize=False,
+            log_colorize=False,
+            apm_provider="NOOP",
+            consumer_processes=2,
+            subscriber_weights={"c": 2},
+        )
+        server_config = ServerConfiguration(
+            host="localhost", port=8000, workers=1, reload=False, log_level=20, loop="asyncio"
+        )
+
+        runner_instance = ApplicationRunner()
+        runner_instance.run(app_config, server_config)
+
+        mock_uvicorn_run.assert_not_called()
+        mock_supervisor.assert_called_once_with(
+            app="my_app:app",
+            assignments=[["c"], ["a", "b"]],
+            host="localhost",
+            port=8000,
+            loop="asyncio",
+        )
+        mock_asyncio_run.assert_called_once_with(
+            mock_supervisor.return_value.run.return_value, loop="asyncio"
         )
 
     @patch("fastpubsub.cli.runner.ApplicationRunner._resolve_application_posix_path")
     @patch("fastpubsub.cli.runner.ApplicationRunner._translate_pypath_to_posix")
     @patch("uvicorn.importer.import_from_string")
-    def test_validate_application_invalid_app_instance(
+    def test_load_application_invalid_app_instance(
         self, mock_import: MagicMock, mock_translate: MagicMock, mock_resolve: MagicMock
     ):
         mock_import.return_value = object()
         runner_instance = ApplicationRunner()
         with pytest.raises(FastPubSubCLIException):
-            runner_instance._validate_application("my_app:app")
+            runner_instance.load_application("my_app:app")
 
     @patch("fastpubsub.cli.runner.ApplicationRunner._resolve_application_posix_path")
     @patch("fastpubsub.cli.runner.ApplicationRunner._translate_pypath_to_posix")
     @patch("uvicorn.importer.import_from_string")
-    def test_validate_application_valid_app(
+    def test_load_application_valid_app(
         self, mock_import: MagicMock, mock_translate: MagicMock, mock_resolve: MagicMock
     ):
         mock_broker = MagicMock(spec=PubSubBroker)
         mock_import.return_value = FastPubSub(broker=mock_broker)
         runner_instance = ApplicationRunner()
+
+        assert runner_instance.load_application("my_app:app") is mock_import.return_value
+
+    @patch("fastpubsub.cli.runner.ApplicationRunner._resolve_application_posix_path")
+    @patch("uvicorn.importer.import_from_string")
+    def test_validate_application_does_not_import_the_app(
+        self, mock_import: MagicMock, mock_resolve: MagicMock
+    ):
+        runner_instance = ApplicationRunner()
         # should not raise
-        runner_instance._validate_application("my_app:app")
+        runner_instance._validate_application("json:loads")
+
+        mock_import.assert_not_called()
+
+    @patch("fastpubsub.cli.runner.ApplicationRunner._resolve_application_posix_path")
+    def test_validate_application_missing_module(self, mock_resolve: MagicMock):
+        runner_instance = ApplicationRunner()
+        with pytest.raises(FastPubSubCLIException):
+            runner_instance._validate_application("some_missing_module:app")
+
+    @patch("fastpubsub.cli.runner.ApplicationRunner.load_application")
+    def test_load_application_from_environment(self, mock_load: MagicMock):
+        with patch.dict(os.environ, {"FASTPUBSUB_APPLICATION": "my_app:app"}):
+            application = load_application_from_environment()
+
+        assert application is mock_load.return_value
+        mock_load.assert_called_once_with("my_app:app")
+
+    def test_load_application_from_environment_not_set(self):
+        with patch.dict(os.environ, {"FASTPUBSUB_APPLICATION": ""}):
+            with pytest.raises(FastPubSubCLIException):
+                load_application_from_environment()
 
     def test_translate_pypath_to_posix_invalid_format(self):
         runner_instance = ApplicationRunner()
@@ -149,6 +388,125 @@ class TestApplicationRunner:
             runner_instance._translate_pypath_to_posix("invalid_path")
 
 
+class TestDrainRunner:
+    @patch("fastpubsub.cli.runner.ApplicationRunner.load_application")
+    def test_run(self, mock_load: MagicMock):
+        calls = []
+
+        async def on_startup():
+            calls.append("startup")
+
+        async def on_shutdown():
+            calls.append("shutdown")
+
+        expected_results = [DrainResult(subscriber="sub", received=2, acknowledged=1, nacked=1)]
+
+        async def drain(**_):
+            calls.append("drain")
+            return expected_results
+
+        broker = PubSubBroker(project_id="test-project")
+        broker.drain = AsyncMock(side_effect=drain)
+        application = FastPubSub(broker=broker, on_startup=[on_startup], on_shutdown=[on_shutdown])
+        mock_load.return_value = application
+
+        config = DrainConfiguration(
+            app="my_app:app",
+            log_level=20,
+            log_serialize=False,
+            log_colorize=False,
+            apm_provider="NOOP",
+            subscribers={"sub"},
+            max_messages=10,
+        )
+        with patch.dict(os.environ, {}):
+            results = DrainRunner().run(config)
+            assert os.environ["FASTPUBSUB_SUBSCRIBERS"] == "sub"
+
+        assert results == expected_results
+        assert calls == ["startup", "drain", "shutdown"]
+        broker.drain.assert_awaited_once_with(max_messages=10, batch_size=100, concurrency=4)
+
+
+class TestPreforkServer:
+    def _build_server(self, workers: int) -> PreforkServer:
+        config = MagicMock(spec=uvicorn.Config)
+        return PreforkServer(config=config, workers=workers)
+
+    @patch("fastpubsub.cli.prefork.os.kill")
+    @patch("fastpubsub.cli.prefork.os.wait")
+    @patch("fastpubsub.cli.prefork.os.fork")
+    def test_run_stops_workers_on_exit(
+        self, mock_fork: MagicMock, mock_wait: MagicMock, mock_kill: MagicMock
+    ):
+        server = self._build_server(workers=2)
+        mock_fork.side_effect = [101, 102]
+
+        def _wait() -> tuple[int, int]:
+            if not server.should_exit:
+                server._handle_exit(signal.SIGTERM, None)
+                mock_kill.assert_has_calls(
+                    [call(101, signal.SIGTERM), call(102, signal.SIGTERM)], any_order=True
+                )
+            return server._children.copy().pop(), 0
+
+        mock_wait.side_effect = _wait
+        server.run()
+
+        assert mock_fork.call_count == 2
+        assert mock_wait.call_count == 2
+        server.config.bind_socket.return_value.close.assert_called_once()
+
+    @patch("fastpubsub.cli.prefork.time.sleep")
+    @patch("fastpubsub.cli.prefork.os.kill")
+    @patch("fastpubsub.cli.prefork.os.wait")
+    @patch("fastpubsub.cli.prefork.os.fork")
+    def test_run_respawns_crashed_workers(
+        self,
+        mock_fork: MagicMock,
+        mock_wait: MagicMock,
+        mock_kill: MagicMock,
+        mock_sleep: MagicMock,
+    ):
+        server = self._build_server(workers=1)
+        mock_fork.side_effect = [101, 102]
+
+        def _wait() -> tuple[int, int]:
+            if mock_wait.call_count == 1:
+                return 101, 256
+
+            server._handle_exit(signal.SIGTERM, None)
+            return 102, 0
+
+        mock_wait.side_effect = _wait
+        server.run()
+
+        assert mock_fork.call_count == 2
+        mock_sleep.assert_called_once()
+        mock_kill.assert_called_once_with(102, signal.SIGTERM)
+
+    @patch("fastpubsub.cli.prefork.time.sleep")
+    @patch("fastpubsub.cli.prefork.os.kill")
+    @patch("fastpubsub.cli.prefork.os.wait")
+    @patch("fastpubsub.cli.prefork.os.fork")
+    def test_run_stops_on_startup_failure(
+        self,
+        mock_fork: MagicMock,
+        mock_wait: MagicMock,
+        mock_kill: MagicMock,
+        mock_sleep: MagicMock,
+    ):
+        server = self._build_server(workers=2)
+        mock_fork.side_effect = [101, 102]
+        mock_wait.side_effect = [(101, STARTUP_FAILURE << 8), (102, 0)]
+
+        server.run()
+
+        assert mock_fork.call_count == 2
+        mock_sleep.assert_not_called()
+        mock_kill.assert_called_once_with(102, signal.SIGTERM)
+
+
 class TestUtils:
     def test_get_log_level(self):
         assert get_log_level(LogLevels.CRITICAL) == 50
@@ -175,3 +533,24 @@ class TestUtils:
 
             with pytest.raises(FastPubSubCLIException):
                 ensure_pubsub_credentials()
+
+    def test_get_subscriber_weights(self):
+        assert get_subscriber_weights(["Orders=3", "payments=0.5"]) == {
+            "orders": 3.0,
+            "payments": 0.5,
+        }
+
+        for invalid_value in ["orders", "orders=abc", "=2", "orders=-1"]:
+            with pytest.raises(FastPubSubCLIException):
+                get_subscriber_weights([invalid_value])
+
+    def test_get_event_loop(self):
+        assert get_event_loop(EventLoops.UVLOOP) == "uvloop"
+        assert get_event_loop("AsyncIO") == "asyncio"
+        assert get_event_loop("auto") == "auto"
+
+        with pytest.raises(FastPubSubCLIException):
+            get_event_loop("trio")
+
+    def test_get_peak_memory_usage(self):
+        assert get_peak_memory_usage() > 0
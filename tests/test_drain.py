@@ -0,0 +1,112 @@
+import asyncio
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.cloud.pubsub_v1.types import PubsubMessage, ReceivedMessage
+
+from fastpubsub.concurrency.drain import DrainResult, SubscriptionDrainer
+from fastpubsub.datastructures import HandlerTimeoutPolicy
+from fastpubsub.exceptions import Drop, Retry
+
+DRAIN_MODULE_PATH = "fastpubsub.concurrency.drain"
+
+
+def build_received_messages(count: int, start: int = 0) -> list[ReceivedMessage]:
+    return [
+        ReceivedMessage(
+            ack_id=f"ack-{index}",
+            message=PubsubMessage(data=b"data", message_id=str(index)),
+        )
+        for index in range(start, start + count)
+    ]
+
+
+class TestSubscriptionDrainer:
+    @pytest.fixture()
+    def client(self) -> Generator[MagicMock]:
+        with patch(f"{DRAIN_MODULE_PATH}.PubSubClient") as client_class:
+            client = client_class.return_value
+            client.pull = AsyncMock(return_value=[])
+            client.acknowledge = AsyncMock()
+            client.modify_ack_deadline = AsyncMock()
+            yield client
+
+    @pytest.fixture()
+    def subscriber(self) -> MagicMock:
+        subscriber = MagicMock()
+        subscriber.name = "sub_name"
+        subscriber.subscription_names = ["sub"]
+        subscriber.timeout_policy = None
+        subscriber._build_callstack.return_value.on_message = AsyncMock()
+        return subscriber
+
+    @pytest.mark.asyncio
+    async def test_drains_until_empty(self, client: MagicMock, subscriber: MagicMock):
+        client.pull.side_effect = [
+            build_received_messages(2),
+            build_received_messages(1, start=2),
+            [],
+            [],
+        ]
+
+        drainer = SubscriptionDrainer(subscriber, batch_size=2, concurrency=1)
+        result = await drainer.run()
+
+        assert result == DrainResult(subscriber="sub_name", received=3, acknowledged=3, nacked=0)
+        assert client.pull.await_count == 4
+        client.acknowledge.assert_any_await("sub", ["ack-0", "ack-1"])
+        client.acknowledge.assert_any_await("sub", ["ack-2"])
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_messages(self, client: MagicMock, subscriber: MagicMock):
+        client.pull.side_effect = lambda _, batch_size: build_received_messages(batch_size)
+
+        drainer = SubscriptionDrainer(subscriber, max_messages=5, batch_size=2, concurrency=3)
+        result = await drainer.run()
+
+        assert result.received == 5
+        assert sorted(call.args[1] for call in client.pull.await_args_list) == [1, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_nacks_the_failed_messages(self, client: MagicMock, subscriber: MagicMock):
+        client.pull.side_effect = [build_received_messages(4), [], []]
+        subscriber._build_callstack.return_value.on_message.side_effect = [
+            None,
+            Drop(),
+            Retry(),
+            ValueError(),
+        ]
+
+        drainer = SubscriptionDrainer(subscriber, concurrency=1)
+        result = await drainer.run()
+
+        assert result == DrainResult(subscriber="sub_name", received=4, acknowledged=2, nacked=2)
+        client.acknowledge.assert_awaited_once_with("sub", ["ack-0", "ack-1"])
+        client.modify_ack_deadline.assert_awaited_once_with("sub", ["ack-2", "ack-3"], 0)
+
+    @pytest.mark.asyncio
+    async def test_handler_timeout(self, client: MagicMock, subscriber: MagicMock):
+        async def slow_handler(_):
+            await asyncio.sleep(1)
+
+        client.pull.side_effect = [build_received_messages(1), [], []]
+        subscriber.timeout_policy = HandlerTimeoutPolicy(timeout=0.01, behavior="drop")
+        subscriber._build_callstack.return_value.on_message.side_effect = slow_handler
+
+        drainer = SubscriptionDrainer(subscriber, concurrency=1)
+        result = await drainer.run()
+
+        assert result.acknowledged == 1
+
+    @pytest.mark.asyncio
+    async def test_drains_each_shard(self, client: MagicMock, subscriber: MagicMock):
+        subscriber.subscription_names = ["sub-0", "sub-1"]
+
+        drainer = SubscriptionDrainer(subscriber, concurrency=2, empty_pulls=3)
+        result = await drainer.run()
+
+        assert result.received == 0
+        pulled = [call.args[0] for call in client.pull.await_args_list]
+        assert pulled.count("sub-0") == pulled.count("sub-1")
+        assert 3 <= pulled.count("sub-0") <= 4
@@ -0,0 +1,78 @@
+import asyncio
+import signal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from fastpubsub.applications import Application
+from fastpubsub.broker import PubSubBroker
+from fastpubsub.health import HealthServer, serve_without_http
+
+
+async def send_request(server: HealthServer, request_line: str) -> tuple[str, bytes]:
+    port = server._server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{request_line}\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+
+    head, body = response.split(b"\r\n\r\n", 1)
+    return head.split(b"\r\n", 1)[0].decode(), body
+
+
+class TestHealthServer:
+    @pytest.fixture
+    def broker(self) -> MagicMock:
+        broker = MagicMock(spec=PubSubBroker)
+        broker.alive.return_value = True
+        broker.ready.return_value = False
+        return broker
+
+    @pytest.mark.parametrize(
+        ["request_line", "expected_status", "expected_body"],
+        [
+            ("GET /consumers/alive HTTP/1.1", "HTTP/1.1 200 OK", b'{"alive": true}'),
+            (
+                "GET /consumers/ready?probe=1 HTTP/1.1",
+                "HTTP/1.1 500 Internal Server Error",
+                b'{"ready": false}',
+            ),
+            ("GET /other HTTP/1.1", "HTTP/1.1 404 Not Found", b"{}"),
+            ("POST /consumers/alive HTTP/1.1", "HTTP/1.1 405 Method Not Allowed", b"{}"),
+            ("garbage", "HTTP/1.1 400 Bad Request", b"{}"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_probes(
+        self,
+        broker: MagicMock,
+        request_line: str,
+        expected_status: str,
+        expected_body: bytes,
+    ):
+        server = HealthServer(probe=broker, host="127.0.0.1", port=0)
+        await server.start()
+        try:
+            status, body = await send_request(server, request_line)
+        finally:
+            await server.stop()
+
+        assert status == expected_status
+        assert body == expected_body
+
+
+class TestServeWithoutHttp:
+    @pytest.mark.asyncio
+    async def test_runs_lifecycle_until_signal(self):
+        application = Application(broker=MagicMock(spec=PubSubBroker))
+        application._start = AsyncMock()
+        application._shutdown = AsyncMock()
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, signal.raise_signal, signal.SIGTERM)
+        await asyncio.wait_for(serve_without_http(application, "127.0.0.1", 0), timeout=5)
+
+        application._start.assert_awaited_once()
+        application._shutdown.assert_awaited_once()
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_BUDGET_US = 50_000
+
+
+def import_times(statement: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestImportTime:
+    def test_import_fastpubsub_within_budget(self):
+        times = import_times("import fastpubsub")
+
+        assert times["fastpubsub"] < IMPORT_TIME_BUDGET_US
+
+    @pytest.mark.parametrize(
+        ["statement", "heavy_modules"],
+        [
+            ("import fastpubsub", ["fastapi", "google.cloud.pubsub", "newrelic"]),
+            ("from fastpubsub import PubSubBroker", ["fastapi", "starlette", "uvicorn"]),
+            ("from fastpubsub import Publisher, Subscriber", ["fastapi", "uvicorn"]),
+            ("import fastpubsub.cli.main", ["fastapi", "google.cloud.pubsub", "uvicorn"]),
+        ],
+    )
+    def test_heavy_modules_are_imported_lazily(self, statement: str, heavy_modules: list[str]):
+        times = import_times(statement)
+
+        for module in heavy_modules:
+            assert module not in times
+
+    def test_lazy_attributes(self):
+        import fastpubsub
+        from fastpubsub.applications import FastPubSub
+
+        assert fastpubsub.FastPubSub is FastPubSub
+        assert "PubSubBroker" in dir(fastpubsub)
+        with pytest.raises(AttributeError):
+            fastpubsub.Missing  # noqa: B018
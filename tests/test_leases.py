@@ -0,0 +1,56 @@
+import pytest
+
+from fastpubsub.concurrency.leases import (
+    MAX_ACK_DEADLINE,
+    MIN_ACK_DEADLINE,
+    LatencyHistogram,
+    get_lease_extension_bounds,
+)
+
+
+class TestLatencyHistogram:
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for seconds in [0.01] * 98 + [4.2, 30.0]:
+            histogram.record(seconds)
+
+        assert len(histogram) == 100
+        assert histogram.percentile(50) == 1
+        assert histogram.percentile(99) == 5
+        assert histogram.percentile(100) == 30
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().percentile(99) == 0
+
+    def test_keeps_only_the_most_recent_samples(self):
+        histogram = LatencyHistogram(max_samples=10)
+        for _ in range(10):
+            histogram.record(120.0)
+        for _ in range(10):
+            histogram.record(1.0)
+
+        assert len(histogram) == 10
+        assert histogram.percentile(100) == 1
+
+    def test_clamps_to_the_max_ack_deadline(self):
+        histogram = LatencyHistogram()
+        histogram.record(3600.0)
+
+        assert histogram.percentile(99) == MAX_ACK_DEADLINE
+
+
+class TestLeaseExtensionBounds:
+    @pytest.mark.parametrize(
+        ["latencies", "bounds"],
+        [
+            ([0.05] * 1000, (MIN_ACK_DEADLINE, MIN_ACK_DEADLINE)),
+            ([40.0] * 990 + [100.0] * 10, (60, 150)),
+            ([900.0] * 1000, (MAX_ACK_DEADLINE, MAX_ACK_DEADLINE)),
+        ],
+    )
+    def test_bounds_follow_the_latency(self, latencies: list[float], bounds: tuple[int, int]):
+        histogram = LatencyHistogram()
+        for seconds in latencies:
+            histogram.record(seconds)
+
+        assert get_lease_extension_bounds(histogram) == bounds
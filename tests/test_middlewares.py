@@ -1,11 +1,26 @@
 # TEST: GZIP (ON/PUBLISH/MESSAGE)
 import gzip
+import time
+from pathlib import Path
 from typing import Any
 
 import pytest
 
 from fastpubsub.datastructures import Message
+from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.middlewares.base import BaseMiddleware
+from fastpubsub.middlewares.claimcheck import (
+    CLAIM_CHECK_SIZE_ATTRIBUTE,
+    ClaimCheckMessage,
+    ClaimCheckMiddleware,
+    FileSystemBlobStore,
+)
+from fastpubsub.middlewares.deduplication import (
+    DeduplicationMiddleware,
+    DeduplicationStore,
+    MemoryDeduplicationStore,
+    SQLiteDeduplicationStore,
+)
 from fastpubsub.middlewares.gzip import GZipMiddleware
 
 
@@ -44,3 +59,162 @@ class TestGZipMiddleware:
         )
         await middleware.on_message(message=message)
         assert mock_middleware.received_message.data == data
+
+
+class TestClaimCheckMiddleware:
+    @pytest.fixture
+    def claim_check_middleware(self, tmp_path: Path) -> type[ClaimCheckMiddleware]:
+        class LocalClaimCheckMiddleware(ClaimCheckMiddleware):
+            blob_store = FileSystemBlobStore(tmp_path)
+            threshold = 10
+
+        return LocalClaimCheckMiddleware
+
+    @pytest.mark.asyncio
+    async def test_small_message_is_not_offloaded(
+        self, claim_check_middleware: type[ClaimCheckMiddleware]
+    ):
+        mock_middleware = MockMiddleware()
+        middleware = claim_check_middleware(next_call=mock_middleware)
+
+        await middleware.on_publish(b"small", "", None)
+        assert mock_middleware.published_message == b"small"
+        assert mock_middleware.published_attributes is None
+
+    @pytest.mark.asyncio
+    async def test_large_message_is_offloaded_and_lazily_fetched(
+        self, claim_check_middleware: type[ClaimCheckMiddleware]
+    ):
+        mock_middleware = MockMiddleware()
+        middleware = claim_check_middleware(next_call=mock_middleware)
+
+        data = b"some_reality_big_message_string_with_data"
+        await middleware.on_publish(data, "", {"key": "value"})
+        attributes = mock_middleware.published_attributes
+        assert mock_middleware.published_message == b""
+        assert attributes["key"] == "value"
+        assert attributes[CLAIM_CHECK_SIZE_ATTRIBUTE] == str(len(data))
+
+        message = Message(id="1", size=0, data=b"", attributes=attributes, delivery_attempt=0)
+        await middleware.on_message(message=message)
+
+        received_message = mock_middleware.received_message
+        assert isinstance(received_message, ClaimCheckMessage)
+        assert received_message.size == len(data)
+        assert received_message.__dict__.get("_payload") is None
+        assert received_message.data == data
+        with received_message.open() as stream:
+            assert stream.read() == data
+
+    @pytest.mark.asyncio
+    async def test_missing_blob_store_raises_exception(self):
+        middleware = ClaimCheckMiddleware(next_call=MockMiddleware())
+        with pytest.raises(FastPubSubException):
+            await middleware.on_publish(b"a" * (ClaimCheckMiddleware.threshold + 1), "", None)
+
+    def test_reference_outside_store_raises_exception(self, tmp_path: Path):
+        blob_store = FileSystemBlobStore(tmp_path)
+        with pytest.raises(FastPubSubException):
+            blob_store.get("../secret")
+
+
+def build_message(id: str, attributes: dict[str, str] | None = None) -> Message:
+    return Message(id=id, size=1, data=b"a", attributes=attributes or {}, delivery_attempt=1)
+
+
+class TestDeduplicationMiddleware:
+    @pytest.fixture
+    def deduplication_middleware(self) -> type[DeduplicationMiddleware]:
+        class LocalDeduplicationMiddleware(DeduplicationMiddleware):
+            store = MemoryDeduplicationStore()
+
+        return LocalDeduplicationMiddleware
+
+    @pytest.mark.asyncio
+    async def test_duplicated_message_is_not_handled(
+        self, deduplication_middleware: type[DeduplicationMiddleware]
+    ):
+        mock_middleware = MockMiddleware()
+
+        await deduplication_middleware(next_call=mock_middleware).on_message(build_message("1"))
+        assert mock_middleware.received_message.id == "1"
+
+        mock_middleware.received_message = None
+        await deduplication_middleware(next_call=mock_middleware).on_message(build_message("1"))
+        assert mock_middleware.received_message is None
+
+        await deduplication_middleware(next_call=mock_middleware).on_message(build_message("2"))
+        assert mock_middleware.received_message.id == "2"
+
+    @pytest.mark.asyncio
+    async def test_failed_message_is_not_marked_as_processed(
+        self, deduplication_middleware: type[DeduplicationMiddleware]
+    ):
+        class FailingMiddleware(MockMiddleware):
+            async def on_message(self, message: Message) -> Any:
+                raise ValueError
+
+        with pytest.raises(ValueError):
+            await deduplication_middleware(next_call=FailingMiddleware()).on_message(
+                build_message("1")
+            )
+
+        assert not deduplication_middleware.store.contains("1")
+
+    @pytest.mark.asyncio
+    async def test_custom_key(self):
+        class OrderDeduplicationMiddleware(DeduplicationMiddleware):
+            store = MemoryDeduplicationStore()
+
+            def get_key(self, message: Message) -> str:
+                return message.attributes["order_id"]
+
+        mock_middleware = MockMiddleware()
+        middleware = OrderDeduplicationMiddleware(next_call=mock_middleware)
+
+        await middleware.on_message(build_message("1", {"order_id": "a"}))
+        mock_middleware.received_message = None
+        await middleware.on_message(build_message("2", {"order_id": "a"}))
+
+        assert mock_middleware.received_message is None
+
+    @pytest.mark.asyncio
+    async def test_missing_store_raises_exception(self):
+        middleware = DeduplicationMiddleware(next_call=MockMiddleware())
+        with pytest.raises(FastPubSubException):
+            await middleware.on_message(build_message("1"))
+
+
+class TestDeduplicationStores:
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request: pytest.FixtureRequest, tmp_path: Path) -> DeduplicationStore:
+        if request.param == "memory":
+            return MemoryDeduplicationStore(ttl=0.05)
+        return SQLiteDeduplicationStore(tmp_path / "dedup.db", ttl=0.05)
+
+    def test_keys_expire(self, store: DeduplicationStore):
+        store.add("1")
+        assert store.contains("1")
+        assert not store.contains("2")
+
+        time.sleep(0.1)
+        assert not store.contains("1")
+
+    def test_memory_store_evicts_least_recently_used(self):
+        store = MemoryDeduplicationStore(max_size=2)
+        store.add("1")
+        store.add("2")
+        assert store.contains("1")
+
+        store.add("3")
+
+        assert len(store) == 2
+        assert store.contains("1")
+        assert not store.contains("2")
+
+    def test_sqlite_store_survives_restarts(self, tmp_path: Path):
+        store = SQLiteDeduplicationStore(tmp_path / "dedup.db")
+        store.add("1")
+        store.close()
+
+        assert SQLiteDeduplicationStore(tmp_path / "dedup.db").contains("1")
@@ -0,0 +1,223 @@
+import json
+import os
+import time
+from collections.abc import Generator
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.pubsub import RetryPolicy, Subscription, Topic
+
+from fastpubsub.broker import PubSubBroker
+from fastpubsub.clients.admin import PubSubAdminClient
+from fastpubsub.provisioning import (
+    ProvisioningCache,
+    ProvisioningChange,
+    ProvisioningPlanner,
+    fingerprint_subscription,
+)
+
+PROVISIONING_MODULE_PATH = "fastpubsub.provisioning"
+
+
+class TestFingerprintSubscription:
+    def test_fingerprint_changes_with_managed_fields(self):
+        subscription = Subscription(name="sub", topic="topic", ack_deadline_seconds=60)
+        same_subscription = Subscription(
+            name="sub", topic="topic", ack_deadline_seconds=60, labels={"a": "b"}
+        )
+        other_subscription = Subscription(name="sub", topic="topic", ack_deadline_seconds=30)
+
+        assert fingerprint_subscription(subscription) == fingerprint_subscription(same_subscription)
+        assert fingerprint_subscription(subscription) != fingerprint_subscription(
+            other_subscription
+        )
+
+    def test_fingerprint_normalizes_backoff(self):
+        subscription = Subscription(
+            name="sub",
+            topic="topic",
+            retry_policy=RetryPolicy(
+                minimum_backoff=timedelta(seconds=10), maximum_backoff=timedelta(minutes=10)
+            ),
+        )
+        copy = Subscription.deserialize(Subscription.serialize(subscription))
+
+        assert fingerprint_subscription(subscription) == fingerprint_subscription(copy)
+
+
+class TestProvisioningCache:
+    def test_store_and_save(self, tmp_path: Path):
+        path = tmp_path / "nested" / "cache.json"
+        cache = ProvisioningCache(path=path)
+        cache.store("sub", "abc")
+        cache.save()
+
+        reloaded_cache = ProvisioningCache(path=path)
+        assert reloaded_cache.is_converged("sub", "abc")
+        assert not reloaded_cache.is_converged("sub", "other")
+        assert not reloaded_cache.is_converged("other", "abc")
+
+    def test_expired_entries_are_not_converged(self, tmp_path: Path):
+        path = tmp_path / "cache.json"
+        path.write_text(json.dumps({"sub": {"fingerprint": "abc", "provisioned_at": 0}}))
+
+        cache = ProvisioningCache(path=path, ttl=60)
+        assert not cache.is_converged("sub", "abc")
+
+        cache.store("sub", "abc")
+        assert cache.is_converged("sub", "abc")
+
+    def test_save_merges_entries_from_other_processes(self, tmp_path: Path):
+        path = tmp_path / "cache.json"
+        cache = ProvisioningCache(path=path)
+
+        path.write_text(json.dumps({"other": {"fingerprint": "x", "provisioned_at": time.time()}}))
+        cache.store("sub", "abc")
+        cache.save()
+
+        content = json.loads(path.read_text())
+        assert set(content) == {"other", "sub"}
+
+    def test_corrupted_file_is_ignored(self, tmp_path: Path):
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        cache = ProvisioningCache(path=path)
+        assert not cache.is_converged("sub", "abc")
+
+    def test_from_environment(self, tmp_path: Path):
+        path = str(tmp_path / "cache.json")
+        with patch.dict(
+            os.environ,
+            {"FASTPUBSUB_PROVISIONING_CACHE": path, "FASTPUBSUB_PROVISIONING_CACHE_TTL": "30"},
+        ):
+            cache = ProvisioningCache.from_environment()
+
+        assert cache
+        assert str(cache.path) == path
+        assert cache.ttl == 30
+
+        with patch.dict(os.environ, {"FASTPUBSUB_PROVISIONING_CACHE_TTL": "0"}):
+            assert ProvisioningCache.from_environment() is None
+
+
+class TestProvisioningPlanner:
+    @pytest.fixture
+    def admin_client(self) -> Generator[MagicMock]:
+        with patch(f"{PROVISIONING_MODULE_PATH}.get_admin_client") as get_admin_client:
+            instance = get_admin_client.return_value
+            real_client = PubSubAdminClient(project_id="abc")
+            instance._create_subscription_request = real_client._create_subscription_request
+            instance.get_topic = AsyncMock(return_value=None)
+            instance.get_subscription = AsyncMock(return_value=None)
+            instance.create_topic = AsyncMock()
+            instance.create_subscription = AsyncMock()
+            instance.update_subscription = AsyncMock()
+            yield instance
+
+    @pytest.fixture
+    def application(self, broker: PubSubBroker) -> PubSubBroker:
+        @broker.subscriber(
+            "orders",
+            topic_name="orders",
+            subscription_name="orders-sub",
+            dead_letter_topic="orders-dlt",
+        )
+        async def handle_orders(message):
+            pass
+
+        @broker.subscriber(
+            "payments", topic_name="payments", subscription_name="payments-sub", shards=2
+        )
+        async def handle_payments(message):
+            pass
+
+        broker.publisher("orders")
+        broker.publisher("invoices")
+        return broker
+
+    def _get_resources(self, broker: PubSubBroker):
+        subscribers = broker._filter_subscribers()
+        publishers = list(broker.router._get_publishers().values())
+        return subscribers, publishers
+
+    @pytest.mark.asyncio
+    async def test_plan_empty_project(self, admin_client: MagicMock, application: PubSubBroker):
+        planner = ProvisioningPlanner(project_id="abc")
+        changes = await planner.plan(*self._get_resources(application))
+
+        assert changes == [
+            ProvisioningChange(action="create_topic", name="invoices"),
+            ProvisioningChange(action="create_topic", name="orders"),
+            ProvisioningChange(
+                action="create_topic", name="orders-dlt", create_default_subscription=True
+            ),
+            ProvisioningChange(action="create_topic", name="payments-0"),
+            ProvisioningChange(action="create_topic", name="payments-1"),
+            ProvisioningChange(
+                action="create_subscription", name="orders-sub", topic_name="orders"
+            ),
+            ProvisioningChange(
+                action="create_subscription", name="payments-sub-0", topic_name="payments-0"
+            ),
+            ProvisioningChange(
+                action="create_subscription", name="payments-sub-1", topic_name="payments-1"
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_plan_converged_and_drifted_project(
+        self, admin_client: MagicMock, application: PubSubBroker
+    ):
+        subscribers, publishers = self._get_resources(application)
+        current_subscriptions = {}
+        for subscriber in subscribers:
+            shards = zip(subscriber.topic_names, subscriber.subscription_names, strict=True)
+            for topic_name, subscription_name in shards:
+                current_subscriptions[subscription_name] = (
+                    admin_client._create_subscription_request(
+                        topic_name=topic_name,
+                        subscription_name=subscription_name,
+                        retry_policy=subscriber.retry_policy,
+                        delivery_policy=subscriber.delivery_policy,
+                        dead_letter_policy=subscriber.dead_letter_policy,
+                    )
+                )
+        current_subscriptions["orders-sub"].ack_deadline_seconds = 10
+
+        admin_client.get_topic.side_effect = lambda name: Topic(name=name)
+        admin_client.get_subscription.side_effect = current_subscriptions.get
+
+        planner = ProvisioningPlanner(project_id="abc")
+        changes = await planner.plan(subscribers, publishers)
+
+        assert changes == [
+            ProvisioningChange(action="update_subscription", name="orders-sub", topic_name="orders")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_apply_creates_topics_before_subscriptions(
+        self, admin_client: MagicMock, application: PubSubBroker
+    ):
+        calls = []
+
+        def record(name: str):
+            def _record(**_):
+                calls.append(name)
+
+            return _record
+
+        admin_client.create_topic.side_effect = record("topic")
+        admin_client.create_subscription.side_effect = record("sub")
+        admin_client.update_subscription.side_effect = record("update")
+
+        planner = ProvisioningPlanner(project_id="abc", max_concurrency=2)
+        changes = await planner.plan(*self._get_resources(application))
+        await planner.apply(changes)
+
+        assert calls == ["topic"] * 5 + ["sub"] * 3
+        admin_client.create_topic.assert_any_call(
+            topic_name="orders-dlt", create_default_subscription=True
+        )
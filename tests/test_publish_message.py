@@ -2,9 +2,12 @@ from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from google.api_core.exceptions import NotFound
 from pydantic import ValidationError
 
 from fastpubsub.broker import PubSubBroker
+from fastpubsub.exceptions import FastPubSubException
+from fastpubsub.middlewares.base import BaseMiddleware
 from fastpubsub.pubsub.publisher import Publisher
 from fastpubsub.router import PubSubRouter
 
@@ -64,3 +67,78 @@ class TestPublishMessage:
 
         with pytest.raises(ValidationError):
             await router_a.publish(topic_name="a", **data)
+
+
+class CountingMiddleware(BaseMiddleware):
+    calls = 0
+
+    async def on_publish(
+        self, data: bytes, ordering_key: str, attributes: dict[str, str] | None
+    ) -> Any:
+        CountingMiddleware.calls += 1
+        return await super().on_publish(data, ordering_key, attributes)
+
+
+class TestPublishToManyTopics:
+    MODULE_PATH = "fastpubsub.pubsub.commands"
+
+    @pytest.mark.asyncio
+    async def test_publish_to_returns_message_ids_by_topic(self, broker: PubSubBroker):
+        with (
+            patch(f"{self.MODULE_PATH}.PubSubClient") as mock_client,
+            patch(f"{self.MODULE_PATH}.get_admin_client") as mock_admin_client,
+        ):
+            mock_client.return_value.publish = AsyncMock(side_effect=["1", "2"])
+            with patch.object(
+                Publisher, "_serialize_message", AsyncMock(return_value=b"data")
+            ) as mock_serialize:
+                result = await broker.publish_to(
+                    topics=["topic-a", "topic-b", "topic-a"], data={"a": 1}, autocreate=False
+                )
+
+        assert result == {"topic-a": "1", "topic-b": "2"}
+        mock_serialize.assert_awaited_once()
+        mock_admin_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publish_to_returns_errors_by_topic(self, broker: PubSubBroker):
+        error = NotFound("missing")
+        with patch(f"{self.MODULE_PATH}.PubSubClient") as mock_client:
+            mock_client.return_value.publish = AsyncMock(side_effect=["1", error])
+            result = await broker.publish_to(
+                topics=["topic-a", "topic-b"], data=b"data", autocreate=False
+            )
+
+        assert result == {"topic-a": "1", "topic-b": error}
+
+    @pytest.mark.asyncio
+    async def test_publish_to_runs_identical_middleware_chains_once(
+        self, broker: PubSubBroker, router_a: PubSubRouter
+    ):
+        CountingMiddleware.calls = 0
+        broker.include_middleware(CountingMiddleware)
+        broker.include_router(router_a)
+        router_a.include_middleware(CountingMiddleware)
+
+        with (
+            patch(f"{self.MODULE_PATH}.PubSubClient") as mock_client,
+            patch(f"{self.MODULE_PATH}.get_admin_client") as mock_admin_client,
+        ):
+            mock_admin_client.return_value.create_topic = AsyncMock()
+            mock_client.return_value.publish = AsyncMock(return_value="1")
+            result = await broker.publish_to(topics=["topic-a", "topic-b"], data=b"data")
+            assert CountingMiddleware.calls == 1
+
+            await router_a.publish_to(topics=["topic-a", "topic-b"], data=b"data")
+            assert CountingMiddleware.calls == 2
+
+        assert result == {"topic-a": "1", "topic-b": "1"}
+        assert mock_client.return_value.publish.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_publish_to_without_topics_raises_exception(self, broker: PubSubBroker):
+        with pytest.raises(FastPubSubException):
+            await broker.publish_to(topics=[], data=b"data")
+
+        with pytest.raises(ValidationError):
+            await broker.publish_to(topics="topic", data=b"data")
@@ -154,3 +154,25 @@ class TestPublisherSerialization:
     async def test_serialize_invalid_type_raises_exception(self, publisher: Publisher):
         with pytest.raises(FastPubSubException):
             await publisher._serialize_message(2112)
+
+
+class TestShardedPublisher:
+    def test_partition_key_selects_stable_shard(self, broker: PubSubBroker):
+        publisher = broker.publisher("events", shards=8)
+
+        topic_name = publisher._select_topic_name("customer-1")
+        assert topic_name in [f"events-{shard}" for shard in range(8)]
+        assert all(publisher._select_topic_name("customer-1") == topic_name for _ in range(10))
+
+    def test_no_partition_key_selects_shards_in_round_robin(self, broker: PubSubBroker):
+        publisher = broker.publisher("events", shards=3)
+
+        topic_names = [publisher._select_topic_name("") for _ in range(6)]
+        assert topic_names == ["events-0", "events-1", "events-2"] * 2
+
+    def test_not_sharded_publisher_uses_topic_name(self, publisher: Publisher):
+        assert publisher._select_topic_name("some-key") == publisher.topic_name
+
+    def test_invalid_shards_raises_exception(self, broker: PubSubBroker):
+        with pytest.raises(FastPubSubException):
+            broker.publisher("events", shards=0)
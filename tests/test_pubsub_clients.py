@@ -1,10 +1,18 @@
+import asyncio
 from collections.abc import Generator
 from concurrent.futures import Future
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.api_core.exceptions import DeadlineExceeded
+from google.cloud.pubsub_v1.subscriber._protocol.streaming_pull_manager import (
+    StreamingPullManager,
+)
+from google.cloud.pubsub_v1.subscriber.futures import StreamingPullFuture
+from google.cloud.pubsub_v1.types import FlowControl, PullResponse, ReceivedMessage
 
-from fastpubsub.clients.pubsub import DEFAULT_PUSH_TIMEOUT, PubSubClient
+from fastpubsub.clients.admin import PubSubAdminClient, get_admin_client
+from fastpubsub.clients.pubsub import DEFAULT_PULL_TIMEOUT, DEFAULT_PUSH_TIMEOUT, PubSubClient
 from fastpubsub.datastructures import (
     DeadLetterPolicy,
     LifecyclePolicy,
@@ -16,6 +24,7 @@ from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.pubsub.subscriber import Subscriber
 
 PUBSUB_CLIENT_MODULE_PATH = "fastpubsub.clients.pubsub"
+ADMIN_CLIENT_MODULE_PATH = "fastpubsub.clients.admin"
 
 
 @pytest.fixture
@@ -49,29 +58,6 @@ class TestPubSubClient:
         with patch(f"{PUBSUB_CLIENT_MODULE_PATH}.PublisherClient") as pub_client:
             yield pub_client
 
-    @pytest.fixture
-    def sub_client(self) -> Generator[MagicMock]:
-        with patch(f"{PUBSUB_CLIENT_MODULE_PATH}.SubscriberClient") as sub_client:
-            sub_client.subscription_path.return_value = "some_sub_path"
-            sub_client.topic_path.return_value = "some_topic_path"
-            yield sub_client
-
-    @pytest.mark.asyncio
-    async def test_create_topic(self, pub_client: MagicMock, sub_client: MagicMock):
-        client = PubSubClient(project_id="test-project")
-        await client.create_topic("test-topic")
-
-        pub_client.return_value.create_topic.assert_called_once()
-        sub_client.return_value.create_subscription.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_create_topic_no_default_sub(self, pub_client: MagicMock, sub_client: MagicMock):
-        client = PubSubClient(project_id="test-project")
-        await client.create_topic("test-topic", False)
-
-        pub_client.return_value.create_topic.assert_called_once()
-        sub_client.return_value.create_subscription.assert_not_called()
-
     @pytest.mark.asyncio
     async def test_publish(self, pub_client: MagicMock):
         project_id = "some_proj"
@@ -100,9 +86,137 @@ class TestPubSubClient:
                 "test-topic", data=b"test-data", ordering_key=None, attributes=None
             )
 
+    def test_update_lease_extension(self):
+        manager = StreamingPullManager(MagicMock(), "subscription", flow_control=FlowControl())
+        future = StreamingPullFuture(manager)
+
+        client = PubSubClient(project_id="test-project")
+        assert client.update_lease_extension(future, 10, 30)
+
+        assert manager.flow_control.min_duration_per_lease_extension == 10
+        assert manager.flow_control.max_duration_per_lease_extension == 30
+        assert manager.flow_control.max_messages == FlowControl().max_messages
+        assert not client.update_lease_extension(MagicMock(spec=StreamingPullFuture), 10, 30)
+
+    @pytest.mark.asyncio
+    async def test_pull(self):
+        client = PubSubClient(project_id="test-project")
+        received_message = ReceivedMessage(ack_id="ack-1")
+        client.subscriber_client = MagicMock()
+        client.subscriber_client.pull.return_value = PullResponse(
+            received_messages=[received_message]
+        )
+
+        assert await client.pull("test-subscription", 10) == [received_message]
+        client.subscriber_client.pull.assert_called_once_with(
+            subscription="projects/test-project/subscriptions/test-subscription",
+            max_messages=10,
+            timeout=DEFAULT_PULL_TIMEOUT,
+        )
+
+    @pytest.mark.asyncio
+    async def test_pull_deadline_exceeded_is_empty(self):
+        client = PubSubClient(project_id="test-project")
+        client.subscriber_client = MagicMock()
+        client.subscriber_client.pull.side_effect = DeadlineExceeded("empty")
+
+        assert await client.pull("test-subscription", 10) == []
+
     @pytest.mark.asyncio
-    async def test_create_subscription(self, subscriber: Subscriber, sub_client: MagicMock):
+    async def test_acknowledge_and_nack(self):
         client = PubSubClient(project_id="test-project")
+        client.subscriber_client = MagicMock()
+        subscription_path = "projects/test-project/subscriptions/test-subscription"
+
+        await client.acknowledge("test-subscription", ["ack-1"])
+        await client.modify_ack_deadline("test-subscription", ["ack-2"], 0)
+        await client.acknowledge("test-subscription", [])
+
+        client.subscriber_client.acknowledge.assert_called_once_with(
+            subscription=subscription_path, ack_ids=["ack-1"], timeout=DEFAULT_PUSH_TIMEOUT
+        )
+        client.subscriber_client.modify_ack_deadline.assert_called_once_with(
+            subscription=subscription_path,
+            ack_ids=["ack-2"],
+            ack_deadline_seconds=0,
+            timeout=DEFAULT_PUSH_TIMEOUT,
+        )
+
+
+class TestPubSubAdminClient:
+    @pytest.fixture
+    def pub_client(self) -> Generator[MagicMock]:
+        with patch(f"{ADMIN_CLIENT_MODULE_PATH}.PublisherAsyncClient") as pub_client:
+            pub_client.topic_path.return_value = "some_topic_path"
+            pub_client.return_value.create_topic = AsyncMock()
+            yield pub_client
+
+    @pytest.fixture
+    def sub_client(self) -> Generator[MagicMock]:
+        with patch(f"{ADMIN_CLIENT_MODULE_PATH}.SubscriberAsyncClient") as sub_client:
+            sub_client.subscription_path.return_value = "some_sub_path"
+            sub_client.topic_path.return_value = "some_topic_path"
+            sub_client.return_value.create_subscription = AsyncMock()
+            sub_client.return_value.update_subscription = AsyncMock()
+            yield sub_client
+
+    @pytest.fixture
+    def client(self) -> PubSubAdminClient:
+        client = PubSubAdminClient(project_id="test-project")
+        client.is_emulator = False
+        return client
+
+    @pytest.mark.asyncio
+    async def test_create_topic(
+        self, pub_client: MagicMock, sub_client: MagicMock, client: PubSubAdminClient
+    ):
+        await client.create_topic("test-topic")
+
+        pub_client.return_value.create_topic.assert_awaited_once()
+        sub_client.return_value.create_subscription.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_create_topic_no_default_sub(
+        self, pub_client: MagicMock, sub_client: MagicMock, client: PubSubAdminClient
+    ):
+        await client.create_topic("test-topic", False)
+
+        pub_client.return_value.create_topic.assert_awaited_once()
+        sub_client.return_value.create_subscription.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_topic_already_exists(
+        self, pub_client: MagicMock, sub_client: MagicMock, client: PubSubAdminClient
+    ):
+        from google.api_core.exceptions import AlreadyExists
+
+        pub_client.return_value.create_topic.side_effect = AlreadyExists("test")
+        await client.create_topic("test-topic")
+
+        sub_client.return_value.create_subscription.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reuses_the_clients_on_the_same_loop(
+        self, pub_client: MagicMock, client: PubSubAdminClient
+    ):
+        await client.create_topic("test-topic", False)
+        await client.create_topic("other-topic", False)
+
+        pub_client.assert_called_once()
+        assert get_admin_client("test-project") is get_admin_client("test-project")
+
+    def test_creates_the_clients_for_each_loop(
+        self, pub_client: MagicMock, client: PubSubAdminClient
+    ):
+        asyncio.run(client.create_topic("test-topic", False))
+        asyncio.run(client.create_topic("other-topic", False))
+
+        assert pub_client.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_subscription(
+        self, subscriber: Subscriber, sub_client: MagicMock, client: PubSubAdminClient
+    ):
         await client.create_subscription(
             topic_name=subscriber.topic_name,
             subscription_name=subscriber.subscription_name,
@@ -110,28 +224,27 @@ class TestPubSubClient:
             delivery_policy=subscriber.delivery_policy,
             dead_letter_policy=subscriber.dead_letter_policy,
         )
-        sub_client.return_value.create_subscription.assert_called_once()
+        sub_client.return_value.create_subscription.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_update_subscription(self, subscriber: Subscriber, sub_client: MagicMock):
-        client = PubSubClient(project_id="test-project")
-        client.is_emulator = False
+    async def test_update_subscription(
+        self, subscriber: Subscriber, sub_client: MagicMock, client: PubSubAdminClient
+    ):
         await client.update_subscription(
             topic_name=subscriber.topic_name,
             subscription_name=subscriber.subscription_name,
             retry_policy=subscriber.retry_policy,
             delivery_policy=subscriber.delivery_policy,
         )
-        sub_client.return_value.update_subscription.assert_called_once()
+        sub_client.return_value.update_subscription.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_update_subscription_not_found(
-        self, subscriber: Subscriber, sub_client: MagicMock
+        self, subscriber: Subscriber, sub_client: MagicMock, client: PubSubAdminClient
     ):
         from google.api_core.exceptions import NotFound
 
         sub_client.return_value.update_subscription.side_effect = NotFound("test")
-        client = PubSubClient(project_id="test-project")
         with pytest.raises(FastPubSubException):
             await client.update_subscription(
                 topic_name=subscriber.topic_name,
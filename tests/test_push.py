@@ -0,0 +1,123 @@
+import asyncio
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.responses import Response
+
+from fastpubsub.datastructures import HandlerTimeoutPolicy, Message, MessageControlFlowPolicy
+from fastpubsub.exceptions import Drop, Retry
+from fastpubsub.push import PushEndpoint
+
+
+def build_envelope(data: bytes = b"data", **extras: object) -> dict[str, object]:
+    envelope: dict[str, object] = {
+        "subscription": "projects/test-project/subscriptions/sub",
+        "message": {
+            "messageId": "123",
+            "data": base64.b64encode(data).decode(),
+            "publishTime": "2026-01-01T00:00:00Z",
+            "attributes": {"key": "value"},
+        },
+    }
+    envelope.update(extras)
+    return envelope
+
+
+class TestPushEndpoint:
+    @pytest.fixture()
+    def subscriber(self) -> MagicMock:
+        subscriber = MagicMock()
+        subscriber.name = "sub_name"
+        subscriber.timeout_policy = None
+        subscriber.control_flow_policy = MessageControlFlowPolicy(max_messages=1)
+        subscriber._build_callstack.return_value.on_message = AsyncMock()
+        return subscriber
+
+    async def post(self, endpoint: PushEndpoint, body: bytes | dict[str, object]) -> Response:
+        if isinstance(body, dict):
+            body = json.dumps(body).encode()
+
+        request = MagicMock()
+        request.body = AsyncMock(return_value=body)
+        return await endpoint.handle(request)
+
+    @pytest.mark.asyncio
+    async def test_handles_the_message(self, subscriber: MagicMock):
+        endpoint = PushEndpoint(subscriber)
+
+        response = await self.post(endpoint, build_envelope(b"\x00raw", deliveryAttempt=3))
+
+        assert response.status_code == 200
+        on_message = subscriber._build_callstack.return_value.on_message
+        on_message.assert_awaited_once_with(
+            Message(
+                id="123",
+                size=4,
+                data=b"\x00raw",
+                attributes={"key": "value"},
+                delivery_attempt=3,
+            )
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ["side_effect", "status_code"],
+        [(Drop(), 204), (Retry(), 503), (ValueError(), 500)],
+    )
+    async def test_maps_the_outcome_to_a_status_code(
+        self, subscriber: MagicMock, side_effect: Exception, status_code: int
+    ):
+        subscriber._build_callstack.return_value.on_message.side_effect = side_effect
+
+        response = await self.post(PushEndpoint(subscriber), build_envelope())
+
+        assert response.status_code == status_code
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b"not json",
+            json.dumps({"subscription": "sub"}).encode(),
+            json.dumps(build_envelope() | {"message": {"messageId": "1", "data": "%%"}}).encode(),
+        ],
+    )
+    async def test_rejects_invalid_envelopes(self, subscriber: MagicMock, body: bytes):
+        response = await self.post(PushEndpoint(subscriber), body)
+
+        assert response.status_code == 400
+        subscriber._build_callstack.return_value.on_message.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_handler_timeout(self, subscriber: MagicMock):
+        async def slow_handler(_):
+            await asyncio.sleep(1)
+
+        subscriber.timeout_policy = HandlerTimeoutPolicy(timeout=0.01, behavior="retry")
+        subscriber._build_callstack.return_value.on_message.side_effect = slow_handler
+
+        response = await self.post(PushEndpoint(subscriber), build_envelope())
+
+        assert response.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_sheds_load_above_max_messages(self, subscriber: MagicMock):
+        release = asyncio.Event()
+
+        async def blocked_handler(_):
+            await release.wait()
+
+        subscriber._build_callstack.return_value.on_message.side_effect = blocked_handler
+        endpoint = PushEndpoint(subscriber)
+        first = asyncio.create_task(self.post(endpoint, build_envelope()))
+        await asyncio.sleep(0)
+        rejected = await self.post(endpoint, build_envelope())
+
+        release.set()
+        accepted = await first
+
+        assert rejected.status_code == 429
+        assert accepted.status_code == 200
+        assert endpoint.in_flight == 0
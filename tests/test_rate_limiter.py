@@ -0,0 +1,81 @@
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from fastpubsub.broker import PubSubBroker
+from fastpubsub.concurrency.ratelimit import TokenBucketRateLimiter
+from fastpubsub.exceptions import RateLimitExceeded
+from fastpubsub.pubsub.commands import PublishMessageCommand
+from fastpubsub.router import PubSubRouter
+
+RATE_LIMIT_MODULE_PATH = "fastpubsub.concurrency.ratelimit"
+
+
+class TestTokenBucketRateLimiter:
+    @pytest.fixture
+    def sleep(self) -> Generator[AsyncMock]:
+        with patch(f"{RATE_LIMIT_MODULE_PATH}.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            yield sleep
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_burst_does_not_wait(self, sleep: AsyncMock):
+        rate_limiter = TokenBucketRateLimiter(name="topic", max_rate=1, burst=3)
+        for _ in range(3):
+            await rate_limiter.acquire()
+
+        sleep.assert_not_called()
+        assert rate_limiter.throttled == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_above_burst_waits(self, sleep: AsyncMock):
+        rate_limiter = TokenBucketRateLimiter(name="topic", max_rate=2, burst=1)
+        await rate_limiter.acquire()
+        await rate_limiter.acquire()
+
+        sleep.assert_called_once()
+        assert 0 < sleep.call_args[0][0] <= 0.5
+        assert rate_limiter.throttled == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_above_burst_raises(self, sleep: AsyncMock):
+        rate_limiter = TokenBucketRateLimiter(name="topic", max_rate=1, on_limit="raise")
+        await rate_limiter.acquire()
+        with pytest.raises(RateLimitExceeded):
+            await rate_limiter.acquire()
+
+        sleep.assert_not_called()
+        assert rate_limiter.throttled == 1
+
+    def test_invalid_rate_raises_exception(self):
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(name="topic", max_rate=0)
+
+
+class TestPublisherRateLimit:
+    def test_topic_rate_limit(self, broker: PubSubBroker):
+        publisher = broker.publisher("topic", max_rate=10, burst=5, on_rate_limit="raise")
+        assert publisher.rate_limiter.max_rate == 10
+        assert publisher.rate_limiter.burst == 5
+        assert publisher.rate_limiter.on_limit == "raise"
+
+        assert broker.publisher("topic") is publisher
+        assert publisher.rate_limiter is not None
+
+        callstack = publisher._build_callstack()
+        assert isinstance(callstack, PublishMessageCommand)
+        assert callstack.rate_limiters == [publisher.rate_limiter]
+
+    def test_broker_rate_limit_is_shared(self, router_a: PubSubRouter):
+        publisher_a = router_a.publisher("topic")
+        broker = PubSubBroker(project_id="abc", routers=[router_a], max_publish_rate=100)
+        publisher_b = broker.publisher("topic", max_rate=10)
+
+        rate_limiter = broker.router.broker_rate_limiter
+        assert rate_limiter is not None
+        assert publisher_a.broker_rate_limiter is rate_limiter
+        assert publisher_b.broker_rate_limiter is rate_limiter
+        assert publisher_b._build_callstack().rate_limiters == [
+            publisher_b.rate_limiter,
+            rate_limiter,
+        ]
@@ -0,0 +1,108 @@
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from google.api_core.exceptions import InvalidArgument, ServiceUnavailable
+
+from fastpubsub.broker import PubSubBroker
+from fastpubsub.concurrency.retry import RetryBudget, call_with_retry, full_jitter_backoff
+from fastpubsub.datastructures import PublishRetryPolicy
+
+RETRY_MODULE_PATH = "fastpubsub.concurrency.retry"
+COMMANDS_MODULE_PATH = "fastpubsub.pubsub.commands"
+
+
+class TestCallWithRetry:
+    @pytest.fixture(autouse=True)
+    def sleep(self) -> Generator[AsyncMock]:
+        with patch(f"{RETRY_MODULE_PATH}.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            yield sleep
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_errors_until_success(self, sleep: AsyncMock):
+        func = AsyncMock(side_effect=[ServiceUnavailable("a"), ServiceUnavailable("b"), "id"])
+        budget = RetryBudget()
+
+        result = await call_with_retry(
+            func, name="topic", policy=PublishRetryPolicy(), budget=budget
+        )
+
+        assert result == "id"
+        assert func.call_count == 3
+        assert sleep.call_count == 2
+        assert budget.tokens == budget.max_tokens - 2 + budget.token_ratio
+
+    @pytest.mark.asyncio
+    async def test_raises_when_attempts_are_exhausted(self):
+        func = AsyncMock(side_effect=ServiceUnavailable("a"))
+        with pytest.raises(ServiceUnavailable):
+            await call_with_retry(
+                func, name="topic", policy=PublishRetryPolicy(max_attempts=3), budget=RetryBudget()
+            )
+
+        assert func.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_raises_when_deadline_is_exceeded(self):
+        func = AsyncMock(side_effect=ServiceUnavailable("a"))
+        policy = PublishRetryPolicy(initial_backoff=10.0, max_backoff=10.0, deadline=0.0)
+        with pytest.raises(ServiceUnavailable):
+            await call_with_retry(func, name="topic", policy=policy, budget=RetryBudget())
+
+        func.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_fatal_errors(self, sleep: AsyncMock):
+        func = AsyncMock(side_effect=InvalidArgument("a"))
+        with pytest.raises(InvalidArgument):
+            await call_with_retry(
+                func, name="topic", policy=PublishRetryPolicy(), budget=RetryBudget()
+            )
+
+        func.assert_called_once()
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_when_budget_is_exhausted(self):
+        budget = RetryBudget(max_tokens=2)
+        func = AsyncMock(side_effect=ServiceUnavailable("a"))
+        with pytest.raises(ServiceUnavailable):
+            await call_with_retry(func, name="topic", policy=PublishRetryPolicy(), budget=budget)
+
+        func.assert_called_once()
+        assert not budget.can_retry()
+
+    @pytest.mark.parametrize("attempt", [0, 1, 5, 20])
+    def test_full_jitter_backoff_is_capped(self, attempt: int):
+        for _ in range(50):
+            backoff = full_jitter_backoff(attempt, 0.1, 1.0)
+            assert 0 <= backoff <= min(1.0, 0.1 * 2**attempt)
+
+
+class TestPublishRetry:
+    @pytest.mark.asyncio
+    async def test_publisher_retries_on_retryable_error(self, broker: PubSubBroker):
+        publisher = broker.publisher("topic", retry_policy=PublishRetryPolicy(initial_backoff=0))
+
+        with (
+            patch(f"{COMMANDS_MODULE_PATH}.PubSubClient") as pubsub_client,
+            patch(f"{COMMANDS_MODULE_PATH}.get_admin_client") as admin_client,
+        ):
+            client = pubsub_client.return_value
+            client.publish = AsyncMock(side_effect=[ServiceUnavailable("a"), "id"])
+            await publisher.publish(b"data", autocreate=False)
+
+        assert client.publish.call_count == 2
+        admin_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publisher_without_policy_does_not_retry(self, broker: PubSubBroker):
+        publisher = broker.publisher("topic")
+
+        with patch(f"{COMMANDS_MODULE_PATH}.PubSubClient") as pubsub_client:
+            client = pubsub_client.return_value
+            client.publish = AsyncMock(side_effect=ServiceUnavailable("a"))
+            with pytest.raises(ServiceUnavailable):
+                await publisher.publish(b"data", autocreate=False)
+
+        client.publish.assert_called_once()
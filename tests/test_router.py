@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from fastpubsub.datastructures import HandlerTimeoutPolicy
 from fastpubsub.exceptions import FastPubSubException
 from fastpubsub.router import PubSubRouter
 
@@ -23,6 +24,59 @@ class TestPubSubRouter:
         subscribers = router._get_subscribers()
         assert "api.test.alias" in subscribers
 
+    def test_subscriber_handler_timeout(self):
+        router = PubSubRouter()
+
+        @router.subscriber(
+            alias="sub",
+            topic_name="topic",
+            subscription_name="sub",
+            handler_timeout=2.5,
+            on_handler_timeout="drop",
+        )
+        async def handler():
+            pass
+
+        @router.subscriber(alias="other", topic_name="topic", subscription_name="other")
+        async def other_handler():
+            pass
+
+        subscribers = router._get_subscribers()
+        assert subscribers["sub"].timeout_policy == HandlerTimeoutPolicy(
+            timeout=2.5, behavior="drop"
+        )
+        assert subscribers["other"].timeout_policy is None
+
+    def test_subscriber_invalid_handler_timeout(self):
+        router = PubSubRouter()
+
+        with pytest.raises(FastPubSubException):
+
+            @router.subscriber(
+                alias="sub", topic_name="topic", subscription_name="sub", handler_timeout=0.0
+            )
+            async def handler():
+                pass
+
+    def test_subscriber_push_path(self):
+        router = PubSubRouter()
+
+        @router.subscriber(
+            alias="sub", topic_name="topic", subscription_name="sub", push_path="/push/sub"
+        )
+        async def handler():
+            pass
+
+        assert router._get_subscribers()["sub"].push_path == "/push/sub"
+
+        with pytest.raises(FastPubSubException):
+
+            @router.subscriber(
+                alias="other", topic_name="topic", subscription_name="other", push_path="push"
+            )
+            async def other_handler():
+                pass
+
     def test_include_wrong_type(self):
         router = PubSubRouter()
         with pytest.raises(FastPubSubException):
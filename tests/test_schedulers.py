@@ -0,0 +1,147 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fastpubsub.clients.scheduler import AsyncScheduler
+from fastpubsub.concurrency.loops import (
+    EventLoopThread,
+    get_event_loop_factory,
+    get_running_event_loop_type,
+    resolve_event_loop,
+    run_with_event_loop,
+)
+from fastpubsub.exceptions import FastPubSubException
+from fastpubsub.types import EventLoopType
+
+EVENT_LOOPS: list[EventLoopType] = ["asyncio", "uvloop"]
+
+
+class TestEventLoops:
+    def test_resolve_auto_event_loop(self):
+        assert resolve_event_loop("auto") == "uvloop"
+
+        with patch("fastpubsub.concurrency.loops.importlib.util.find_spec", return_value=None):
+            assert resolve_event_loop("auto") == "asyncio"
+
+    def test_resolve_missing_uvloop(self):
+        with patch("fastpubsub.concurrency.loops.importlib.util.find_spec", return_value=None):
+            with pytest.raises(FastPubSubException):
+                resolve_event_loop("uvloop")
+
+    @pytest.mark.parametrize("loop", EVENT_LOOPS)
+    def test_run_with_event_loop(self, loop: EventLoopType):
+        async def _get_loop_module() -> str:
+            return type(asyncio.get_running_loop()).__module__
+
+        loop_module = run_with_event_loop(_get_loop_module(), loop=loop)
+
+        assert loop_module.startswith(loop)
+        assert get_event_loop_factory(loop)().__class__.__module__.startswith(loop)
+
+
+class TestEventLoopThread:
+    @pytest.mark.parametrize("loop", EVENT_LOOPS)
+    def test_call_on_the_thread_loop(self, loop: EventLoopType):
+        thread = EventLoopThread(name="test-loop", loop=loop)
+        thread.start()
+
+        loop_type, thread_name = thread.call(
+            lambda: (get_running_event_loop_type(), threading.current_thread().name)
+        )
+        thread.stop()
+
+        assert loop_type == loop
+        assert thread_name == "test-loop"
+        assert not thread.is_alive()
+
+    def test_call_raises_the_function_exception(self):
+        thread = EventLoopThread(name="test-loop", loop="asyncio")
+        thread.start()
+
+        with pytest.raises(ValueError):
+            thread.call(MagicMock(side_effect=ValueError))
+
+        assert thread.is_alive()
+        thread.stop()
+
+    def test_start_failure(self):
+        with patch("fastpubsub.concurrency.loops.importlib.util.find_spec", return_value=None):
+            thread = EventLoopThread(name="test-loop", loop="uvloop")
+
+            with pytest.raises(FastPubSubException):
+                thread.start()
+
+
+class TestAsyncScheduler:
+    @pytest.mark.parametrize("loop", EVENT_LOOPS)
+    def test_schedule_from_another_thread(self, loop: EventLoopType):
+        async def _schedule() -> list[tuple[MagicMock, int]]:
+            scheduler = AsyncScheduler()
+            event = asyncio.Event()
+            calls: list[tuple[MagicMock, int]] = []
+
+            def _callback(message: MagicMock) -> None:
+                calls.append((message, threading.get_ident()))
+                if len(calls) == 10:
+                    event.set()
+
+            messages = [MagicMock() for _ in range(10)]
+            thread = threading.Thread(
+                target=lambda: [scheduler.schedule(_callback, message) for message in messages]
+            )
+            thread.start()
+            await asyncio.wait_for(event.wait(), timeout=5)
+            thread.join()
+
+            assert [message for message, _ in calls] == messages
+            return calls
+
+        calls = run_with_event_loop(_schedule(), loop=loop)
+
+        assert len({thread_id for _, thread_id in calls}) == 1
+
+    @pytest.mark.parametrize("loop", EVENT_LOOPS)
+    def test_shutdown_returns_pending_messages(self, loop: EventLoopType):
+        async def _shutdown() -> None:
+            scheduler = AsyncScheduler()
+            callback = MagicMock()
+            message = MagicMock()
+
+            scheduler.schedule(callback, message)
+            dropped_messages = scheduler.shutdown()
+            await asyncio.sleep(0)
+
+            assert dropped_messages == [message]
+            callback.assert_not_called()
+
+        run_with_event_loop(_shutdown(), loop=loop)
+
+    @pytest.mark.parametrize("loop", EVENT_LOOPS)
+    def test_shutdown_does_not_return_started_callbacks(self, loop: EventLoopType):
+        async def _shutdown() -> None:
+            scheduler = AsyncScheduler()
+            callback = MagicMock()
+            started_message, pending_message = MagicMock(), MagicMock()
+
+            scheduler.schedule(callback, started_message)
+            await asyncio.sleep(0)
+            scheduler.schedule(callback, pending_message)
+            dropped_messages = scheduler.shutdown()
+            await asyncio.sleep(0)
+
+            assert dropped_messages == [pending_message]
+            callback.assert_called_once_with(started_message)
+
+        run_with_event_loop(_shutdown(), loop=loop)
+
+    @pytest.mark.parametrize("loop", EVENT_LOOPS)
+    def test_schedule_after_loop_closed(self, loop: EventLoopType):
+        async def _create() -> AsyncScheduler:
+            return AsyncScheduler()
+
+        scheduler = run_with_event_loop(_create(), loop=loop)
+
+        with pytest.warns(RuntimeWarning):
+            scheduler.schedule(MagicMock(), MagicMock())
@@ -1,11 +1,14 @@
+import asyncio
 from collections.abc import Generator
 from copy import deepcopy
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
 from fastpubsub import Subscriber
 from fastpubsub.builder import PubSubSubscriptionBuilder
+from fastpubsub.clients.admin import PubSubAdminClient
 from fastpubsub.datastructures import (
     DeadLetterPolicy,
     LifecyclePolicy,
@@ -13,6 +16,7 @@ from fastpubsub.datastructures import (
     MessageDeliveryPolicy,
     MessageRetryPolicy,
 )
+from fastpubsub.provisioning import ProvisioningCache, fingerprint_subscription
 
 BUILDER_MODULE_PATH = "fastpubsub.builder"
 
@@ -57,8 +61,11 @@ class TestSubscriptionBuilder:
 
     @pytest.fixture
     def pubsub_client(self) -> Generator[MagicMock]:
-        with patch(f"{BUILDER_MODULE_PATH}.PubSubClient") as pubsub_client:
+        with patch(f"{BUILDER_MODULE_PATH}.get_admin_client") as pubsub_client:
             instance = pubsub_client.return_value
+            admin_client = PubSubAdminClient(project_id="proj_id")
+            instance._create_subscription_request = admin_client._create_subscription_request
+            instance.get_subscription = AsyncMock(return_value=None)
             instance.create_topic = AsyncMock()
             instance.create_subscription = AsyncMock()
             instance.update_subscription = AsyncMock()
@@ -200,3 +207,118 @@ class TestSubscriptionBuilder:
         subscriber_two = deepcopy(subscriber)
         await subscription_builder.build(subscriber=subscriber_two)
         assert pubsub_client.create_topic.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_build_sharded_subscription(
+        self, pubsub_client: MagicMock, subscriber: Subscriber
+    ):
+        subscriber.shards = 2
+        subscription_builder = PubSubSubscriptionBuilder(project_id=subscriber.project_id)
+        await subscription_builder.build(subscriber=subscriber)
+
+        assert pubsub_client.create_topic.call_count == 3
+        pubsub_client.create_subscription.assert_has_calls(
+            [
+                call(
+                    topic_name=f"{subscriber.topic_name}-{shard}",
+                    subscription_name=f"{subscriber.subscription_name}-{shard}",
+                    retry_policy=subscriber.retry_policy,
+                    delivery_policy=subscriber.delivery_policy,
+                    dead_letter_policy=subscriber.dead_letter_policy,
+                )
+                for shard in range(2)
+            ]
+        )
+        assert pubsub_client.update_subscription.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_build_all_provisions_concurrently(
+        self, pubsub_client: MagicMock, subscriber: Subscriber
+    ):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_call(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        pubsub_client.create_topic.side_effect = slow_call
+        pubsub_client.create_subscription.side_effect = slow_call
+
+        subscribers = []
+        for index in range(5):
+            new_subscriber = deepcopy(subscriber)
+            new_subscriber.subscription_name = f"sub-{index}"
+            subscribers.append(new_subscriber)
+
+        subscription_builder = PubSubSubscriptionBuilder(project_id=subscriber.project_id)
+        await subscription_builder.build_all(subscribers, max_concurrency=3)
+
+        assert pubsub_client.create_topic.call_count == 2
+        assert pubsub_client.create_subscription.call_count == 5
+        assert pubsub_client.update_subscription.call_count == 5
+        assert 1 < max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_build_skips_cached_subscription(
+        self, pubsub_client: MagicMock, subscriber: Subscriber, tmp_path: Path
+    ):
+        cache = ProvisioningCache(path=tmp_path / "cache.json")
+        subscription_builder = PubSubSubscriptionBuilder(project_id="proj_id", cache=cache)
+        await subscription_builder.build_all([subscriber])
+
+        assert pubsub_client.create_subscription.call_count == 1
+        assert (tmp_path / "cache.json").exists()
+
+        cache = ProvisioningCache(path=tmp_path / "cache.json")
+        subscription_builder = PubSubSubscriptionBuilder(project_id="proj_id", cache=cache)
+        await subscription_builder.build_all([subscriber])
+
+        assert pubsub_client.create_subscription.call_count == 1
+        assert pubsub_client.update_subscription.call_count == 1
+        assert pubsub_client.get_subscription.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_build_skips_subscription_matching_fetched_state(
+        self, pubsub_client: MagicMock, subscriber: Subscriber
+    ):
+        pubsub_client.get_subscription.return_value = pubsub_client._create_subscription_request(
+            topic_name=subscriber.topic_name,
+            subscription_name=subscriber.subscription_name,
+            retry_policy=subscriber.retry_policy,
+            delivery_policy=subscriber.delivery_policy,
+            dead_letter_policy=subscriber.dead_letter_policy,
+        )
+
+        subscription_builder = PubSubSubscriptionBuilder(project_id="proj_id")
+        await subscription_builder.build(subscriber=subscriber)
+
+        pubsub_client.create_topic.assert_not_called()
+        pubsub_client.create_subscription.assert_not_called()
+        pubsub_client.update_subscription.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_build_with_force_ignores_the_state(
+        self, pubsub_client: MagicMock, subscriber: Subscriber, tmp_path: Path
+    ):
+        desired_subscription = pubsub_client._create_subscription_request(
+            topic_name=subscriber.topic_name,
+            subscription_name=subscriber.subscription_name,
+            retry_policy=subscriber.retry_policy,
+            delivery_policy=subscriber.delivery_policy,
+            dead_letter_policy=subscriber.dead_letter_policy,
+        )
+        cache = ProvisioningCache(path=tmp_path / "cache.json")
+        cache.store(desired_subscription.name, fingerprint_subscription(desired_subscription))
+
+        subscription_builder = PubSubSubscriptionBuilder(
+            project_id="proj_id", cache=cache, force=True
+        )
+        await subscription_builder.build(subscriber=subscriber)
+
+        pubsub_client.get_subscription.assert_not_called()
+        pubsub_client.create_subscription.assert_called_once()
+        pubsub_client.update_subscription.assert_called_once()
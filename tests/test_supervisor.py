@@ -0,0 +1,109 @@
+import asyncio
+import signal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from fastpubsub.applications import Application
+from fastpubsub.broker import PubSubBroker
+from fastpubsub.supervisor import (
+    ConsumerSupervisor,
+    _serve_consumer_process,
+    assign_subscribers,
+)
+
+SUPERVISOR_MODULE_PATH = "fastpubsub.supervisor"
+
+
+class TestAssignSubscribers:
+    def test_round_robin_with_equal_weights(self):
+        assignments = assign_subscribers(["a", "b", "c", "d", "e"], 2)
+        assert assignments == [["a", "c", "e"], ["b", "d"]]
+
+    def test_weighted_assignment(self):
+        assignments = assign_subscribers(["a", "b", "c", "d"], 2, {"a": 3, "b": 1, "c": 1})
+        assert assignments == [["a"], ["b", "c", "d"]]
+
+    def test_never_more_processes_than_subscribers(self):
+        assert assign_subscribers(["a", "b"], 8) == [["a"], ["b"]]
+
+
+class TestConsumerSupervisor:
+    @pytest.fixture
+    def supervisor(self) -> ConsumerSupervisor:
+        supervisor = ConsumerSupervisor(
+            app="module:app", assignments=[["a"], ["b"]], host="127.0.0.1", port=0, max_restarts=1
+        )
+        for consumer in supervisor._processes:
+            consumer.process = MagicMock()
+            consumer.process.is_alive.return_value = True
+        return supervisor
+
+    def test_aggregated_health(self, supervisor: ConsumerSupervisor):
+        assert not supervisor.alive()
+        assert not supervisor.ready()
+
+        supervisor._status[:] = [1, 1, 1, 0]
+        assert supervisor.alive()
+        assert not supervisor.ready()
+
+        supervisor._status[:] = [1, 1, 1, 1]
+        assert supervisor.ready()
+
+    def test_crashed_process_is_restarted(self, supervisor: ConsumerSupervisor):
+        supervisor._status[:] = [1, 1, 1, 1]
+        crashed = supervisor._processes[1]
+        crashed.process.is_alive.return_value = False
+        crashed.process.exitcode = 1
+
+        with patch.object(supervisor, "_start") as mock_start:
+            supervisor._check_processes()
+            assert crashed.restart_at is not None
+            assert crashed.restarts == 1
+            assert supervisor.alive()
+            assert not supervisor.ready()
+
+            crashed.restart_at = 0
+            supervisor._check_processes()
+            mock_start.assert_called_once_with(crashed)
+
+    def test_process_crashing_too_often_fails_liveness(self, supervisor: ConsumerSupervisor):
+        crashed = supervisor._processes[0]
+        crashed.process.is_alive.return_value = False
+        crashed.restarts = 1
+
+        supervisor._check_processes()
+
+        assert not supervisor.alive()
+
+    def test_stop_processes_kills_stuck_processes(self, supervisor: ConsumerSupervisor):
+        supervisor.shutdown_timeout = 0
+        supervisor._stop_processes()
+
+        for consumer in supervisor._processes:
+            consumer.process.terminate.assert_called_once()
+            consumer.process.kill.assert_called_once()
+
+
+class TestConsumerProcess:
+    @pytest.mark.asyncio
+    async def test_reports_health_until_signal(self):
+        broker = MagicMock(spec=PubSubBroker)
+        broker.alive.return_value = True
+        broker.ready.return_value = True
+        application = Application(broker=broker)
+        application._start = AsyncMock()
+        application._shutdown = AsyncMock()
+
+        status = [0, 0, 0, 0]
+        reported = []
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, lambda: reported.extend(status))
+        loop.call_later(0.1, signal.raise_signal, signal.SIGTERM)
+        await asyncio.wait_for(_serve_consumer_process(application, 1, status), timeout=5)
+
+        assert reported == [0, 0, 1, 1]
+        assert status == [0, 0, 0, 0]
+        application._start.assert_awaited_once()
+        application._shutdown.assert_awaited_once()
@@ -1,9 +1,19 @@
+import asyncio
+import threading
 from collections.abc import Generator
-from unittest.mock import MagicMock, patch
+from concurrent.futures import Future
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.api_core.exceptions import InternalServerError, PermissionDenied, ServiceUnavailable
+from google.cloud.pubsub_v1.subscriber.exceptions import AcknowledgeError, AcknowledgeStatus
 
+from fastpubsub.concurrency.loops import run_with_event_loop
 from fastpubsub.concurrency.manager import AsyncTaskManager
+from fastpubsub.concurrency.tasks import LEASE_TUNING_MIN_SAMPLES, PubSubStreamingPullTask
+from fastpubsub.datastructures import HandlerTimeoutPolicy
+from fastpubsub.types import EventLoopType, HandlerTimeoutBehavior
 
 PUBSUB_POLL_TASK_MODULE_PATH = "fastpubsub.concurrency.tasks"
 ASYNC_TASK_MANAGER_MODULE_PATH = "fastpubsub.concurrency.manager"
@@ -13,6 +23,7 @@ class TestAsyncTaskManager:
     @pytest.fixture()
     def task(self) -> Generator[MagicMock]:
         with patch(f"{ASYNC_TASK_MANAGER_MODULE_PATH}.PubSubStreamingPullTask") as streaming_task:
+            streaming_task.return_value.drain = AsyncMock(return_value=(0, 0))
             yield streaming_task
 
     def test_create_task(self, task: MagicMock):
@@ -68,14 +79,351 @@ class TestAsyncTaskManager:
         task.assert_called_once()
         task.return_value.start.assert_called_once()
 
-    def test_shutdown(self, task: MagicMock):
-        task_manager = AsyncTaskManager()
+    @pytest.mark.asyncio
+    async def test_shutdown(self, task: MagicMock):
+        task_manager = AsyncTaskManager(drain_timeout=5.0)
         task_manager.create_task(MagicMock())
         task_manager.start()
-        task_manager.shutdown()
+        await task_manager.shutdown()
 
         task.assert_called_once()
         task.return_value.start.assert_called_once()
+        task.return_value.drain.assert_awaited_once_with(5.0)
+        task.return_value.shutdown.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_on_event_loop_threads(self, task: MagicMock):
+        started_on: list[str] = []
+        task.return_value.start.side_effect = lambda: started_on.append(
+            threading.current_thread().name
+        )
+
+        task_manager = AsyncTaskManager(event_loops=2)
+        for _ in range(3):
+            task_manager.create_task(MagicMock())
+        task.assert_not_called()
+
+        task_manager.start()
+        threads = list(task_manager._threads)
+        await task_manager.shutdown()
+
+        assert len(threads) == 2
+        assert started_on == ["fastpubsub-loop-0", "fastpubsub-loop-1", "fastpubsub-loop-0"]
+        assert task.return_value.shutdown.call_count == 3
+        assert not any(thread.is_alive() for thread in threads)
+
+    @pytest.mark.asyncio
+    async def test_health_checks_on_event_loop_threads(self, task: MagicMock):
+        mock_subscriber = MagicMock()
+        mock_subscriber.name = "sub_name"
+        task.return_value.subscriber = mock_subscriber
+        task.return_value.task_alive.return_value = True
+        task.return_value.task_ready.return_value = True
+
+        task_manager = AsyncTaskManager(event_loops=4)
+        task_manager.create_task(mock_subscriber)
+        task_manager.start()
+
+        assert len(task_manager._threads) == 1
+        assert task_manager.alive() == {"sub_name": True}
+        assert task_manager.ready() == {"sub_name": True}
+
+        task_manager._threads[0].stop()
+
+        assert task_manager.alive() == {"sub_name": False}
+        assert task_manager.ready() == {"sub_name": False}
+        await task_manager.shutdown()
+        task.return_value.shutdown.assert_called_once()
+
+
+class TestStreamSupervision:
+    @pytest.fixture()
+    def task(self) -> Generator[MagicMock]:
+        with (
+            patch(f"{ASYNC_TASK_MANAGER_MODULE_PATH}.PubSubStreamingPullTask") as streaming_task,
+            patch(f"{ASYNC_TASK_MANAGER_MODULE_PATH}.full_jitter_backoff", return_value=0),
+        ):
+            streaming_task.return_value.subscriber.name = "sub_name"
+            streaming_task.return_value.drain = AsyncMock(return_value=(0, 0))
+            streaming_task.return_value.task_alive.side_effect = lambda: (
+                not any(future.done() for future in streaming_task.return_value.tasks)
+            )
+            yield streaming_task
+
+    async def start_manager(self, task: MagicMock) -> tuple[AsyncTaskManager, Future[Any]]:
+        stream: Future[Any] = Future()
+        task.return_value.loop = asyncio.get_running_loop()
+        task.return_value.tasks = [stream]
+
+        task_manager = AsyncTaskManager()
+        task_manager.create_task(MagicMock())
+        task_manager.start()
+        return task_manager, stream
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error", [ServiceUnavailable("unavailable"), InternalServerError("internal"), None]
+    )
+    async def test_reconnect_on_retryable_error(self, task: MagicMock, error: Exception | None):
+        task_manager, stream = await self.start_manager(task)
+        reopened_stream: Future[Any] = Future()
+
+        def _reopen(index: int) -> Future[Any]:
+            task.return_value.tasks = [reopened_stream]
+            return reopened_stream
+
+        task.return_value.reopen.side_effect = _reopen
+        if error:
+            stream.set_exception(error)
+        else:
+            stream.set_result(None)
+        await asyncio.sleep(0)
+
+        assert task_manager.alive() == {"sub_name": True}
+
+        await asyncio.sleep(0.01)
+
+        task.return_value.reopen.assert_called_once_with(0)
+        assert task_manager.restarts() == {"sub_name": 1}
+        assert task_manager.alive() == {"sub_name": True}
+
+        await task_manager.shutdown()
+        reopened_stream.cancel()
+        await asyncio.sleep(0)
+        task.return_value.reopen.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_escalate_fatal_error(self, task: MagicMock):
+        task_manager, stream = await self.start_manager(task)
+
+        stream.set_exception(PermissionDenied("denied"))
+        await asyncio.sleep(0.01)
+
+        task.return_value.reopen.assert_not_called()
+        assert task_manager.restarts() == {"sub_name": 0}
+        assert task_manager.alive() == {"sub_name": False}
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_the_reconnect(self, task: MagicMock):
+        with patch(f"{ASYNC_TASK_MANAGER_MODULE_PATH}.full_jitter_backoff", return_value=0.01):
+            task_manager, stream = await self.start_manager(task)
+
+            stream.set_exception(ServiceUnavailable("unavailable"))
+            await asyncio.sleep(0)
+            await task_manager.shutdown()
+            await asyncio.sleep(0.02)
+
+        task.return_value.reopen.assert_not_called()
+        task.return_value.shutdown.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_ignore_cancelled_stream(self, task: MagicMock):
+        task_manager, stream = await self.start_manager(task)
+
+        stream.cancel()
+        await asyncio.sleep(0.01)
+
+        task.return_value.reopen.assert_not_called()
+
+
+class TestPubSubStreamingPullTask:
+    @pytest.fixture
+    def pubsub_client(self) -> Generator[MagicMock]:
+        with patch(f"{PUBSUB_POLL_TASK_MODULE_PATH}.PubSubClient") as pubsub_client:
+            yield pubsub_client.return_value
+
+    @pytest.mark.asyncio
+    async def test_sharded_subscriber_shares_flow_control(self, pubsub_client: MagicMock):
+        subscriber = MagicMock()
+        subscriber.subscription_names = ["sub-0", "sub-1", "sub-2"]
+        subscriber.control_flow_policy.max_messages = 90
+
+        task = PubSubStreamingPullTask(subscriber)
+        task.start()
+
+        assert pubsub_client.subscribe.call_count == 3
+        for subscription_name, subscribe_call in zip(
+            subscriber.subscription_names, pubsub_client.subscribe.call_args_list, strict=True
+        ):
+            assert subscribe_call.kwargs["subscription_name"] == subscription_name
+            assert subscribe_call.kwargs["max_messages"] == 30
+
+        pubsub_client.subscribe.return_value.done.return_value = False
+        assert task.task_alive()
+
+        pubsub_client.subscribe.return_value.done.return_value = True
+        assert not task.task_alive()
+
+    @pytest.mark.asyncio
+    async def test_reopen_stream(self, pubsub_client: MagicMock):
+        subscriber = MagicMock()
+        subscriber.subscription_names = ["sub-0", "sub-1"]
+        subscriber.control_flow_policy.max_messages = 10
+
+        task = PubSubStreamingPullTask(subscriber)
+        task.start()
+        first_streams = list(task.tasks)
+
+        pubsub_client.subscribe.return_value = MagicMock()
+        future = task.reopen(1)
+
+        assert task.tasks == [first_streams[0], future]
+        assert pubsub_client.subscribe.call_args.kwargs["subscription_name"] == "sub-1"
+        assert pubsub_client.subscribe.call_args.kwargs["max_messages"] == 5
+
+    @pytest.mark.parametrize("loop", ["asyncio", "uvloop"])
+    def test_acknowledge_response_does_not_block_the_loop(
+        self, pubsub_client: MagicMock, loop: EventLoopType
+    ):
+        async def _acknowledge() -> int:
+            task = PubSubStreamingPullTask(MagicMock())
+            future: Future[Any] = Future()
+            ticks = 0
+
+            async def _tick() -> None:
+                nonlocal ticks
+                while not future.done():
+                    ticks += 1
+                    await asyncio.sleep(0.001)
+
+            ticker = asyncio.create_task(_tick())
+            threading.Timer(0.05, future.set_result, args=("SUCCESS",)).start()
+            await task._wait_acknowledge_response(future=future)
+            await ticker
+            return ticks
+
+        assert run_with_event_loop(_acknowledge(), loop=loop) > 1
+
+    @pytest.mark.asyncio
+    async def test_acknowledge_response_failure(self, pubsub_client: MagicMock):
+        task = PubSubStreamingPullTask(MagicMock())
+        future: Future[Any] = Future()
+        future.set_exception(AcknowledgeError(AcknowledgeStatus.INVALID_ACK_ID, "invalid"))
+
+        with patch.object(task, "_on_acknowledge_failed") as on_acknowledge_failed:
+            await task._wait_acknowledge_response(future=future)
+
+        on_acknowledge_failed.assert_called_once_with(future.exception())
+
+    @pytest.mark.asyncio
+    async def test_drain_messages_in_flight(self, pubsub_client: MagicMock):
+        async def _on_message(message: Any) -> None:
+            await asyncio.sleep(float(message.data))
+
+        subscriber = MagicMock()
+        subscriber.timeout_policy = None
+        subscriber._build_callstack.return_value.on_message = _on_message
+        task = PubSubStreamingPullTask(subscriber)
+
+        acknowledged: Future[Any] = Future()
+        acknowledged.set_result(AcknowledgeStatus.SUCCESS)
+        fast_message, slow_message, late_message = MagicMock(), MagicMock(), MagicMock()
+        for received_message, data in [(fast_message, b"0"), (slow_message, b"10")]:
+            received_message.data = data
+            received_message.attributes = {}
+            received_message.delivery_attempt = 1
+            received_message.ack_with_response.return_value = acknowledged
+            task._on_message(received_message)
+
+        drain = asyncio.create_task(task.drain(timeout=0.1))
+        await asyncio.sleep(0)
+        task._on_message(late_message)
+
+        assert await drain == (1, 2)
+        fast_message.ack_with_response.assert_called_once()
+        fast_message.nack.assert_not_called()
+        slow_message.ack_with_response.assert_not_called()
+        slow_message.nack.assert_called_once()
+        late_message.nack.assert_called_once()
+        assert not task._consumers
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(["behavior", "acknowledged"], [("retry", False), ("drop", True)])
+    async def test_handler_timeout(
+        self, pubsub_client: MagicMock, behavior: HandlerTimeoutBehavior, acknowledged: bool
+    ):
+        cancelled = asyncio.Event()
+
+        async def _on_message(message: Any) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        subscriber = MagicMock()
+        subscriber.timeout_policy = HandlerTimeoutPolicy(timeout=0.01, behavior=behavior)
+        subscriber._build_callstack.return_value.on_message = _on_message
+        task = PubSubStreamingPullTask(subscriber)
+
+        acknowledge_response: Future[Any] = Future()
+        acknowledge_response.set_result(AcknowledgeStatus.SUCCESS)
+        received_message = MagicMock()
+        received_message.attributes = {}
+        received_message.delivery_attempt = 1
+        received_message.ack_with_response.return_value = acknowledge_response
+        received_message.nack_with_response.return_value = acknowledge_response
+
+        await asyncio.wait_for(task._on_message(received_message), timeout=1)
+
+        assert cancelled.is_set()
+        assert task.handler_timeouts == 1
+        assert received_message.ack_with_response.called == acknowledged
+        assert received_message.nack_with_response.called != acknowledged
+
+    @pytest.mark.asyncio
+    async def test_handler_timeout_error_is_not_a_handler_timeout(self, pubsub_client: MagicMock):
+        subscriber = MagicMock()
+        subscriber.timeout_policy = HandlerTimeoutPolicy(timeout=10)
+        subscriber._build_callstack.return_value.on_message = AsyncMock(side_effect=TimeoutError)
+        task = PubSubStreamingPullTask(subscriber)
+
+        with pytest.raises(TimeoutError):
+            await task._handle(subscriber._build_callstack.return_value, MagicMock())
+
+        assert task.handler_timeouts == 0
+
+    @pytest.mark.asyncio
+    async def test_tune_lease_from_handler_latency(self, pubsub_client: MagicMock):
+        subscriber = MagicMock()
+        subscriber.subscription_names = ["sub-0"]
+        subscriber.control_flow_policy.max_messages = 10
+        task = PubSubStreamingPullTask(subscriber)
+        task.start()
+
+        for _ in range(LEASE_TUNING_MIN_SAMPLES - 1):
+            task.latency.record(0.1)
+        assert not task.tune_lease()
+
+        task.latency.record(0.1)
+        assert task.tune_lease()
+        assert not task.tune_lease()
+
+        assert task.lease_extension == (10, 10)
+        pubsub_client.update_lease_extension.assert_called_once_with(task.tasks[0], 10, 10)
+
+        task.reopen(0)
+        assert pubsub_client.subscribe.call_args.kwargs["min_lease_extension"] == 10
+        assert pubsub_client.subscribe.call_args.kwargs["max_lease_extension"] == 10
+        task.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_handler_latency_is_recorded(self, pubsub_client: MagicMock):
+        subscriber = MagicMock()
+        subscriber.timeout_policy = None
+        subscriber._build_callstack.return_value.on_message = AsyncMock(side_effect=ValueError)
+        task = PubSubStreamingPullTask(subscriber)
+
+        with pytest.raises(ValueError):
+            await task._handle(subscriber._build_callstack.return_value, MagicMock())
+
+        assert len(task.latency) == 1
+
+    @pytest.mark.asyncio
+    async def test_drain_without_messages_in_flight(self, pubsub_client: MagicMock):
+        task = PubSubStreamingPullTask(MagicMock())
+
+        assert await task.drain(timeout=0.1) == (0, 0)
 
 
 """